@@ -15,15 +15,15 @@ class Bit:
         return self.__value
     
     def __str__(self):
-        return f"Bit: {self.__value}"
+        return f"Bit: {self.get_value()}"
     
     def toggle(self):
         self.set_value(1 - self.get_value())
     
     def __repr__(self):
-        return f"Bit({self.__value})"
+        return f"Bit({self.get_value()})"
     
     def __eq__(self, other):
         if not isinstance(other, Bit):
             return False
-        return self.__value == other.__value
+        return self.get_value() == other.get_value()
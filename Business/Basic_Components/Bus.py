@@ -1,16 +1,45 @@
 from dataclasses import dataclass, field
-from typing import List, ClassVar, Dict
+from typing import List, ClassVar, Dict, Optional
 from Business.Basic_Components.Bit import Bit
 
+
+class _Line_Bit(Bit):
+    """
+    Vista viva de una linea del bus.
+    No guarda valor propio: lee y escribe directamente sobre el entero
+    empaquetado del Bus al que pertenece, asi el codigo a nivel de
+    compuertas sigue trabajando con objetos Bit.
+    """
+
+    # Constructor
+    def __init__(self, bus: "Bus", index: int):
+        self.__bus = bus
+        self.__shift = bus.width - 1 - index
+
+    # Metodos
+    def set_value(self, value):
+        # Verificacion para que el valor del bit sea 1 o 0
+        if value not in [0, 1]:
+            raise ValueError("El valor de un Bit debe ser 0 o 1.")
+        self.__bus._set_line_value(self.__shift, value)
+
+    def get_value(self):
+        # Lectura directa del entero empaquetado (camino caliente de las compuertas)
+        return (self.__bus._Bus__value >> self.__shift) & 1
+
+
 @dataclass
 class Bus:
 
-    # Atributos 
+    # Atributos
     width: int = 16
     initial_value: int = 0
 
     # Atributos post __init__
-    __lines: List[Bit] = field(init = False, repr = False)
+    # El valor completo del bus se guarda como un unico entero enmascarado
+    __value: int = field(init = False, repr = False)
+    __mask: int = field(init = False, repr = False, compare = False)
+    __lines: Optional[List[_Line_Bit]] = field(init = False, repr = False, compare = False)
 
     # Constantes de clase
     DEFAULT_WIDTH: ClassVar[int] = 16
@@ -27,10 +56,12 @@ class Bus:
         # Valor del bus
         if self.initial_value < 0 or self.initial_value >= (1 << self.width):
             raise ValueError(f"Valor inicial {self.initial_value} fuera del rando del bus")
-        
-        # Inicializacion de las lineas del bus
-        self.__lines = [Bit(0) for _ in range(self.width)]
-        self.set_Binary_value(self.initial_value)
+
+        # Inicializacion del valor empaquetado
+        # Las vistas Bit de cada linea se crean solo cuando alguien las pide
+        self.__mask = (1 << self.width) - 1
+        self.__value = self.initial_value
+        self.__lines = None
 
     # Establece el valor del bus en binario
     def set_Binary_value(self, value: int):
@@ -38,58 +69,69 @@ class Bus:
         if value < 0 or value > (1 << self.width):
             raise ValueError(f"Valor {value} fuera del rango del bus {0, (1 << self.width)}")
 
-        for i in range(self.width):
-            bit_val = (value >> (self.width - 1 - i)) & 1
-            self.__lines[i].set_value(bit_val)
+        self.__value = value & self.__mask
 
     # Devuelve el valor del bus en decimal
     def get_Decimal_value(self) -> int:
-
-        value = 0
-        
-        for i in range(self.width):
-            value = (value << 1) | self.__lines[i].get_value()
-        
-        return value
+        return self.__value
 
     # Devuelve el valor del bus en binario
     def get_Binary_value(self) -> str:
-        return ''.join(str(bit.get_value()) for bit in self.__lines)
-    
+        return format(self.__value, f"0{self.width}b")
+
     # Devuelve el valor del bus en hexadecimal
     def get_Hexadecimal_value(self) -> str:
         hex_digits = (self.width + 3) // 4
-        return f"0x{self.get_Decimal_value():0{hex_digits}X}"
-    
+        return f"0x{self.__value:0{hex_digits}X}"
+
     # Devuelve un diccionario con todos los valores y sus indices
     def get_Lines_values(self) -> Dict[int, int]:
-        return {i: self.__lines[i].get_value() for i in range(self.width)}
-    
+        return {i: self._get_line_value(self.width - 1 - i) for i in range(self.width)}
+
     # Devuelve un diccionario con todos los valores y sus indicies ordenados
     def get_Ordered_lines_values(self, msb_first: bool = True) -> Dict[int, int]:
         if msb_first:
-            return {i: self.__lines[i].get_value() for i in range(self.width)}
+            return {i: self._get_line_value(self.width - 1 - i) for i in range(self.width)}
         else:
-            return {i: self.__lines[i].get_value() for i in range(self.width - 1, -1, -1)}
-        
-    # Devuelve el valor de una linea
+            return {i: self._get_line_value(self.width - 1 - i) for i in range(self.width - 1, -1, -1)}
+
+    # Devuelve el valor de una linea (vista viva enlazada a su posicion)
     def get_Line_bit(self, index: int) -> Bit:
         if index < 0 or index >= self.width:
             raise ValueError(f"El indice debe estar dentro del rango [0, {self.width - 1}]")
-        
+
+        if self.__lines is None:
+            self.__lines = [_Line_Bit(self, i) for i in range(self.width)]
+
         return self.__lines[index]
-    
+
+    # Copia el valor de un Bit en una linea del bus
+    # El Bus guarda un entero, no el objeto Bit: cambios posteriores del Bit
+    # no se ven en el bus. Para una linea enlazada se usa get_Line_bit (vista viva)
     def set_Line_bit(self, index: int, value: Bit):
         if index < 0 or index >= self.width:
             raise ValueError(f"El indice debe estar dentro del rango [0, {self.width - 1}]")
-        
+
         if not isinstance(value, Bit):
             raise TypeError(f"El valor debe ser una instancia de la clase Bit, no {type(value).__name__}")
-        
-        self.__lines[index] = value
-    
+
+        if value.get_value():
+            self.__value |= (1 << (self.width - 1 - index))
+        else:
+            self.__value &= ~(1 << (self.width - 1 - index))
+
+    # Acceso interno por desplazamiento (indice 0 = MSB = desplazamiento width-1)
+    def _get_line_value(self, shift: int) -> int:
+        return (self.__value >> shift) & 1
+
+    def _set_line_value(self, shift: int, value: int):
+        if value:
+            self.__value |= (1 << shift)
+        else:
+            self.__value &= ~(1 << shift)
+
     def __str__(self):
         return f"Bus{self.width}({self.get_Hexadecimal_value()})"
-    
+
     def __len__(self):
-        return self.width
\ No newline at end of file
+        return self.width
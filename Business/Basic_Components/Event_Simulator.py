@@ -0,0 +1,184 @@
+from typing import Dict, List, Tuple
+from Business.Basic_Components.Netlist_Compiler import Netlist_Graph
+
+
+class Event_Simulator:
+    """
+    Simulador dirigido por eventos sobre una netlist trazada.
+
+    Cada compuerta registra su fan-out (las compuertas que leen su salida) y
+    un nivel topologico. Al cambiar un bit de entrada solo se agendan las
+    compuertas que dependen de el; una compuerta cuya salida no cambia no
+    propaga nada, asi la evaluacion se detiene en cuanto las salidas dejan
+    de cambiar. Las compuertas se procesan por niveles, de modo que cada una
+    se evalua como mucho una vez por actualizacion.
+
+    El estado (valor de cada cable) persiste entre llamadas: operandos
+    parecidos a los anteriores cuestan solo las compuertas afectadas.
+    """
+
+    AND, OR, XOR = 0, 1, 2
+
+    def __init__(self, graph: Netlist_Graph):
+        self.__params = list(graph.params)
+
+        # Indices de cable: primero entradas, luego una salida por compuerta
+        index: Dict[str, int] = {}
+        self.__input_wires: Dict[str, List[Tuple[int, int]]] = {p: [] for p in self.__params}
+        for name, param, bit in graph.inputs:
+            index[name] = len(index)
+            self.__input_wires[param].append((bit, index[name]))
+
+        ops = {'and': self.AND, 'or': self.OR, 'xor': self.XOR}
+        self.__gate_op: List[int] = []
+        self.__gate_inputs: List[List[int]] = []
+        self.__gate_invert: List[int] = []
+        self.__gate_wire: List[int] = []
+        self.__gate_level: List[int] = []
+        self.__fanout: List[List[int]] = [[] for _ in index]
+        level = [0] * len(index)
+
+        for name, op, terms in graph.gates:
+            gate = len(self.__gate_op)
+            wires = [index[t] for t in terms if t != '1']
+            wire = len(level)
+            index[name] = wire
+
+            self.__gate_op.append(ops[op])
+            self.__gate_inputs.append(wires)
+            # Tras el plegado de constantes solo XOR conserva un '1' (inversion)
+            self.__gate_invert.append(1 if '1' in terms else 0)
+            self.__gate_wire.append(wire)
+            self.__gate_level.append(1 + max(level[w] for w in wires))
+            level.append(self.__gate_level[-1])
+            self.__fanout.append([])
+            for w in wires:
+                self.__fanout[w].append(gate)
+
+        # Salidas: (indice de cable o constante, bit)
+        self.__outputs = [[(index[node] if node in index else None, int(node) if node in ('0', '1') else 0, bit)
+                           for node, bit in lines] for lines in graph.outputs]
+
+        self.__values = bytearray(len(level))
+        self.__last_inputs = {p: 0 for p in self.__params}
+        self.__pending: List[List[int]] = [[] for _ in range(max(level, default=0) + 1)]
+        self.__scheduled = bytearray(len(self.__gate_op))
+
+        # Estadisticas
+        self.__updates = 0
+        self.__evaluations = 0
+        self.__changes = 0
+
+        # Estado inicial consistente con todas las entradas en 0
+        for gate in range(len(self.__gate_op)):
+            self.__values[self.__gate_wire[gate]] = self.__evaluate_gate(gate)
+
+    # --- Evaluacion ---
+    def __evaluate_gate(self, gate: int) -> int:
+        values = self.__values
+        op = self.__gate_op[gate]
+        if op == self.AND:
+            result = 1
+            for w in self.__gate_inputs[gate]:
+                if not values[w]:
+                    result = 0
+                    break
+        elif op == self.OR:
+            result = 0
+            for w in self.__gate_inputs[gate]:
+                if values[w]:
+                    result = 1
+                    break
+        else:
+            result = self.__gate_invert[gate]
+            for w in self.__gate_inputs[gate]:
+                result ^= values[w]
+        return result
+
+    def set_input(self, param: str, value: int):
+        """Cambia una entrada y agenda solo las compuertas afectadas"""
+        if param not in self.__input_wires:
+            raise ValueError(f"Entrada desconocida: {param!r}")
+        changed = value ^ self.__last_inputs[param]
+        if not changed:
+            return
+        self.__last_inputs[param] = value
+
+        values = self.__values
+        for bit, wire in self.__input_wires[param]:
+            if (changed >> bit) & 1:
+                values[wire] ^= 1
+                self.__changes += 1
+                self.__schedule(wire)
+
+    def __schedule(self, wire: int):
+        for gate in self.__fanout[wire]:
+            if not self.__scheduled[gate]:
+                self.__scheduled[gate] = 1
+                self.__pending[self.__gate_level[gate]].append(gate)
+
+    def propagate(self) -> int:
+        """Procesa los eventos pendientes por niveles; retorna compuertas evaluadas"""
+        values = self.__values
+        evaluated = 0
+        for bucket in self.__pending:
+            if not bucket:
+                continue
+            for gate in bucket:
+                self.__scheduled[gate] = 0
+                evaluated += 1
+                result = self.__evaluate_gate(gate)
+                wire = self.__gate_wire[gate]
+                if values[wire] != result:
+                    values[wire] = result
+                    self.__changes += 1
+                    self.__schedule(wire)
+            bucket.clear()
+
+        self.__updates += 1
+        self.__evaluations += evaluated
+        return evaluated
+
+    def evaluate(self, *inputs: int) -> Tuple[int, ...]:
+        """
+        Aplica las entradas (en el orden de los parametros), propaga y
+        retorna un entero por salida, igual que la funcion compilada.
+        """
+        if len(inputs) != len(self.__params):
+            raise ValueError(f"Se esperaban {len(self.__params)} entradas")
+        for param, value in zip(self.__params, inputs):
+            self.set_input(param, value)
+        self.propagate()
+        return self.get_outputs()
+
+    def get_outputs(self) -> Tuple[int, ...]:
+        values = self.__values
+        results = []
+        for lines in self.__outputs:
+            word = 0
+            for wire, constant, bit in lines:
+                if (values[wire] if wire is not None else constant):
+                    word |= 1 << bit
+            results.append(word)
+        return tuple(results)
+
+    # --- Estadisticas ---
+    def get_gate_count(self) -> int:
+        return len(self.__gate_op)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Actualizaciones, compuertas evaluadas y cables que cambiaron"""
+        return {
+            'updates': self.__updates,
+            'evaluations': self.__evaluations,
+            'changes': self.__changes,
+            'gates': len(self.__gate_op),
+        }
+
+    def reset_stats(self):
+        self.__updates = 0
+        self.__evaluations = 0
+        self.__changes = 0
+
+    def __str__(self):
+        return f"Event_Simulator(gates={len(self.__gate_op)}, updates={self.__updates}, evaluations={self.__evaluations})"
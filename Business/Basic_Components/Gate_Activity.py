@@ -0,0 +1,267 @@
+from typing import Any, Dict, Hashable, List, Optional
+from Business.Basic_Components.Bit import Bit
+from Business.Basic_Components.Bus import Bus
+from Business.Basic_Components.Logic_Gate import Logic_Gate
+
+
+class Gate_Activity:
+    """
+    Monitor de actividad de conmutación de las compuertas.
+
+    Mientras está habilitado, el `calculate` de cada subclase de Logic_Gate
+    se sustituye por una versión que cuenta evaluaciones y cambios de la
+    salida (toggles) de cada instancia. Deshabilitado, las clases conservan
+    su `calculate` original: el camino caliente no paga nada.
+
+    Cada compuerta se atribuye a su componente dueño recorriendo los
+    atributos de los componentes registrados (register): una compuerta que
+    es atributo de un objeto pertenece a ese objeto (p. ej.
+    ALU.arithmetic_unit.FAs[3], un Full_Adder) y una lista de compuertas es
+    un banco (p. ej. ALU.logical_unit.AND_Gates). Los conteos se separan
+    además por contexto (begin), normalmente el mnemónico de la instrucción
+    en curso, para estimar la actividad y la energía de cada opcode.
+
+    Varios monitores pueden estar habilitados a la vez, en cualquier orden:
+    el primero instala un único `calculate` contador que reparte cada
+    evaluación entre los monitores activos y el último en deshabilitarse
+    restaura los originales. active_monitors cuenta los monitores
+    habilitados: los atajos que no evalúan compuertas (la caché de
+    resultados de la ALU) lo consultan para no saltarse la cuenta.
+    """
+
+    UNKNOWN_CONTEXT = '-'
+    active_monitors = 0
+    __monitors: List["Gate_Activity"] = []     # Monitores habilitados
+    __originals: Optional[Dict[type, Any]] = None   # calculate original de cada clase (con monitores activos)
+
+    def __init__(self):
+        self.__owners: Dict[int, str] = {}      # id(compuerta) -> ruta del dueño
+        self.__keep: List[Logic_Gate] = []      # referencias para que los id() no se reutilicen
+        self.__counts: Dict[tuple, List[int]] = {}   # (contexto, compuerta) -> [evaluaciones, toggles]
+        self.__instructions: Dict[Hashable, int] = {}
+        self.__context: Hashable = self.UNKNOWN_CONTEXT
+
+    # --- Registro de componentes ---
+    def register(self, root, name: Optional[str] = None):
+        """Atribuye las compuertas alcanzables desde `root` a sus componentes"""
+        self.__walk(root, name or type(root).__name__, set())
+
+    @staticmethod
+    def __is_component(value) -> bool:
+        module = type(value).__module__
+        return (module.startswith('Business.') and hasattr(value, '__dict__')
+                and not isinstance(value, (Bit, Bus, Logic_Gate)))
+
+    @staticmethod
+    def __label(obj, attribute: str) -> str:
+        """Nombre de atributo sin el prefijo de name mangling (_Clase__)"""
+        for cls in type(obj).__mro__:
+            prefix = f"_{cls.__name__.lstrip('_')}__"
+            if attribute.startswith(prefix):
+                return attribute[len(prefix):]
+        return attribute.lstrip('_')
+
+    def __walk(self, obj, path: str, seen: set):
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        for attribute, value in vars(obj).items():
+            self.__visit(value, path, f"{path}.{self.__label(obj, attribute)}", seen)
+
+    def __visit(self, value, owner: str, path: str, seen: set):
+        if isinstance(value, Logic_Gate):
+            self.__own(value, owner)
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                if isinstance(item, Logic_Gate):
+                    self.__own(item, path)    # Banco de compuertas
+                else:
+                    self.__visit(item, path, f"{path}[{index}]", seen)
+        elif self.__is_component(value):
+            self.__walk(value, path, seen)
+
+    def __own(self, gate: Logic_Gate, owner: str):
+        if id(gate) not in self.__owners:
+            self.__owners[id(gate)] = owner
+            self.__keep.append(gate)
+
+    def get_owner(self, gate: Logic_Gate) -> str:
+        return self.__owners.get(id(gate), f"<{type(gate).__name__}>")
+
+    # --- Habilitación ---
+    @staticmethod
+    def __gate_classes() -> List[type]:
+        """Subclases de Logic_Gate que definen su propio calculate"""
+        classes, pending = [], [Logic_Gate]
+        while pending:
+            for sub in pending.pop().__subclasses__():
+                pending.append(sub)
+                if 'calculate' in sub.__dict__:
+                    classes.append(sub)
+        return classes
+
+    def enable(self):
+        monitors = Gate_Activity.__monitors
+        if self in monitors:
+            return
+        if not monitors:
+            Gate_Activity.__install()
+        monitors.append(self)
+        Gate_Activity.active_monitors = len(monitors)
+
+    def disable(self):
+        monitors = Gate_Activity.__monitors
+        if self not in monitors:
+            return
+        monitors.remove(self)
+        Gate_Activity.active_monitors = len(monitors)
+        if not monitors:
+            for cls, calculate in Gate_Activity.__originals.items():
+                cls.calculate = calculate
+            Gate_Activity.__originals = None
+
+    def is_enabled(self) -> bool:
+        return self in Gate_Activity.__monitors
+
+    @staticmethod
+    def __install():
+        """Sustituye el calculate de cada clase por uno que cuenta para todos los monitores activos"""
+        Gate_Activity.__originals = {cls: cls.__dict__['calculate'] for cls in Gate_Activity.__gate_classes()}
+        monitors = Gate_Activity.__monitors
+
+        def make_counted(calculate):
+            def counted(gate):
+                output = gate.get_output()
+                before = output.get_value() if output is not None else 0
+                result = calculate(gate)
+                output = gate.get_output()
+                toggled = (output.get_value() if output is not None else 0) ^ before
+
+                gate._evaluations += 1
+                gate._toggles += toggled
+                for monitor in monitors:
+                    counts = monitor.__counts
+                    key = (monitor.__context, gate)
+                    stats = counts.get(key)
+                    if stats is None:
+                        stats = counts[key] = [0, 0]
+                    stats[0] += 1
+                    stats[1] += toggled
+                return result
+            return counted
+
+        for cls, calculate in Gate_Activity.__originals.items():
+            cls.calculate = make_counted(calculate)
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.disable()
+        return False
+
+    # --- Contexto ---
+    def begin(self, context: Hashable):
+        """Las evaluaciones siguientes se atribuyen a `context` (cuenta una instrucción)"""
+        self.__context = context
+        self.__instructions[context] = self.__instructions.get(context, 0) + 1
+
+    def reset(self):
+        """Borra los conteos (las compuertas registradas se conservan)"""
+        for _, gate in self.__counts:
+            gate.reset_activity()
+        self.__counts.clear()
+        self.__instructions.clear()
+        self.__context = self.UNKNOWN_CONTEXT
+
+    # --- Consulta ---
+    @staticmethod
+    def __group(owner: str, depth: Optional[int], merge_indices: bool) -> str:
+        if merge_indices:
+            parts = owner.split('[')
+            owner = parts[0] + ''.join(part[part.index(']') + 1:] for part in parts[1:])
+        if depth is not None:
+            owner = '.'.join(owner.split('.')[:depth])
+        return owner
+
+    def get_component_stats(self, context: Hashable = None, depth: Optional[int] = None,
+                            merge_indices: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Actividad por componente dueño, de mayor a menor número de evaluaciones.
+
+        Args:
+            context: Solo ese contexto (None = todos)
+            depth: Truncar la ruta del dueño a ese número de niveles
+            merge_indices: Unir los elementos de una lista (FAs[0..15] -> FAs)
+        """
+        groups: Dict[str, Dict[str, Any]] = {}
+        for (ctx, gate), (evaluations, toggles) in self.__counts.items():
+            if context is not None and ctx != context:
+                continue
+            owner = self.__group(self.get_owner(gate), depth, merge_indices)
+            entry = groups.setdefault(owner, {'gates': set(), 'evaluations': 0, 'toggles': 0})
+            entry['gates'].add(id(gate))
+            entry['evaluations'] += evaluations
+            entry['toggles'] += toggles
+
+        for entry in groups.values():
+            entry['gates'] = len(entry['gates'])
+            entry['toggle_rate'] = round(entry['toggles'] / entry['evaluations'], 4) if entry['evaluations'] else 0.0
+        return dict(sorted(groups.items(), key=lambda item: (-item[1]['evaluations'], item[0])))
+
+    def get_context_stats(self, energy_per_toggle: float = 1.0) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        Actividad por contexto (opcode). La energía estimada es proporcional
+        a los cambios de salida: toggles × energy_per_toggle.
+        """
+        contexts: Dict[Hashable, Dict[str, Any]] = {}
+        for (ctx, _), (evaluations, toggles) in self.__counts.items():
+            entry = contexts.setdefault(ctx, {'instructions': self.__instructions.get(ctx, 0),
+                                              'evaluations': 0, 'toggles': 0})
+            entry['evaluations'] += evaluations
+            entry['toggles'] += toggles
+
+        for entry in contexts.values():
+            entry['energy'] = entry['toggles'] * energy_per_toggle
+            instructions = entry['instructions']
+            entry['evaluations_per_instruction'] = round(entry['evaluations'] / instructions, 1) if instructions else None
+            entry['energy_per_instruction'] = round(entry['energy'] / instructions, 3) if instructions else None
+        return dict(sorted(contexts.items(), key=lambda item: -item[1]['energy']))
+
+    def get_gate_stats(self) -> List[Dict[str, Any]]:
+        """
+        Una entrada por compuerta evaluada: dueño, tipo, evaluaciones y toggles
+        contados por este monitor (gate.get_activity() suma los de todos)
+        """
+        totals: Dict[int, list] = {}
+        for (_, gate), (evaluations, toggles) in self.__counts.items():
+            entry = totals.get(id(gate))
+            if entry is None:
+                totals[id(gate)] = [gate, evaluations, toggles]
+            else:
+                entry[1] += evaluations
+                entry[2] += toggles
+        stats = [{'owner': self.get_owner(gate), 'gate': type(gate).__name__,
+                  'evaluations': evaluations, 'toggles': toggles}
+                 for gate, evaluations, toggles in totals.values()]
+        return sorted(stats, key=lambda entry: (-entry['evaluations'], entry['owner']))
+
+    def format_report(self, top: int = 10, depth: Optional[int] = None, merge_indices: bool = True) -> str:
+        lines = ["ACTIVIDAD DE COMPUERTAS"]
+        lines.append("Por contexto:")
+        for context, entry in self.get_context_stats().items():
+            per_instruction = entry['evaluations_per_instruction']
+            lines.append(f"  {str(context):<8} {entry['instructions']:>8} instr  {entry['evaluations']:>10} eval  "
+                         f"{entry['toggles']:>9} toggles"
+                         + (f"  ({per_instruction} eval/instr, {entry['energy_per_instruction']} energía/instr)"
+                            if per_instruction is not None else ""))
+        lines.append(f"Componentes (top {top}):")
+        for owner, entry in list(self.get_component_stats(depth=depth, merge_indices=merge_indices).items())[:top]:
+            lines.append(f"  {owner:<44} {entry['gates']:>4} compuertas {entry['evaluations']:>10} eval  "
+                         f"{entry['toggles']:>9} toggles ({100 * entry['toggle_rate']:.1f}%)")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return (f"Gate_Activity(habilitado={self.is_enabled()}, compuertas={len(self.__owners)}, "
+                f"evaluaciones={sum(stats[0] for stats in self.__counts.values())})")
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
 
 class Logic_Gate(ABC):
+    # Contadores de actividad: atributos de clase en 0; solo Gate_Activity
+    # (mientras está habilitado) los incrementa en cada instancia
+    _evaluations = 0
+    _toggles = 0
+
     # Constructor    
     def __init__(self, n_inputs: int = 2):
         self.__inputs = []        
@@ -41,6 +46,14 @@ class Logic_Gate(ABC):
     def get_output(self):
         return self.__output
     
+    def get_activity(self):
+        """(evaluaciones, cambios de la salida) registrados por Gate_Activity"""
+        return self._evaluations, self._toggles
+    
+    def reset_activity(self):
+        self._evaluations = 0
+        self._toggles = 0
+    
     @abstractmethod
     def calculate(self):
         pass
@@ -0,0 +1,304 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Sequence, Tuple
+from Business.Basic_Components.Bit import Bit
+from Business.Basic_Components.Bus import Bus
+from Business.Basic_Components.Logic_Gates import (AND_Gate, OR_Gate, NOT_Gate, XOR_Gate,
+                                                   AND_Gate_4, OR_Gate_8)
+
+
+@dataclass
+class Netlist_Graph:
+    """
+    Grafo trazado y optimizado de un circuito, en orden topologico.
+    Los nodos son nombres de cable; '0' y '1' son constantes.
+    """
+    params: List[str]                           # Parametros de entrada en orden
+    inputs: List[Tuple[str, str, int]]          # (cable, parametro, bit)
+    gates: List[Tuple[str, str, List[str]]]     # (cable, 'and'|'or'|'xor', operandos)
+    outputs: List[List[Tuple[str, int]]]        # Por salida: [(nodo, bit)] desde el LSB
+
+
+class Netlist_Compiler:
+    """
+    Compilador de netlists: convierte un circuito construido con objetos
+    Logic_Gate en una unica funcion Python de linea recta.
+
+    El circuito se traza una sola vez: se ejecuta su camino normal a nivel
+    de compuertas con las compuertas y Bus.set_Line_bit instrumentados, de
+    modo que cada cable queda identificado por el objeto Bit que lo
+    transporta. Con el grafo obtenido se genera codigo con una variable
+    local por cable (plegando constantes, compartiendo subexpresiones
+    repetidas y descartando compuertas que no alcanzan ninguna salida), se
+    compila con exec y se guarda en cache por clave (clase del circuito y
+    señales de control con las que se especializo).
+
+    El mismo grafo puede generarse en modo escalar (un entero por bus de
+    entrada, cada cable vale 0 o 1) o en modo bitsliced (cada cable es un
+    entero de Python o un arreglo de NumPy con un bit por vector de prueba),
+    que evalua miles de combinaciones de entrada en una sola pasada.
+
+    Limitacion: el trazado sigue las ramas Python que tome el circuito, por
+    eso todo lo que decida una rama (por ejemplo ADD/SUB en la unidad
+    aritmetica) debe formar parte de la clave y no de las entradas.
+    """
+
+    # Operacion de cada tipo de compuerta soportada
+    GATE_OPS = {
+        AND_Gate: 'and',
+        AND_Gate_4: 'and',
+        OR_Gate: 'or',
+        OR_Gate_8: 'or',
+        XOR_Gate: 'xor',
+        NOT_Gate: 'not',
+    }
+
+    # Caches compartidas: clave -> grafo trazado, (clave, bitsliced) -> (funcion, codigo fuente)
+    __graphs: Dict[Hashable, "Netlist_Compiler"] = {}
+    __functions: Dict[Tuple[Hashable, bool], Tuple[Callable, str]] = {}
+
+    def __init__(self):
+        # Estado de un trazado en curso
+        self.__wires = {}      # id(Bit) -> nodo (nombre de cable o '0'/'1')
+        self.__keep = []       # referencias para que los id() no se reutilicen
+        self.__lines = []      # (nombre, 'and'|'or'|'xor', operandos)
+        self.__exprs = {}      # (op, operandos) -> nombre (subexpresiones comunes)
+        self.__inputs = []     # (nombre, parametro, bit)
+        self.__params = []     # nombres de parametro en orden
+        self.__results = []    # por salida: [(nodo, bit)]
+        self.__live = set()    # cables que alcanzan alguna salida
+
+    # --- API publica ---
+    @classmethod
+    def compile(cls, key: Hashable, setup: Callable[[], Tuple[Sequence[Tuple[str, Bus]], Callable]],
+                sliced: bool = False) -> Callable:
+        """
+        Devuelve la funcion compilada para `key`, trazandola si hace falta.
+
+        Args:
+            key: Clave de cache (clase del circuito + especializacion)
+            setup: Solo se llama si la clave no esta en cache. Construye el
+                   circuito y retorna (inputs, run): los pares (nombre de
+                   parametro, Bus) cuyas lineas son entradas, y una funcion
+                   que ejecuta una vez el circuito y retorna sus salidas
+                   (Bus o Bit)
+            sliced: Si es True genera la version bitsliced
+
+        Returns:
+            Modo escalar: f(*enteros) -> tupla con un entero por salida.
+            Modo bitsliced: f(*listas, ones) -> tupla con una lista por
+            salida. Cada lista de entrada/salida va indexada por numero de
+            bit (indice 0 = LSB) y cada elemento lleva un bit por vector;
+            `ones` es el valor con todos los vectores en 1 (por ejemplo
+            (1 << n) - 1 para n vectores en un entero de Python).
+        """
+        entry = cls.__functions.get((key, sliced))
+        if entry is None:
+            entry = cls.__traced(key, setup).__generate(key, sliced)
+            cls.__functions[(key, sliced)] = entry
+        return entry[0]
+
+    @classmethod
+    def get_graph(cls, key: Hashable, setup: Callable[[], Tuple[Sequence[Tuple[str, Bus]], Callable]]) -> Netlist_Graph:
+        """Grafo optimizado (solo compuertas vivas) para `key`, trazandolo si hace falta"""
+        traced = cls.__traced(key, setup)
+        live = traced.__live
+        return Netlist_Graph(
+            params=list(traced.__params),
+            inputs=[entry for entry in traced.__inputs if entry[0] in live],
+            gates=[(name, op, list(terms)) for name, op, terms in traced.__lines if name in live],
+            outputs=[list(lines) for lines in traced.__results],
+        )
+
+    @classmethod
+    def __traced(cls, key, setup) -> "Netlist_Compiler":
+        graph = cls.__graphs.get(key)
+        if graph is None:
+            inputs, run = setup()
+            graph = cls()
+            graph.__build(inputs, run)
+            cls.__graphs[key] = graph
+        return graph
+
+    @classmethod
+    def get_source(cls, key: Hashable, sliced: bool = False) -> str:
+        """Codigo generado para una clave ya compilada"""
+        if (key, sliced) not in cls.__functions:
+            raise ValueError(f"No hay netlist compilada para {key!r}")
+        return cls.__functions[(key, sliced)][1]
+
+    @classmethod
+    def get_gate_count(cls, key: Hashable) -> int:
+        """Compuertas que sobrevivieron a la optimizacion para una clave"""
+        if key not in cls.__graphs:
+            raise ValueError(f"No hay netlist compilada para {key!r}")
+        graph = cls.__graphs[key]
+        return sum(1 for name, _, _ in graph.__lines if name in graph.__live)
+
+    @classmethod
+    def is_compiled(cls, key: Hashable, sliced: bool = False) -> bool:
+        return (key, sliced) in cls.__functions
+
+    @classmethod
+    def clear_cache(cls):
+        cls.__graphs.clear()
+        cls.__functions.clear()
+
+    # --- Trazado ---
+    def __build(self, inputs, run):
+        for param, bus in inputs:
+            if not param.isidentifier() or param == 'ones':
+                raise ValueError(f"Nombre de entrada invalido: {param!r}")
+            self.__params.append(param)
+            for i in range(bus.width):
+                bit = bus.width - 1 - i
+                name = f"{param}{bit}"
+                self.__bind(bus.get_Line_bit(i), name)
+                self.__inputs.append((name, param, bit))
+
+        outputs = self.__trace(run)
+
+        # Resolver las salidas a nodos del grafo (ordenadas desde el LSB)
+        for out in outputs:
+            if isinstance(out, Bus):
+                lines = [(self.__resolve(out.get_Line_bit(out.width - 1 - bit)), bit)
+                         for bit in range(out.width)]
+                self.__results.append(lines)
+            elif isinstance(out, Bit):
+                self.__results.append([(self.__resolve(out), 0)])
+            else:
+                raise ValueError(f"Salida no soportada: {type(out).__name__}")
+
+        # Marcar cables vivos desde las salidas
+        live = set(node for lines in self.__results for node, _ in lines)
+        for name, _, terms in reversed(self.__lines):
+            if name in live:
+                live.update(terms)
+        self.__live = live
+
+    def __trace(self, run):
+        originals = {gate_cls: gate_cls.calculate for gate_cls in self.GATE_OPS}
+        original_set_line = Bus.set_Line_bit
+        compiler = self
+
+        def make_traced(op, calculate):
+            def traced(gate):
+                operands = [compiler.__resolve(b) for b in gate._get_inputs()[:gate._get_n_inputs()]]
+                operands += ['0'] * (gate._get_n_inputs() - len(operands))
+                output = calculate(gate)
+                compiler.__bind(gate.get_output(), compiler.__gate(op, operands))
+                return output
+            return traced
+
+        def traced_set_line(bus, index, value):
+            node = compiler.__resolve(value)
+            original_set_line(bus, index, value)
+            compiler.__bind(bus.get_Line_bit(index), node)
+
+        try:
+            for gate_cls, op in self.GATE_OPS.items():
+                gate_cls.calculate = make_traced(op, originals[gate_cls])
+            Bus.set_Line_bit = traced_set_line
+            return run()
+        finally:
+            for gate_cls, calculate in originals.items():
+                gate_cls.calculate = calculate
+            Bus.set_Line_bit = original_set_line
+
+    def __bind(self, bit, node):
+        self.__wires[id(bit)] = node
+        self.__keep.append(bit)
+
+    def __resolve(self, bit) -> str:
+        if bit is None:
+            return '0'
+        node = self.__wires.get(id(bit))
+        if node is None:
+            # Ni entrada ni salida de compuerta: constante del circuito
+            return '1' if bit.get_value() else '0'
+        return node
+
+    def __gate(self, op, operands) -> str:
+        """Crea (o reutiliza) el cable de una compuerta plegando constantes"""
+        if op == 'not':
+            operands, op = [operands[0], '1'], 'xor'
+
+        if op == 'and':
+            if '0' in operands:
+                return '0'
+            terms = sorted(set(o for o in operands if o != '1'))
+            if not terms:
+                return '1'
+        elif op == 'or':
+            if '1' in operands:
+                return '1'
+            terms = sorted(set(o for o in operands if o != '0'))
+            if not terms:
+                return '0'
+        else:
+            # XOR: las constantes se acumulan en la paridad
+            parity = operands.count('1') & 1
+            terms = []
+            for o in operands:
+                if o in ('0', '1'):
+                    continue
+                if o in terms:
+                    terms.remove(o)
+                else:
+                    terms.append(o)
+            terms.sort()
+            if not terms:
+                return str(parity)
+            if parity:
+                terms.append('1')
+
+        if len(terms) == 1:
+            return terms[0]
+
+        signature = (op, tuple(terms))
+        name = self.__exprs.get(signature)
+        if name is None:
+            name = f"w{len(self.__lines)}"
+            self.__lines.append((name, op, terms))
+            self.__exprs[signature] = name
+        return name
+
+    # --- Generacion de codigo ---
+    def __generate(self, key, sliced):
+        live = self.__live
+        one = 'ones' if sliced else '1'
+
+        body = []
+        for name, param, bit in self.__inputs:
+            if name in live:
+                if sliced:
+                    body.append(f"    {name} = {param}[{bit}]")
+                else:
+                    body.append(f"    {name} = ({param} >> {bit}) & 1" if bit else f"    {name} = {param} & 1")
+
+        symbols = {'and': ' & ', 'or': ' | ', 'xor': ' ^ '}
+        for name, op, terms in self.__lines:
+            if name in live:
+                body.append(f"    {name} = " + symbols[op].join(one if t == '1' else t for t in terms))
+
+        returns = []
+        for lines in self.__results:
+            if sliced:
+                # Las constantes conservan el tipo de `ones` (entero o arreglo)
+                nodes = {'0': 'ones ^ ones', '1': 'ones'}
+                returns.append("[" + ", ".join(nodes.get(node, node) for node, _ in lines) + "]")
+            else:
+                terms = [node if bit == 0 else f"({node} << {bit})"
+                         for node, bit in lines if node != '0']
+                returns.append(' | '.join(terms) if terms else '0')
+
+        parts = key if isinstance(key, tuple) else (key,)
+        label = "_".join(p.__name__ if isinstance(p, type) else str(p) for p in parts)
+        func_name = ("sliced_" if sliced else "netlist_") + "".join(c if c.isalnum() else "_" for c in label)
+        params = self.__params + ['ones'] if sliced else self.__params
+        source = (f"def {func_name}({', '.join(params)}):\n"
+                  + "\n".join(body) + ("\n" if body else "")
+                  + f"    return ({', '.join(returns)},)\n")
+
+        namespace = {}
+        exec(compile(source, f"<netlist {key!r}>", "exec"), namespace)
+        return namespace[func_name], source
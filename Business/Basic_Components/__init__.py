@@ -4,5 +4,8 @@ from .Logic_Gate import Logic_Gate
 from .MUX3to1 import MUX3to1
 from .MUX4to1 import MUX4to1
 from .Record import Record
+from .Netlist_Compiler import Netlist_Compiler, Netlist_Graph
+from .Event_Simulator import Event_Simulator
+from .Gate_Activity import Gate_Activity
 
-__all__ = ['Record', 'Bit', 'Logic_Gate', 'Bus', 'MUX3to1', 'MUX4to1']
\ No newline at end of file
+__all__ = ['Record', 'Bit', 'Logic_Gate', 'Bus', 'MUX3to1', 'MUX4to1', 'Netlist_Compiler', 'Netlist_Graph', 'Event_Simulator', 'Gate_Activity']
\ No newline at end of file
@@ -0,0 +1,254 @@
+# Business/Batch_Runner.py
+"""
+Ejecución por lotes de programas sobre instancias independientes de System.
+
+Cada trabajo (programa JSON + datos iniciales opcionales) se ejecuta en un
+System recién ensamblado dentro de un ProcessPoolExecutor y devuelve un
+resumen con registros, banderas y digests de memoria/estado.
+
+Uso desde consola:
+    python -m Business.Batch_Runner Data/Programs/*.json --workers 4
+    python -m Business.Batch_Runner prog.json --data-sets casos.json --stream
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+@dataclass
+class Batch_Job:
+    """Un programa a ejecutar, con datos iniciales opcionales {dirección: valor}"""
+
+    program: str
+    data: Dict[int, int] = field(default_factory=dict)
+    name: Optional[str] = None
+    max_cycles: int = 1000
+
+    def __post_init__(self):
+        if self.max_cycles <= 0:
+            raise ValueError("max_cycles debe ser mayor que 0")
+        if self.name is None:
+            self.name = Path(self.program).stem
+
+
+def _parse_address(value) -> int:
+    """Acepta direcciones/valores como entero o cadena ('0x100', '256')"""
+    if isinstance(value, str):
+        return int(value, 0)
+    return int(value)
+
+
+def load_data_sets(json_path: str) -> List[Dict[str, Any]]:
+    """
+    Lee un archivo de conjuntos de datos iniciales.
+
+    Formato: lista de objetos {"name": ..., "data": {"0x100": 5, ...}}
+    o directamente lista de diccionarios {dirección: valor}.
+    """
+    with open(json_path, 'r') as f:
+        raw = json.load(f)
+
+    if not isinstance(raw, list):
+        raise ValueError(f"{json_path}: se esperaba una lista de conjuntos de datos")
+
+    data_sets = []
+    for index, entry in enumerate(raw):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{json_path}: el conjunto {index} no es un objeto")
+        if 'data' in entry:
+            name, values = entry.get('name', f"set{index}"), entry['data']
+        else:
+            name, values = f"set{index}", entry
+        data_sets.append({
+            'name': name,
+            'data': {_parse_address(addr): _parse_address(value) for addr, value in values.items()}
+        })
+    return data_sets
+
+
+def memory_digest(words) -> str:
+    """SHA-256 de la memoria como palabras de 16 bits little-endian"""
+    words = array('H', words)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return hashlib.sha256(words.tobytes()).hexdigest()
+
+
+def run_job(job: Batch_Job, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Ensambla un System nuevo, carga el programa y lo ejecuta. Retorna el resumen."""
+    from Business.Computer_System import System
+
+    result = {
+        'name': job.name,
+        'program': job.program,
+        'success': False,
+        'error': None,
+    }
+
+    # Los trabajos por lotes no imprimen nada: sin traza y sin la salida de carga
+    system_config = {**(config or {}), 'trace_sink': 'null'}
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = System(system_config)
+            if not system.assemble(verbose=False):
+                result['error'] = "No se pudo ensamblar el sistema"
+                return result
+
+            if not system.load_program_from_json(job.program, verbose=False):
+                result['error'] = f"No se pudo cargar el programa {job.program}"
+                return result
+
+            for address, value in job.data.items():
+                system.ram.write_direct(address, value)
+
+            entry_point = system.current_program['entry_point']
+            system.cpu.run_program(start_address=entry_point, max_cycles=job.max_cycles)
+
+        status = system.cpu.get_status()
+        mem_digest = memory_digest(system.ram.read_block(0, system.ram.size))
+
+        registers = {key: status[key] for key in
+                     ('pc', 'ir', 'ac', 'mar', 'mdr', 'temp', 'hi', 'lo', 'status')}
+        state = json.dumps({'registers': registers, 'flags': status['flags'], 'memory': mem_digest},
+                           sort_keys=True)
+
+        result.update({
+            'success': True,
+            'halted': status['running'] == 0,
+            'cycles': status['clock_cycle'],
+            'instructions': status['instructions'],
+            'registers': registers,
+            'flags': status['flags'],
+            'memory_digest': mem_digest,
+            'state_digest': hashlib.sha256(state.encode()).hexdigest(),
+        })
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def _run_chunk(indexed_jobs, config) -> List[Dict[str, Any]]:
+    """Ejecuta un fragmento de trabajos en un proceso del pool"""
+    results = []
+    for index, job in indexed_jobs:
+        result = run_job(job, config)
+        result['job'] = index
+        results.append(result)
+    return results
+
+
+class Batch_Runner:
+    """
+    Reparte trabajos entre procesos y recoge sus resúmenes.
+
+    workers=1 ejecuta en el proceso actual (sin pool), útil para depurar.
+    chunksize controla cuántos trabajos viajan juntos a cada proceso.
+    """
+
+    def __init__(self, workers: Optional[int] = None, config: Optional[Dict[str, Any]] = None,
+                 chunksize: Optional[int] = None):
+        if workers is not None and workers <= 0:
+            raise ValueError("workers debe ser mayor que 0")
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError("chunksize debe ser mayor que 0")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.config = config or {}
+        self.chunksize = chunksize
+
+    # --- Construcción de trabajos ---
+    @staticmethod
+    def jobs_from_programs(programs: Iterable[str], max_cycles: int = 1000) -> List[Batch_Job]:
+        """Un trabajo por archivo de programa"""
+        return [Batch_Job(program=str(path), max_cycles=max_cycles) for path in programs]
+
+    @staticmethod
+    def jobs_from_data_sets(program: str, data_sets: Iterable[Dict[str, Any]],
+                            max_cycles: int = 1000) -> List[Batch_Job]:
+        """Un trabajo por conjunto de datos iniciales sobre el mismo programa"""
+        stem = Path(program).stem
+        return [Batch_Job(program=str(program), data=data_set['data'],
+                          name=f"{stem}[{data_set.get('name', index)}]", max_cycles=max_cycles)
+                for index, data_set in enumerate(data_sets)]
+
+    # --- Ejecución ---
+    def stream(self, jobs: List[Batch_Job]) -> Iterator[Dict[str, Any]]:
+        """Produce cada resumen en cuanto termina su fragmento (orden de llegada)"""
+        indexed = list(enumerate(jobs))
+        if not indexed:
+            return
+
+        if self.workers == 1:
+            for index, job in indexed:
+                yield from _run_chunk([(index, job)], self.config)
+            return
+
+        chunksize = self.chunksize or max(1, len(indexed) // (self.workers * 4))
+        chunks = [indexed[i:i + chunksize] for i in range(0, len(indexed), chunksize)]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(_run_chunk, chunk, self.config) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def run(self, jobs: List[Batch_Job]) -> List[Dict[str, Any]]:
+        """Ejecuta todos los trabajos y retorna los resúmenes en el orden de entrada"""
+        results = list(self.stream(jobs))
+        results.sort(key=lambda result: result['job'])
+        return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m Business.Batch_Runner",
+        description="Ejecuta programas JSON del simulador en paralelo y reporta digests de estado")
+    parser.add_argument('programs', nargs='+', help="Archivos de programa JSON")
+    parser.add_argument('--data-sets', help="JSON con conjuntos de datos iniciales (requiere un solo programa)")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (por defecto: núcleos disponibles)")
+    parser.add_argument('--chunksize', type=int, default=None, help="Trabajos por envío a cada proceso")
+    parser.add_argument('--max-cycles', type=int, default=1000, help="Ciclos máximos por programa")
+    parser.add_argument('--engine', choices=('functional', 'gate', 'micro'), default='functional', help="Motor de la CPU")
+    parser.add_argument('--stream', action='store_true', help="Emitir cada resultado al terminar (orden de llegada)")
+    parser.add_argument('--output', help="Archivo de salida JSON Lines (por defecto stdout)")
+    args = parser.parse_args(argv)
+
+    if args.data_sets:
+        if len(args.programs) != 1:
+            parser.error("--data-sets requiere exactamente un programa")
+        jobs = Batch_Runner.jobs_from_data_sets(args.programs[0], load_data_sets(args.data_sets),
+                                                max_cycles=args.max_cycles)
+    else:
+        jobs = Batch_Runner.jobs_from_programs(args.programs, max_cycles=args.max_cycles)
+
+    runner = Batch_Runner(workers=args.workers, config={'cpu_engine': args.engine},
+                          chunksize=args.chunksize)
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    failed = 0
+    try:
+        results = runner.stream(jobs) if args.stream else runner.run(jobs)
+        for result in results:
+            failed += 0 if result['success'] else 1
+            output.write(json.dumps(result, sort_keys=True) + "\n")
+            output.flush()
+    finally:
+        if args.output:
+            output.close()
+
+    print(f"{len(jobs)} trabajos, {len(jobs) - failed} exitosos, {failed} fallidos", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+# Business/Benchmark.py
+"""
+Suite de rendimiento del simulador: micro-benchmarks de los componentes del
+camino crítico y programas sintéticos de larga duración por motor de CPU.
+
+Métricas reportadas:
+- Micro-benchmarks (Bus, RAM, ALU.execute, ControlStore, System.assemble):
+  nanosegundos por operación (mejor de `repeat` mediciones).
+- Programas (Data/Benchmarks/*.json): instrucciones por segundo,
+  nanosegundos por instrucción y pico de memoria (tracemalloc) de
+  ensamblar, cargar y ejecutar el programa.
+
+Los resultados se guardan como JSON y sirven de línea base: una ejecución
+posterior con --compare marca como regresión toda métrica de tiempo o
+memoria que empeore más que la tolerancia.
+
+Uso desde consola:
+    python -m Business.Benchmark --save logs/benchmark_baseline.json
+    python -m Business.Benchmark --compare logs/benchmark_baseline.json --tolerance 0.25
+    python -m Business.Benchmark --engines functional --skip-micro
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+BENCHMARK_DIR = Path(__file__).resolve().parent.parent / 'Data' / 'Benchmarks'
+DEFAULT_BASELINE = Path(__file__).resolve().parent.parent / 'logs' / 'benchmark_baseline.json'
+
+# Métricas comparadas contra la línea base (todas: menor es mejor)
+COMPARED_METRICS = ('ns_per_op', 'ns_per_instruction', 'peak_memory_bytes')
+
+# Operaciones de la ALU usadas en los micro-benchmarks: (ALUop, ModoFunción)
+ALU_MIX = ((0b00, 0b000), (0b00, 0b001), (0b01, 0b000), (0b01, 0b010), (0b10, 0b000), (0b10, 0b001))
+
+
+def _best_time(fn: Callable[[], Any], repeat: int) -> float:
+    """Mejor tiempo (segundos) de `repeat` llamadas a fn"""
+    best = float('inf')
+    for _ in range(repeat):
+        began = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def _new_system(engine: str):
+    """System ensamblado sin traza ni salida por consola"""
+    from Business.Computer_System import System
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = System({'cpu_engine': engine, 'trace_sink': 'null'})
+        if not system.assemble(verbose=False):
+            raise RuntimeError("No se pudo ensamblar el sistema")
+    return system
+
+
+class Benchmark_Suite:
+    """
+    Ejecuta los micro-benchmarks y los programas sintéticos.
+
+    repeat: mediciones por benchmark (se reporta la mejor)
+    measure_memory: medir el pico de memoria de cada programa en una pasada
+                    adicional bajo tracemalloc (no afecta a los tiempos)
+    """
+
+    def __init__(self, engines: Iterable[str] = ('functional', 'gate', 'micro'), repeat: int = 3,
+                 programs: Optional[Iterable[str]] = None, measure_memory: bool = True,
+                 max_cycles: int = 1_000_000):
+        from Business.CPU_Core.CPU import CPU
+
+        self.engines = list(engines)
+        for engine in self.engines:
+            if engine not in CPU.ENGINES:
+                raise ValueError(f"Motor '{engine}' no válido. Opciones: {', '.join(CPU.ENGINES)}")
+        if repeat <= 0:
+            raise ValueError("repeat debe ser mayor que 0")
+        if max_cycles <= 0:
+            raise ValueError("max_cycles debe ser mayor que 0")
+
+        self.repeat = repeat
+        self.programs = [str(p) for p in programs] if programs is not None else \
+            [str(p) for p in sorted(BENCHMARK_DIR.glob('*.json'))]
+        self.measure_memory = measure_memory
+        self.max_cycles = max_cycles
+
+    # --- Micro-benchmarks ---
+    def __micro(self, fn: Callable[[int], Any], operations: int) -> Dict[str, Any]:
+        """fn(n) ejecuta n operaciones; retorna ns por operación"""
+        fn(1)  # Calentamiento (cachés de decodificación, netlists compiladas)
+        seconds = _best_time(lambda: fn(operations), self.repeat)
+        return {'operations': operations, 'ns_per_op': round(seconds * 1e9 / operations, 1)}
+
+    def run_micro(self) -> Dict[str, Dict[str, Any]]:
+        from Business.Basic_Components.Bus import Bus
+        from Business.Memory.RAM import RAM
+        from Business.Memory.SystemBus import SystemBus
+        from Business.CPU_Core.Arithmetic_Logical_Unit.ALU import ALU
+        from Business.CPU_Core.Arithmetic_Logical_Unit.Functional_ALU import Functional_ALU
+        from Business.CPU_Core.Control_Unit.ControlStore import ControlStore
+
+        def bus_create(n):
+            for i in range(n):
+                Bus(16, i & 0xFFFF)
+
+        bus = Bus(16, 0)
+
+        def bus_set_get(n):
+            for i in range(n):
+                bus.set_Binary_value(i & 0xFFFF)
+                bus.get_Decimal_value()
+
+        def bus_line_bit(n):
+            for i in range(n):
+                bus.get_Line_bit(i & 0xF).get_value()
+
+        ram = RAM(4)
+
+        def ram_direct(n):
+            for i in range(n):
+                ram.write_direct(i & 0xFFF, i & 0xFFFF)
+                ram.read_direct(i & 0xFFF)
+
+        def ram_word(n):
+            for i in range(n):
+                ram.write_word(i & 0xFFF, i & 0xFFFF)
+                ram.read_word(i & 0xFFF)
+
+        # Bus del sistema con RAM y varios dispositivos pequeños: decodificar no depende de cuántos haya
+        with contextlib.redirect_stdout(io.StringIO()):
+            sysbus = SystemBus()
+            sysbus.connect_device(RAM(2), "RAM", (0x000, 0x7FF))
+            for i in range(16):
+                sysbus.connect_device(RAM(1), f"IO{i}", (0xF00 + 8 * i, 0xF07 + 8 * i))
+
+        def sysbus_decode(n):
+            for i in range(n):
+                sysbus.find_device(i & 0x7FF)
+                sysbus.find_device(0xF00 | (i & 0x7F))
+
+        def alu_bench(alu):
+            def run(n):
+                for i in range(n):
+                    aluop, modo = ALU_MIX[i % len(ALU_MIX)]
+                    alu.execute_with_signals((i * 40503) & 0xFFFF, (i * 9973) & 0xFFFF, aluop, modo)
+            return run
+
+        def control_store(n):
+            for _ in range(n):
+                ControlStore()
+
+        def assemble(n):
+            for _ in range(n):
+                _new_system('functional')
+
+        return {
+            'bus.create': self.__micro(bus_create, 20000),
+            'bus.set_get': self.__micro(bus_set_get, 20000),
+            'bus.line_bit': self.__micro(bus_line_bit, 20000),
+            'ram.direct': self.__micro(ram_direct, 20000),
+            'ram.word': self.__micro(ram_word, 20000),
+            'sysbus.decode': self.__micro(sysbus_decode, 20000),
+            'alu.functional': self.__micro(alu_bench(Functional_ALU()), 20000),
+            'alu.compiled': self.__micro(alu_bench(ALU()), 5000),
+            'alu.incremental': self.__micro(alu_bench(ALU(incremental=True)), 2000),
+            'alu.gates': self.__micro(alu_bench(ALU(compiled=False)), 60),
+            'control_store.build': self.__micro(control_store, 20),
+            'system.assemble': self.__micro(assemble, 10),
+        }
+
+    # --- Programas ---
+    def __load(self, engine: str, program: str):
+        system = _new_system(engine)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if not system.load_program_from_json(program, verbose=False):
+                raise RuntimeError(f"No se pudo cargar el programa {program}")
+        return system
+
+    def __execute(self, system):
+        system.cpu.run_program(start_address=system.current_program['entry_point'],
+                               max_cycles=self.max_cycles)
+
+    @staticmethod
+    def __check(system, program: str) -> Optional[str]:
+        """Contrasta el estado final con execution_info.expected_result (claves memory_N)"""
+        with open(program, 'r') as f:
+            expected = json.load(f).get('execution_info', {}).get('expected_result', {})
+        for key, value in expected.items():
+            if key.startswith('memory_'):
+                address = int(key[len('memory_'):])
+                actual = system.ram.read_word(address)
+                if actual != value:
+                    return f"memoria[{address}] = {actual}, se esperaba {value}"
+        return None
+
+    def run_program(self, engine: str, program: str) -> Dict[str, Any]:
+        best = float('inf')
+        system = None
+        for _ in range(self.repeat):
+            # Sistema nuevo en cada medición: el programa modifica su memoria
+            system = self.__load(engine, program)
+            began = time.perf_counter()
+            self.__execute(system)
+            best = min(best, time.perf_counter() - began)
+
+        status = system.cpu.get_status()
+        instructions = status['instructions']
+        result = {
+            'engine': engine,
+            'program': Path(program).stem,
+            'halted': status['running'] == 0,
+            'error': self.__check(system, program),
+            'cycles': status['clock_cycle'],
+            'instructions': instructions,
+            'seconds': round(best, 6),
+            'instructions_per_sec': round(instructions / best) if best > 0 else 0,
+            'ns_per_instruction': round(best * 1e9 / instructions, 1) if instructions else 0,
+        }
+        if not result['halted'] and result['error'] is None:
+            result['error'] = f"No alcanzó HALT en {self.max_cycles} ciclos"
+
+        if self.measure_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            try:
+                self.__execute(self.__load(engine, program))
+                result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        return result
+
+    def run_programs(self) -> Dict[str, Dict[str, Any]]:
+        return {f"{engine}/{Path(program).stem}": self.run_program(engine, program)
+                for engine in self.engines for program in self.programs}
+
+    # --- Suite completa ---
+    def run(self, micro: bool = True) -> Dict[str, Any]:
+        return {
+            'metadata': {
+                'timestamp': datetime.now().isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': self.repeat,
+                'engines': self.engines,
+            },
+            'micro': self.run_micro() if micro else {},
+            'programs': self.run_programs(),
+        }
+
+
+def save_baseline(results: Dict[str, Any], path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path) -> Dict[str, Any]:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25) -> List[Dict[str, Any]]:
+    """
+    Regresiones de `results` respecto a `baseline`: métricas de
+    COMPARED_METRICS que superan el valor base en más de `tolerance`
+    (0.25 = 25 %). Solo se comparan los benchmarks presentes en ambos.
+    """
+    if tolerance < 0:
+        raise ValueError("tolerance no puede ser negativa")
+
+    regressions = []
+    for section in ('micro', 'programs'):
+        current, base = results.get(section, {}), baseline.get(section, {})
+        for name in sorted(set(current) & set(base)):
+            for metric in COMPARED_METRICS:
+                new, old = current[name].get(metric), base[name].get(metric)
+                if new is None or not old:
+                    continue
+                if new > old * (1 + tolerance):
+                    regressions.append({
+                        'benchmark': f"{section}:{name}",
+                        'metric': metric,
+                        'baseline': old,
+                        'current': new,
+                        'ratio': round(new / old, 3),
+                    })
+    return regressions
+
+
+def _print_results(results: Dict[str, Any]) -> None:
+    for name, entry in results['micro'].items():
+        print(f"{name:<24} {entry['ns_per_op']:>14,.1f} ns/op")
+    for name, entry in results['programs'].items():
+        memory = entry.get('peak_memory_bytes')
+        memory = f"{memory / 1024:>10,.0f} KiB" if memory is not None else ""
+        status = "" if entry['error'] is None else f"  ERROR: {entry['error']}"
+        print(f"{name:<24} {entry['instructions_per_sec']:>14,} instr/s "
+              f"{entry['ns_per_instruction']:>12,.1f} ns/instr {memory}{status}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from Business.CPU_Core.CPU import CPU
+
+    parser = argparse.ArgumentParser(
+        prog="python -m Business.Benchmark",
+        description="Mide el rendimiento del simulador y lo compara con una línea base JSON")
+    parser.add_argument('--engines', nargs='+', choices=CPU.ENGINES, default=list(CPU.ENGINES), help="Motores de CPU")
+    parser.add_argument('--programs', nargs='+', help="Programas JSON (por defecto Data/Benchmarks/*.json)")
+    parser.add_argument('--repeat', type=int, default=3, help="Mediciones por benchmark (se toma la mejor)")
+    parser.add_argument('--skip-micro', action='store_true', help="No ejecutar los micro-benchmarks")
+    parser.add_argument('--no-memory', action='store_true', help="No medir el pico de memoria")
+    parser.add_argument('--save', nargs='?', const=str(DEFAULT_BASELINE), help="Guardar los resultados como línea base")
+    parser.add_argument('--compare', nargs='?', const=str(DEFAULT_BASELINE), help="Comparar con una línea base")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Empeoramiento tolerado (0.25 = 25 %%)")
+    args = parser.parse_args(argv)
+
+    suite = Benchmark_Suite(engines=args.engines, repeat=args.repeat, programs=args.programs,
+                            measure_memory=not args.no_memory)
+    results = suite.run(micro=not args.skip_micro)
+    _print_results(results)
+
+    failed = sum(1 for entry in results['programs'].values() if entry['error'] is not None)
+
+    if args.compare:
+        regressions = compare(results, load_baseline(args.compare), args.tolerance)
+        for r in regressions:
+            print(f"REGRESIÓN {r['benchmark']} {r['metric']}: {r['baseline']} -> {r['current']} (x{r['ratio']})")
+        print(f"{len(regressions)} regresiones respecto a {args.compare}", file=sys.stderr)
+        failed += len(regressions)
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"Línea base guardada en {args.save}", file=sys.stderr)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,67 @@
 # Business/CPU_Core/Arithmetic_Logical_Unit/ALU.py
+from collections import OrderedDict
 from Business.Basic_Components.Bus import Bus
 from Business.Basic_Components.Bit import Bit
 from .Arithmetic_Unit.Arithmetic_Unit import Arithmetic_Unit
 from .Logical_Unit.Logical_Unit import Logical_Unit
 from .Shift_Unit.Shift_Unit import Shift_Unit
 from .ALU_MUX import ALU_MUX
+from Business.Basic_Components.Netlist_Compiler import Netlist_Compiler
+from Business.Basic_Components.Event_Simulator import Event_Simulator
+from Business.Basic_Components.Gate_Activity import Gate_Activity
 
 class ALU:
     """
     Unidad Aritmético Lógica Principal.
     Orquesta las tres unidades y selecciona el resultado según ALUop.
+    
+    Por defecto la ALU se ejecuta a través de su netlist compilada: la
+    primera vez que aparece una combinación (ALUop, ModoFunción) se traza el
+    circuito de compuertas y se genera una función de línea recta que se
+    reutiliza en las siguientes ejecuciones. Con compiled=False se recorren
+    los objetos Logic_Gate uno a uno como en el diseño original.
+    
+    Con incremental=True la misma netlist se simula por eventos: la ALU
+    conserva el valor de cada cable y solo reevalúa las compuertas aguas
+    abajo de los bits de entrada que cambiaron (útil en sesiones paso a paso
+    con operandos casi iguales; get_event_stats() muestra cuánto se evitó).
+    
+    En el recorrido de compuertas (compiled=False) la ALU es perezosa por
+    defecto: los multiplexores deciden qué unidad se evalúa y solo se
+    calcula la que seleccionan ALUop/ModoFunción. La unidad aritmética se
+    evalúa siempre porque de ella sale el Carry. Con lazy=False se evalúan
+    todas las unidades como en el hardware.
+    
+    Con cache_size > 0 los resultados se memorizan en una caché LRU acotada
+    indexada por (A, B, ALUop, ModoFunción): un acierto no evalúa ninguna
+    compuerta pero deja la salida y los flags igual que una ejecución real.
+    Mientras haya un Gate_Activity habilitado la caché se omite (sin contar
+    aciertos ni fallos) para que cada ejecución evalúe y cuente sus compuertas.
     """
     
-    def __init__(self):
+    def __init__(self, compiled: bool = True, incremental: bool = False, lazy: bool = True,
+                 cache_size: int = 0):
+        if cache_size < 0:
+            raise ValueError("cache_size no puede ser negativo")
+        
+        # Modo de ejecución (netlist compilada, por eventos o recorrido de compuertas)
+        self.__compiled = compiled
+        self.__incremental = incremental
+        self.__simulators = {}    # (ALUop, ModoFunción) -> Event_Simulator
+        self.__lazy = lazy
+        
+        # Caché LRU de resultados: clave empaquetada -> (resultado, carry)
+        self.__cache_size = cache_size
+        self.__cache = OrderedDict()
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+        self.__cache_evictions = 0
+        
         # Componentes internos
         self.__arithmetic_unit = Arithmetic_Unit()
-        self.__logical_unit = Logical_Unit()
-        self.__shift_unit = Shift_Unit()
-        self.__output_mux = ALU_MUX()
+        self.__logical_unit = Logical_Unit(lazy)
+        self.__shift_unit = Shift_Unit(lazy)
+        self.__output_mux = ALU_MUX(lazy)
         
         # Entradas
         self.__input_a = Bus(16)
@@ -70,13 +114,141 @@ class ALU:
     def get_negative_flag(self) -> Bit:
         return self.__negative_flag
     
+    def is_compiled(self) -> bool:
+        return self.__compiled
+    
+    def set_compiled(self, compiled: bool):
+        """Alterna entre la netlist compilada y el recorrido de compuertas"""
+        self.__compiled = compiled
+    
+    def is_incremental(self) -> bool:
+        return self.__incremental
+    
+    def is_lazy(self) -> bool:
+        return self.__lazy
+    
+    def get_cache_stats(self) -> dict:
+        """Estado de la caché de resultados"""
+        return {
+            'size': len(self.__cache),
+            'capacity': self.__cache_size,
+            'hits': self.__cache_hits,
+            'misses': self.__cache_misses,
+            'evictions': self.__cache_evictions,
+        }
+    
+    def clear_cache(self):
+        """Vacía la caché de resultados y reinicia sus contadores"""
+        self.__cache.clear()
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+        self.__cache_evictions = 0
+    
+    def get_event_stats(self) -> dict:
+        """Totales de la simulación por eventos (solo con incremental=True)"""
+        stats = {'updates': 0, 'evaluations': 0, 'changes': 0, 'gates': 0}
+        for simulator in self.__simulators.values():
+            for name, value in simulator.get_stats().items():
+                stats[name] += value
+        return stats
+    
     # --- Método principal de ejecución ---
-    # Business/CPU_Core/Arithmetic_Logical_Unit/ALU.py (método execute corregido)
     def execute(self) -> Bus:
         """
         Ejecuta la operación completa según ALUop y ModoFunción.
         Actualiza flags y retorna el resultado.
         """
+        if not self.__cache_size or Gate_Activity.active_monitors:
+            return self.__execute_uncached()
+        
+        aluop = self.__aluop.get_Decimal_value()
+        modo_funcion = self.__modo_funcion.get_Decimal_value()
+        key = (self.__input_a.get_Decimal_value() << 21) | (self.__input_b.get_Decimal_value() << 5) \
+            | (aluop << 3) | modo_funcion
+        
+        cache = self.__cache
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+            self.__cache_hits += 1
+            result, carry = entry
+            self.__set_result(result, carry)
+            return self.__output
+        
+        self.__cache_misses += 1
+        self.__execute_uncached()
+        cache[key] = (self.__output.get_Decimal_value(), self.__carry_out.get_value())
+        if len(cache) > self.__cache_size:
+            cache.popitem(last=False)
+            self.__cache_evictions += 1
+        return self.__output
+    
+    def __set_result(self, result: int, carry: int):
+        """Publica resultado y flags calculados como enteros"""
+        self.__output = Bus(16, result)
+        self.__carry_out = Bit(carry)
+        self.__zero_flag.set_value(1 if result == 0 else 0)
+        self.__negative_flag.set_value(result >> 15)
+    
+    def __execute_uncached(self) -> Bus:
+        if not self.__compiled:
+            return self.__execute_gates()
+        
+        aluop = self.__aluop.get_Decimal_value()
+        modo_funcion = self.__modo_funcion.get_Decimal_value()
+        if self.__incremental:
+            netlist = self.__simulators.get((aluop, modo_funcion))
+            if netlist is None:
+                netlist = Event_Simulator(Netlist_Compiler.get_graph(
+                    (ALU, aluop, modo_funcion), lambda: ALU.__netlist_setup(aluop, modo_funcion)))
+                self.__simulators[(aluop, modo_funcion)] = netlist
+            netlist = netlist.evaluate
+        else:
+            netlist = self.get_netlist(aluop, modo_funcion)
+        result, carry = netlist(self.__input_a.get_Decimal_value(),
+                                self.__input_b.get_Decimal_value())
+        self.__set_result(result, carry)
+        return self.__output
+    
+    @staticmethod
+    def get_netlist(aluop: int, modo_funcion: int):
+        """
+        Función compilada f(a, b) -> (resultado, carry) para unas señales de
+        control dadas. Las señales forman parte de la clave porque deciden
+        ramas del circuito (ADD/SUB) y permiten plegar los multiplexores.
+        """
+        return Netlist_Compiler.compile((ALU, aluop, modo_funcion),
+                                        lambda: ALU.__netlist_setup(aluop, modo_funcion))
+    
+    @staticmethod
+    def get_sliced_netlist(aluop: int, modo_funcion: int):
+        """
+        Versión bitsliced de la netlist: f(a, b, ones) -> (resultado, [carry]).
+        a, b y resultado son listas de 16 cortes (índice 0 = LSB) donde cada
+        corte lleva un bit por vector de prueba.
+        """
+        return Netlist_Compiler.compile((ALU, aluop, modo_funcion),
+                                        lambda: ALU.__netlist_setup(aluop, modo_funcion),
+                                        sliced=True)
+    
+    @staticmethod
+    def __netlist_setup(aluop: int, modo_funcion: int):
+        # Trazar sobre una ALU auxiliar para no alterar el estado de nadie
+        probe = ALU(compiled=False, lazy=False)
+        a_bus, b_bus = Bus(16), Bus(16)
+        probe.set_input_a(a_bus)
+        probe.set_input_b(b_bus)
+        probe.set_aluop(Bus(2, aluop))
+        probe.set_modo_funcion(Bus(3, modo_funcion))
+        
+        def run():
+            probe.execute()
+            return probe.get_output(), probe.get_carry_out()
+        
+        return (('a', a_bus), ('b', b_bus)), run
+    
+    def __execute_gates(self) -> Bus:
+        """Recorre las compuertas de las tres unidades (camino original)"""
         # 1. Extraer señales de control
         # ModoFunción es un Bus de 3 bits: bit0=LSB (resta), bit1, bit2=MSB
         # En Bus: índice 0=MSB, índice 1, índice 2=LSB
@@ -100,9 +272,12 @@ class ALU:
         for i in range(3):
             modo_desplazamiento.set_Line_bit(i, self.__modo_funcion.get_Line_bit(i))
         
-        # 2. Ejecutar todas las unidades en paralelo
+        # 2. Ejecutar todas las unidades en paralelo (o solo la seleccionada en modo lazy)
+        self.__output_mux.set_select(self.__aluop)
+        evaluate_all = not self.__lazy
+        selected = self.__output_mux.get_selected()
         
-        # Unidad Aritmética (ADD/SUB)
+        # Unidad Aritmética (ADD/SUB): siempre, de aquí sale el Carry
         self.__arith_result, self.__carry_out = self.__arithmetic_unit.calculate(
             self.__input_a, 
             self.__input_b, 
@@ -110,22 +285,23 @@ class ALU:
         )
         
         # Unidad Lógica (AND, OR, XOR, NOT)
-        self.__logical_unit.set_Input_A(self.__input_a)
-        self.__logical_unit.set_Input_B(self.__input_b)
-        self.__logical_unit.set_Mode(modo_logica)
-        self.__logic_result = self.__logical_unit.Calculate()
+        if evaluate_all or selected == 1:
+            self.__logical_unit.set_Input_A(self.__input_a)
+            self.__logical_unit.set_Input_B(self.__input_b)
+            self.__logical_unit.set_Mode(modo_logica)
+            self.__logic_result = self.__logical_unit.Calculate()
         
         # Unidad Desplazamiento
-        self.__shift_unit.set_input_A(self.__input_a)
-        self.__shift_unit.set_input_B(self.__input_b)
-        self.__shift_unit.set_operation_bus(modo_desplazamiento)
-        self.__shift_result = self.__shift_unit.calculate()
+        if evaluate_all or selected == 2:
+            self.__shift_unit.set_input_A(self.__input_a)
+            self.__shift_unit.set_input_B(self.__input_b)
+            self.__shift_unit.set_operation_bus(modo_desplazamiento)
+            self.__shift_result = self.__shift_unit.calculate()
         
         # 3. Seleccionar resultado según ALUop
         self.__output_mux.set_input_aritmetica(self.__arith_result)
         self.__output_mux.set_input_logica(self.__logic_result)
         self.__output_mux.set_input_desplazamiento(self.__shift_result)
-        self.__output_mux.set_select(self.__aluop)
         self.__output = self.__output_mux.calculate()
         
         # 4. Actualizar flags
@@ -180,6 +356,31 @@ class ALU:
         
         return self.__output.get_Decimal_value()
     
+    # --- Snapshots ---
+    def snapshot(self) -> dict:
+        """Retorna entradas, salida y flags de la ALU como enteros"""
+        return {
+            'a': self.__input_a.get_Decimal_value(),
+            'b': self.__input_b.get_Decimal_value(),
+            'aluop': self.__aluop.get_Decimal_value(),
+            'modo_funcion': self.__modo_funcion.get_Decimal_value(),
+            'output': self.__output.get_Decimal_value(),
+            'carry': self.__carry_out.get_value(),
+            'zero': self.__zero_flag.get_value(),
+            'negative': self.__negative_flag.get_value(),
+        }
+    
+    def restore(self, state: dict):
+        """Restaura un snapshot de la ALU (sin volver a ejecutar la operación)"""
+        self.__input_a = Bus(16, state['a'])
+        self.__input_b = Bus(16, state['b'])
+        self.__aluop = Bus(2, state['aluop'])
+        self.__modo_funcion = Bus(3, state['modo_funcion'])
+        self.__output = Bus(16, state['output'])
+        self.__carry_out = Bit(state['carry'])
+        self.__zero_flag = Bit(state['zero'])
+        self.__negative_flag = Bit(state['negative'])
+    
     def __str__(self):
         hex_output = self.__output.get_Hexadecimal_value()
         return f"ALU(Out={hex_output}, Z={self.__zero_flag}, C={self.__carry_out}, N={self.__negative_flag})"
\ No newline at end of file
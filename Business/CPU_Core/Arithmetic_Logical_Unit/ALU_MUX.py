@@ -8,9 +8,17 @@ class ALU_MUX:
     Multiplexor principal de la ALU.
     Selecciona entre las 3 unidades según ALUop[0:1]
     Mapeo: 00=Aritmética, 01=Lógica, 10=Desplazamiento
+    
+    Con lazy=True no recorre los 16 MUX3to1: copia directamente la entrada
+    seleccionada (11 produce 0, igual que las compuertas).
     """
     
-    def __init__(self):
+    # Entrada elegida por cada valor de ALUop (None = entrada no usada)
+    SELECTION = (0, 1, 2, None)
+    
+    def __init__(self, lazy: bool = False):
+        self.__lazy = lazy
+        
         # Entradas de las tres unidades
         self.__Input_Aritmetica = Bus(16)      # Resultado Unidad Aritmética
         self.__Input_Logica = Bus(16)          # Resultado Unidad Lógica
@@ -50,8 +58,18 @@ class ALU_MUX:
     def get_output(self) -> Bus:
         return self.__Output
     
+    def get_selected(self):
+        """Índice de la entrada elegida (0=Aritmética, 1=Lógica, 2=Desplazamiento) o None"""
+        return self.SELECTION[self.__Input_Select.get_Decimal_value()]
+    
     # --- Método principal de cálculo ---
     def calculate(self) -> Bus:
+        if self.__lazy:
+            selected = self.get_selected()
+            inputs = (self.__Input_Aritmetica, self.__Input_Logica, self.__Input_Desplazamiento)
+            self.__Output.set_Binary_value(0 if selected is None else inputs[selected].get_Decimal_value())
+            return self.__Output
+        
         # Para cada bit del bus (0 a 15)
         for bit_index in range(16):
             # Obtener el MUX correspondiente a este bit
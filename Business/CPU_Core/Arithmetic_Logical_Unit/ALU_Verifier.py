@@ -0,0 +1,250 @@
+# Business/CPU_Core/Arithmetic_Logical_Unit/ALU_Verifier.py
+"""
+Verificación exhaustiva de la ALU de compuertas mediante simulación bitsliced.
+
+La netlist compilada de la ALU (ALU.get_sliced_netlist) se evalúa con un
+entero de Python por cable, donde el bit j corresponde al vector de prueba
+j: una sola pasada calcula 2^chunk_bits pares (A, B) a la vez. La
+referencia es Functional_ALU.compute evaluada con NumPy sobre los mismos
+vectores. Con chunk_bits=16 una pasada cubre los 65536 valores de A para un
+B fijo, y las 2^32 combinaciones de una operación se recorren en 65536
+pasadas.
+
+Vector j del espacio completo: A = j & 0xFFFF, B = j >> 16.
+
+Uso desde consola:
+    python -m Business.CPU_Core.Arithmetic_Logical_Unit.ALU_Verifier --ops 00:001
+    python -m Business.CPU_Core.Arithmetic_Logical_Unit.ALU_Verifier --all --workers 8
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .ALU import ALU
+from .Functional_ALU import Functional_ALU
+
+
+class ALU_Verifier:
+    """Compara la netlist de compuertas contra Functional_ALU por bloques de vectores"""
+
+    SPACE = 1 << 32      # Todas las combinaciones (A, B) de 16 bits
+    MASK = 0xFFFF
+
+    def __init__(self, chunk_bits: int = 16):
+        if not 1 <= chunk_bits <= 24:
+            raise ValueError("chunk_bits debe estar entre 1 y 24")
+        self.chunk_bits = chunk_bits
+        self.chunk_size = 1 << chunk_bits
+        self.__ones = (1 << self.chunk_size) - 1
+
+        # Índices locales del bloque y patrones de las posiciones que varían dentro de él
+        self.__index = np.arange(self.chunk_size, dtype=np.uint32)
+        self.__patterns = [self.__pack(((self.__index >> p) & 1).astype(np.uint8))
+                           for p in range(chunk_bits)]
+
+    # --- Conversión entre arreglos y cortes ---
+    @staticmethod
+    def __pack(bits) -> int:
+        """Arreglo de 0/1 (uno por vector) -> entero con el bit j = vector j"""
+        return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+    def __input_slices(self, base: int) -> Tuple[List[int], List[int]]:
+        """Cortes de A y B (índice 0 = LSB) para los vectores [base, base + chunk_size)"""
+        slices = []
+        for p in range(32):
+            if p < self.chunk_bits:
+                slices.append(self.__patterns[p])
+            else:
+                slices.append(self.__ones if (base >> p) & 1 else 0)
+        return slices[:16], slices[16:]
+
+    # --- Referencia vectorial ---
+    @classmethod
+    def reference(cls, a, b, aluop: int, modo_funcion: int):
+        """
+        Versión NumPy de Functional_ALU.compute: (resultado, carry) para
+        arreglos uint32 de operandos.
+        """
+        mask = cls.MASK
+
+        if modo_funcion & 1:
+            total = a + (~b & mask) + 1
+        else:
+            total = a + b
+        carry = total >> 16
+
+        if aluop == 0b00:
+            result = total & mask
+        elif aluop == 0b01:
+            logic = modo_funcion & 0b11
+            if logic == 0b00:
+                result = a & b
+            elif logic == 0b01:
+                result = a | b
+            elif logic == 0b10:
+                result = a ^ b
+            else:
+                result = ~a & mask
+        elif aluop == 0b10:
+            result = cls.__shift(a, b & 0xF, modo_funcion)
+        else:
+            result = np.zeros_like(a)
+
+        return result & mask, carry
+
+    @classmethod
+    def __shift(cls, a, amount, modo: int):
+        mask = cls.MASK
+
+        if modo == 0b000:  # LSL
+            return (a << amount) & mask
+        if modo == 0b001:  # ASR
+            signed = a.astype(np.int64) - ((a & 0x8000).astype(np.int64) << 1)
+            return (signed >> amount).astype(np.uint32) & mask
+        if modo == 0b100:  # LSR
+            return a >> amount
+        if modo == 0b010 or modo == 0b011:
+            # ROL/ROR: 4 etapas (1, 2, 4, 8) con relleno desde A original
+            value = a
+            for stage in range(4):
+                k = 1 << stage
+                if modo == 0b010:
+                    shifted = ((value << k) & mask) | (a >> (16 - k))
+                else:
+                    shifted = (value >> k) | ((a & ((1 << k) - 1)) << (16 - k))
+                value = np.where((amount >> stage) & 1, shifted, value)
+            return value
+        return np.zeros_like(a)
+
+    def check_reference(self, aluop: int, modo_funcion: int, samples: int = 256, seed: int = 0):
+        """Contrasta la referencia NumPy con Functional_ALU.compute en una muestra"""
+        rng = np.random.default_rng(seed)
+        a = rng.integers(0, 1 << 16, samples, dtype=np.uint32)
+        b = rng.integers(0, 1 << 16, samples, dtype=np.uint32)
+        result, carry = self.reference(a, b, aluop, modo_funcion)
+        for i in range(samples):
+            expected = Functional_ALU.compute(int(a[i]), int(b[i]), aluop, modo_funcion)
+            if (int(result[i]), int(carry[i])) != expected[:2]:
+                raise ValueError(f"Referencia NumPy difiere de Functional_ALU en "
+                                 f"A=0x{int(a[i]):04X} B=0x{int(b[i]):04X}")
+
+    # --- Verificación ---
+    def verify_chunk(self, aluop: int, modo_funcion: int, base: int) -> Tuple[int, Optional[int]]:
+        """
+        Verifica los vectores [base, base + chunk_size).
+        Retorna (número de diferencias, primer vector distinto o None).
+        """
+        netlist = ALU.get_sliced_netlist(aluop, modo_funcion)
+        a_slices, b_slices = self.__input_slices(base)
+        result, carry = netlist(a_slices, b_slices, self.__ones)
+
+        vectors = self.__index + np.uint32(base)
+        expected, expected_carry = self.reference(vectors & self.MASK, vectors >> 16, aluop, modo_funcion)
+
+        # Matriz (vector, bit) a partir de los bytes little-endian del resultado
+        words = expected.astype('<u2').view(np.uint8).reshape(-1, 2)
+        bits = np.unpackbits(words, axis=1, bitorder='little')
+        packed = np.ascontiguousarray(np.packbits(bits, axis=0, bitorder='little').T)
+
+        diff = carry[0] ^ self.__pack(expected_carry.astype(np.uint8))
+        for k in range(16):
+            diff |= result[k] ^ int.from_bytes(packed[k].tobytes(), 'little')
+
+        if diff == 0:
+            return 0, None
+        return bin(diff).count('1'), base + (diff & -diff).bit_length() - 1
+
+    def verify(self, aluop: int, modo_funcion: int, start: int = 0,
+               count: int = SPACE) -> Dict[str, Any]:
+        """
+        Verifica `count` vectores a partir de `start` (múltiplos de chunk_size)
+        para una combinación ALUop/ModoFunción.
+        """
+        if start % self.chunk_size or count % self.chunk_size:
+            raise ValueError(f"start y count deben ser múltiplos de {self.chunk_size}")
+        if start < 0 or start + count > self.SPACE:
+            raise ValueError("Rango de vectores fuera de [0, 2^32)")
+
+        self.check_reference(aluop, modo_funcion)
+
+        began = time.perf_counter()
+        mismatches = 0
+        first = None
+        for base in range(start, start + count, self.chunk_size):
+            found, vector = self.verify_chunk(aluop, modo_funcion, base)
+            if found:
+                mismatches += found
+                if first is None:
+                    first = vector
+
+        report = {
+            'aluop': aluop,
+            'modo_funcion': modo_funcion,
+            'start': start,
+            'vectors': count,
+            'mismatches': mismatches,
+            'first_mismatch': None,
+            'seconds': round(time.perf_counter() - began, 3),
+        }
+        if first is not None:
+            report['first_mismatch'] = {'a': first & self.MASK, 'b': first >> 16}
+        return report
+
+
+def _verify_range(args: Tuple[int, int, int, int, int]) -> Dict[str, Any]:
+    """Trabajo de un proceso: (aluop, modo, start, count, chunk_bits)"""
+    aluop, modo_funcion, start, count, chunk_bits = args
+    return ALU_Verifier(chunk_bits).verify(aluop, modo_funcion, start, count)
+
+
+def _parse_op(text: str) -> Tuple[int, int]:
+    aluop, modo = text.split(':')
+    return int(aluop, 2), int(modo, 2)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m Business.CPU_Core.Arithmetic_Logical_Unit.ALU_Verifier",
+        description="Verifica la ALU de compuertas contra Functional_ALU con simulación bitsliced")
+    parser.add_argument('--ops', nargs='*', default=[], help="Operaciones ALUop:Modo en binario (ej. 00:001)")
+    parser.add_argument('--all', action='store_true', help="Las 32 combinaciones ALUop/ModoFunción")
+    parser.add_argument('--vectors', type=int, default=ALU_Verifier.SPACE, help="Vectores por operación (por defecto 2^32)")
+    parser.add_argument('--chunk-bits', type=int, default=16, help="log2 de vectores por pasada")
+    parser.add_argument('--workers', type=int, default=1, help="Procesos")
+    args = parser.parse_args(argv)
+
+    ops = [(aluop, modo) for aluop in range(4) for modo in range(8)] if args.all else [_parse_op(o) for o in args.ops]
+    if not ops:
+        parser.error("indique --ops o --all")
+
+    chunk = 1 << args.chunk_bits
+    if args.vectors % chunk or not 0 < args.vectors <= ALU_Verifier.SPACE:
+        parser.error(f"--vectors debe ser múltiplo de {chunk} y no mayor que 2^32")
+
+    # Repartir el rango de cada operación entre los procesos
+    per_worker = -(-args.vectors // chunk // args.workers) * chunk
+    tasks = [(aluop, modo, start, min(per_worker, args.vectors - start), args.chunk_bits)
+             for aluop, modo in ops for start in range(0, args.vectors, per_worker)]
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(_verify_range, tasks))
+
+    for aluop, modo in ops:
+        reports = [r for r in results if (r['aluop'], r['modo_funcion']) == (aluop, modo)]
+        mismatches = sum(r['mismatches'] for r in reports)
+        first = next((r['first_mismatch'] for r in reports if r['first_mismatch']), None)
+        seconds = max(r['seconds'] for r in reports)
+        status = "OK" if mismatches == 0 else f"{mismatches} diferencias, primera A=0x{first['a']:04X} B=0x{first['b']:04X}"
+        print(f"ALUop={aluop:02b} Modo={modo:03b}: {args.vectors} vectores en {seconds:.1f}s -> {status}")
+        failed += 1 if mismatches else 0
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
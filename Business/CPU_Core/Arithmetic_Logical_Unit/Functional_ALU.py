@@ -0,0 +1,193 @@
+# Business/CPU_Core/Arithmetic_Logical_Unit/Functional_ALU.py
+from Business.Basic_Components.Bus import Bus
+from Business.Basic_Components.Bit import Bit
+
+class Functional_ALU:
+    """
+    ALU funcional (motor rápido).
+    Misma interfaz y mismos resultados/flags que ALU, pero calculados con
+    aritmética entera en lugar de recorrer las compuertas.
+
+    Reproduce el comportamiento exacto del circuito:
+    - La unidad aritmética siempre se evalúa, así que el Carry sale de
+      A + B (ModoFunción bit0 = 0) o A + NOT B + 1 (bit0 = 1) sin importar ALUop.
+    - Desplazamiento: 000=LSL, 001=ASR, 010=ROL, 011=ROR, 100=LSR, resto = 0.
+    - ROL/ROR rellenan cada etapa del barrel shifter con bits de la entrada
+      original A (igual que los motores ROL.py/ROR.py).
+    """
+
+    MASK = 0xFFFF
+
+    def __init__(self):
+        # Entradas
+        self.__input_a = Bus(16)
+        self.__input_b = Bus(16)
+        self.__aluop = Bus(2)
+        self.__modo_funcion = Bus(3)
+
+        # Salidas
+        self.__output = Bus(16)
+        self.__carry_out = Bit(0)
+        self.__zero_flag = Bit(0)
+        self.__negative_flag = Bit(0)
+
+    # --- Setters para configuración ---
+    def set_input_a(self, bus: Bus):
+        if bus.width != 16:
+            raise ValueError("El bus A debe ser de 16 bits")
+        self.__input_a = bus
+
+    def set_input_b(self, bus: Bus):
+        if bus.width != 16:
+            raise ValueError("El bus B debe ser de 16 bits")
+        self.__input_b = bus
+
+    def set_aluop(self, bus: Bus):
+        if bus.width != 2:
+            raise ValueError("ALUop debe ser de 2 bits")
+        self.__aluop = bus
+
+    def set_modo_funcion(self, bus: Bus):
+        if bus.width != 3:
+            raise ValueError("ModoFunción debe ser de 3 bits")
+        self.__modo_funcion = bus
+
+    # --- Getters para resultados ---
+    def get_output(self) -> Bus:
+        return self.__output
+
+    def get_carry_out(self) -> Bit:
+        return self.__carry_out
+
+    def get_zero_flag(self) -> Bit:
+        return self.__zero_flag
+
+    def get_negative_flag(self) -> Bit:
+        return self.__negative_flag
+
+    # --- Núcleo entero ---
+    @classmethod
+    def compute(cls, a: int, b: int, aluop: int, modo_funcion: int):
+        """
+        Calcula (resultado, C, Z, N) para entradas enteras.
+        No modifica el estado de la ALU.
+        """
+        mask = cls.MASK
+
+        # Unidad aritmética (siempre activa: de aquí sale el Carry)
+        if modo_funcion & 1:
+            total = a + (~b & mask) + 1  # SUB: A + NOT B + 1
+        else:
+            total = a + b                # ADD
+        carry = total >> 16
+
+        if aluop == 0b00:
+            result = total & mask
+        elif aluop == 0b01:
+            result = cls.__logic(a, b, modo_funcion & 0b11)
+        elif aluop == 0b10:
+            result = cls.__shift(a, b & 0xF, modo_funcion)
+        else:
+            result = 0  # ALUop 11: entrada no usada del MUX
+
+        return result, carry, 1 if result == 0 else 0, result >> 15
+
+    @classmethod
+    def __logic(cls, a: int, b: int, modo: int) -> int:
+        # 00=AND, 01=OR, 10=XOR, 11=NOT (unaria sobre A)
+        if modo == 0b00:
+            return a & b
+        if modo == 0b01:
+            return a | b
+        if modo == 0b10:
+            return a ^ b
+        return ~a & cls.MASK
+
+    @classmethod
+    def __shift(cls, a: int, amount: int, modo: int) -> int:
+        mask = cls.MASK
+
+        if modo == 0b000:  # LSL
+            return (a << amount) & mask
+        if modo == 0b001:  # ASR
+            if a & 0x8000:
+                return ((a | ~mask) >> amount) & mask
+            return a >> amount
+        if modo == 0b100:  # LSR
+            return a >> amount
+        if modo == 0b010 or modo == 0b011:
+            # ROL/ROR: 4 etapas (1, 2, 4, 8) con relleno desde A original
+            value = a
+            for stage in range(4):
+                if (amount >> stage) & 1:
+                    k = 1 << stage
+                    if modo == 0b010:
+                        value = ((value << k) & mask) | (a >> (16 - k))
+                    else:
+                        value = (value >> k) | ((a & ((1 << k) - 1)) << (16 - k))
+            return value
+        return 0  # 101-111: entradas del MUX en 0
+
+    # --- Método principal de ejecución ---
+    def execute(self) -> Bus:
+        """
+        Ejecuta la operación completa según ALUop y ModoFunción.
+        Actualiza flags y retorna el resultado.
+        """
+        result, carry, zero, negative = self.compute(
+            self.__input_a.get_Decimal_value(),
+            self.__input_b.get_Decimal_value(),
+            self.__aluop.get_Decimal_value(),
+            self.__modo_funcion.get_Decimal_value()
+        )
+
+        self.__output.set_Binary_value(result)
+        self.__carry_out.set_value(carry)
+        self.__zero_flag.set_value(zero)
+        self.__negative_flag.set_value(negative)
+
+        return self.__output
+
+    # --- Método conveniente para usar con señales directas ---
+    def execute_with_signals(self, a: int, b: int, aluop: int, modo_funcion: int) -> int:
+        """
+        Igual que ALU.execute_with_signals pero sin construir buses de entrada.
+        Retorna resultado decimal.
+        """
+        result, carry, zero, negative = self.compute(a, b, aluop, modo_funcion)
+
+        self.__output.set_Binary_value(result)
+        self.__carry_out.set_value(carry)
+        self.__zero_flag.set_value(zero)
+        self.__negative_flag.set_value(negative)
+
+        return result
+
+    # --- Snapshots ---
+    def snapshot(self) -> dict:
+        """Retorna entradas, salida y flags de la ALU como enteros"""
+        return {
+            'a': self.__input_a.get_Decimal_value(),
+            'b': self.__input_b.get_Decimal_value(),
+            'aluop': self.__aluop.get_Decimal_value(),
+            'modo_funcion': self.__modo_funcion.get_Decimal_value(),
+            'output': self.__output.get_Decimal_value(),
+            'carry': self.__carry_out.get_value(),
+            'zero': self.__zero_flag.get_value(),
+            'negative': self.__negative_flag.get_value(),
+        }
+
+    def restore(self, state: dict):
+        """Restaura un snapshot de la ALU (sin volver a ejecutar la operación)"""
+        self.__input_a = Bus(16, state['a'])
+        self.__input_b = Bus(16, state['b'])
+        self.__aluop = Bus(2, state['aluop'])
+        self.__modo_funcion = Bus(3, state['modo_funcion'])
+        self.__output = Bus(16, state['output'])
+        self.__carry_out = Bit(state['carry'])
+        self.__zero_flag = Bit(state['zero'])
+        self.__negative_flag = Bit(state['negative'])
+
+    def __str__(self):
+        hex_output = self.__output.get_Hexadecimal_value()
+        return f"Functional_ALU(Out={hex_output}, Z={self.__zero_flag}, C={self.__carry_out}, N={self.__negative_flag})"
@@ -4,7 +4,10 @@ from Business.Basic_Components.MUX4to1 import MUX4to1
 
 class MUX:
 
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        # Con lazy=True copia la entrada seleccionada sin recorrer los MUX4to1
+        self.__lazy = lazy
+        
         # Entradas de resultados de operaciones lógicas
         self.__Input_AND = Bus(16)   # AND gate results
         self.__Input_OR = Bus(16)    # OR gate results  
@@ -54,12 +57,21 @@ class MUX:
     def get_output(self) -> Bus:
         return self.__Output
     
+    def get_selected(self) -> int:
+        """Operación elegida: 0=AND, 1=OR, 2=XOR, 3=NOT"""
+        return self.__Input_Select.get_Decimal_value()
+    
     # --- Método principal de cálculo ---
     def calculate(self) -> Bus:
         """
         Calcula la salida seleccionando la operación lógica adecuada.
         Retorna un Bus de 16 bits con el resultado.
         """
+        if self.__lazy:
+            inputs = (self.__Input_AND, self.__Input_OR, self.__Input_XOR, self.__Input_NOT)
+            self.__Output.set_Binary_value(inputs[self.get_selected()].get_Decimal_value())
+            return self.__Output
+        
         # Para cada bit del bus (0 a 15)
         for bit_index in range(16):
             # Obtener el MUX correspondiente a este bit
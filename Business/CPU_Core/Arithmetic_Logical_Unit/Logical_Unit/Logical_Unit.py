@@ -8,7 +8,10 @@ from Business.Basic_Components.Logic_Gates.NOT_Gate import NOT_Gate
 
 class Logical_Unit:
     
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        # Con lazy=True solo se evalúan las compuertas de la operación que indica Mode
+        self.__lazy = lazy
+        
         # Gates arrays (16 de cada una, una por bit)
         self.__AND_Gates = [AND_Gate() for _ in range(16)]
         self.__OR_Gates = [OR_Gate() for _ in range(16)]
@@ -30,7 +33,7 @@ class Logical_Unit:
         self.__Mode = Bus(2)  
 
         # Mux interno
-        self.__MUX = MUX()
+        self.__MUX = MUX(lazy)
     
     # --- Setters ---
     def set_Input_A(self, Input: Bus):
@@ -54,43 +57,49 @@ class Logical_Unit:
 
     # --- Método principal de cálculo ---
     def Calculate(self) -> Bus:
-        # Calcular todas las operaciones en paralelo
+        # Calcular todas las operaciones en paralelo (o solo la seleccionada en modo lazy)
+        self.__MUX.set_select(self.__Mode)
+        evaluate_all = not self.__lazy
+        selected = self.__MUX.get_selected()
         
         # Puertas AND (bit a bit)
-        for i in range(16):
-            # Conectar entradas
-            self.__AND_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
-            self.__AND_Gates[i].connect_input(self.__Input_B.get_Line_bit(i), 1)
-            # Calcular y guardar resultado
-            self.__AND_Gates[i].calculate()
-            self.__AND_Output.set_Line_bit(i, self.__AND_Gates[i].get_output())
+        if evaluate_all or selected == 0:
+            for i in range(16):
+                # Conectar entradas
+                self.__AND_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
+                self.__AND_Gates[i].connect_input(self.__Input_B.get_Line_bit(i), 1)
+                # Calcular y guardar resultado
+                self.__AND_Gates[i].calculate()
+                self.__AND_Output.set_Line_bit(i, self.__AND_Gates[i].get_output())
         
         # Puertas OR (bit a bit)
-        for i in range(16):
-            self.__OR_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
-            self.__OR_Gates[i].connect_input(self.__Input_B.get_Line_bit(i), 1)
-            self.__OR_Gates[i].calculate()
-            self.__OR_Output.set_Line_bit(i, self.__OR_Gates[i].get_output())
+        if evaluate_all or selected == 1:
+            for i in range(16):
+                self.__OR_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
+                self.__OR_Gates[i].connect_input(self.__Input_B.get_Line_bit(i), 1)
+                self.__OR_Gates[i].calculate()
+                self.__OR_Output.set_Line_bit(i, self.__OR_Gates[i].get_output())
         
         # Puertas XOR (bit a bit)
-        for i in range(16):
-            self.__XOR_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
-            self.__XOR_Gates[i].connect_input(self.__Input_B.get_Line_bit(i), 1)
-            self.__XOR_Gates[i].calculate()
-            self.__XOR_Output.set_Line_bit(i, self.__XOR_Gates[i].get_output())
+        if evaluate_all or selected == 2:
+            for i in range(16):
+                self.__XOR_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
+                self.__XOR_Gates[i].connect_input(self.__Input_B.get_Line_bit(i), 1)
+                self.__XOR_Gates[i].calculate()
+                self.__XOR_Output.set_Line_bit(i, self.__XOR_Gates[i].get_output())
         
         # Puertas NOT (operación unaria, solo usa Input_A)
-        for i in range(16):
-            self.__NOT_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
-            self.__NOT_Gates[i].calculate()
-            self.__NOT_Output.set_Line_bit(i, self.__NOT_Gates[i].get_output())
+        if evaluate_all or selected == 3:
+            for i in range(16):
+                self.__NOT_Gates[i].connect_input(self.__Input_A.get_Line_bit(i), 0)
+                self.__NOT_Gates[i].calculate()
+                self.__NOT_Output.set_Line_bit(i, self.__NOT_Gates[i].get_output())
         
         # Configurar el multiplexor interno
         self.__MUX.set_input_AND(self.__AND_Output)
         self.__MUX.set_input_OR(self.__OR_Output)
         self.__MUX.set_input_XOR(self.__XOR_Output)
         self.__MUX.set_input_NOT(self.__NOT_Output)
-        self.__MUX.set_select(self.__Mode)
         
         # Obtener resultado seleccionado
         self.__Output = self.__MUX.calculate()
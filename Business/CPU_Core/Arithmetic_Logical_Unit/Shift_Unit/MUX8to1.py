@@ -9,7 +9,10 @@ from typing import List
 class MUX8to1:
     
     # Constructor
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        
+        # Con lazy=True solo se lee la entrada de datos seleccionada (sin minterms)
+        self.__lazy = lazy
         
         # Inputs: Input se asume que es un Bus de 8 Bits (D0 a D7)
         self.__Input = Bus(8)
@@ -44,9 +47,17 @@ class MUX8to1:
         self.__S[1] = S_bus.get_Line_bit(1) # S1
         self.__S[2] = S_bus.get_Line_bit(0) # S2 (MSB)
     
+    def get_selected(self) -> int:
+        """Índice de la entrada de datos seleccionada (S2 S1 S0)"""
+        return (self.__S[2].get_value() << 2) | (self.__S[1].get_value() << 1) | self.__S[0].get_value()
+    
     # --- Método Principal de Cálculo ---
     def Calculate(self) -> Bit:
         
+        if self.__lazy:
+            self.__Output = Bit(self.__Input.get_Line_bit(self.get_selected()).get_value())
+            return self.__Output
+        
         # Bits de control
         S0 = self.__S[0]
         S1 = self.__S[1]
@@ -4,7 +4,10 @@ from Business.CPU_Core.Arithmetic_Logical_Unit.Shift_Unit.MUX8to1 import MUX8to1
 
 class Multiplex:
     # Constructor
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        # Con lazy=True copia la entrada seleccionada sin recorrer los MUX8to1
+        self.__lazy = lazy
+        
         # Inputs
         self.__Input_ASR = Bus(16)
         self.__Input_LSL = Bus(16)
@@ -55,9 +58,21 @@ class Multiplex:
     def get_output(self) -> Bus:
         return self.__Output
     
+    def get_selected(self):
+        """Desplazador elegido ('LSL', 'ASR', 'ROL', 'ROR', 'LSR') o None (101-111)"""
+        select = self.__Input_Select.get_Decimal_value()
+        return ('LSL', 'ASR', 'ROL', 'ROR', 'LSR')[select] if select < 5 else None
+    
     # --- Método de cálculo principal ---
     def calculate(self):
         
+        if self.__lazy:
+            inputs = {'LSL': self.__Input_LSL, 'ASR': self.__Input_ASR, 'ROL': self.__Input_ROL,
+                      'ROR': self.__Input_ROR, 'LSR': self.__Input_LSR}
+            selected = self.get_selected()
+            self.__Output.set_Binary_value(0 if selected is None else inputs[selected].get_Decimal_value())
+            return
+        
         for i in range(16):
             
             data_bus = Bus(8)
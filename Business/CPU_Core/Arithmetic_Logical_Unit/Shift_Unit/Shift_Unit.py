@@ -9,7 +9,10 @@ from Business.Basic_Components.Bus import Bus
 class Shift_Unit:
     
     # Constructor
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        # Con lazy=True solo se calcula el desplazador que selecciona Operation_Bus
+        self.__lazy = lazy
+        
         # Inputs
         self.__Input_A = Bus(16)
         self.__Input_B = Bus(16)
@@ -23,7 +26,7 @@ class Shift_Unit:
         self.__ROR = ROR()
         
         # Multiplex
-        self.__Multiplex = Multiplex()
+        self.__Multiplex = Multiplex(lazy)
 
         # Outputs
         self.__ASR_Output = Bus(16)
@@ -51,6 +54,9 @@ class Shift_Unit:
     
     # --- Método principal de cálculo ---
     def calculate(self) -> Bus:
+        if self.__lazy:
+            return self.__calculate_selected()
+        
         # Conectar Input A
         self.__ASR.set_Input_A(self.__Input_A)
         self.__LSL.set_Input_A(self.__Input_A)
@@ -91,4 +97,37 @@ class Shift_Unit:
         self.__Multiplex.calculate()
         self.__Output = self.__Multiplex.get_output()
 
-        return self.__Output
\ No newline at end of file
+        return self.__Output
+    
+    def __calculate_selected(self) -> Bus:
+        """Modo lazy: el Multiplex decide qué desplazador se evalúa"""
+        self.__Multiplex.set_select(self.__Operation_Bus)
+        selected = self.__Multiplex.get_selected()
+        
+        if selected is not None:
+            shifter = {'ASR': self.__ASR, 'LSL': self.__LSL, 'LSR': self.__LSR,
+                       'ROL': self.__ROL, 'ROR': self.__ROR}[selected]
+            shifter.set_Input_A(self.__Input_A)
+            shifter.set_Input_B(self.__Input_B)
+            shifter.Calculate()
+            
+            output = shifter.get_Output()
+            if selected == 'ASR':
+                self.__ASR_Output = output
+                self.__Multiplex.set_input_ASR(output)
+            elif selected == 'LSL':
+                self.__LSL_Output = output
+                self.__Multiplex.set_input_LSL(output)
+            elif selected == 'LSR':
+                self.__LSR_Output = output
+                self.__Multiplex.set_input_LSR(output)
+            elif selected == 'ROL':
+                self.__ROL_Output = output
+                self.__Multiplex.set_input_ROL(output)
+            else:
+                self.__ROR_Output = output
+                self.__Multiplex.set_input_ROR(output)
+        
+        self.__Multiplex.calculate()
+        self.__Output = self.__Multiplex.get_output()
+        return self.__Output
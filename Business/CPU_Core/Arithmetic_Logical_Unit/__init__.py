@@ -1,4 +1,12 @@
 from .ALU import ALU
 from .ALU_MUX import ALU_MUX
+from .Functional_ALU import Functional_ALU
 
-__all__ = ['ALU', 'ALU_MUX']
\ No newline at end of file
+
+def get_ALU_Verifier():
+    """Importa y retorna ALU_Verifier (carga NumPy solo cuando se usa)"""
+    from .ALU_Verifier import ALU_Verifier
+    return ALU_Verifier
+
+
+__all__ = ['ALU', 'ALU_MUX', 'Functional_ALU', 'get_ALU_Verifier']
@@ -0,0 +1,409 @@
+# Business/CPU_Core/Block_Cache.py
+from Business.Basic_Components.Bus import Bus
+from Business.CPU_Core.Arithmetic_Logical_Unit.Functional_ALU import Functional_ALU
+
+
+class Translated_Block:
+    """Bloque básico traducido: función Python que aplica todos sus efectos"""
+
+    def __init__(self, start: int, addresses, run, source: str, words=()):
+        self.start = start
+        self.addresses = tuple(addresses)  # Direcciones de sus instrucciones, en orden
+        self.words = tuple(words)          # Palabras de instrucción (perfilador)
+        self.length = len(self.addresses)  # Instrucciones (= ciclos) del bloque
+        self.run = run                     # run(cpu)
+        self.source = source               # Código generado (depuración)
+
+    def __str__(self):
+        return f"Translated_Block(0x{self.start:04X}, {self.length} inst)"
+
+
+class Block_Cache:
+    """
+    Caché de traducción de bloques básicos para la CPU.
+
+    Un bloque empieza en un PC y sigue en secuencia hasta JZ/HALT (incluidos);
+    los JUMP incondicionales se siguen hasta su destino mientras este no
+    pertenezca ya al bloque. Se traduce una vez a una función Python de código lineal que
+    trabaja con enteros locales y escribe los registros al final, y se guarda
+    por dirección de inicio.
+
+    La RAM avisa de cada escritura (add_write_listener); cualquier bloque cuyo
+    rango toque la dirección escrita se descarta y se vuelve a traducir en la
+    próxima visita.
+
+    Con el perfilador de la CPU activo, cada bloque incrementa su contador
+    de ejecuciones y, si termina en JZ, el de tomado/no tomado.
+
+    Los accesos a memoria van por el puerto del SystemBus de la CPU. Sin
+    arbitraje, cada dirección (fija: el ISA solo tiene direccionamiento
+    directo) se resuelve a su dispositivo al traducir y el bloque cuenta
+    todos sus accesos, fetch incluidos, con una suma por ejecución. El bus
+    avisa cuando cambia su mapa o sus maestros y los bloques se descartan.
+    """
+
+    MAX_BLOCK_LENGTH = 64
+
+    # Opcodes de control de flujo
+    STORE, JUMP, JZ, HALT = 0x2, 0x7, 0x8, 0xF
+
+    # opcode -> (ALUop, ModoFunción), igual que la tabla de despacho de la CPU
+    ALU_OPS = {
+        0x3: (0b00, 0b000),  # ADD
+        0x4: (0b00, 0b001),  # SUB
+        0xA: (0b01, 0b000),  # AND
+        0xB: (0b01, 0b001),  # OR
+        0xC: (0b01, 0b010),  # XOR
+    }
+    SHIFT_OPS = {
+        0xD: (0b10, 0b000),  # SHL
+        0xE: (0b10, 0b001),  # SHR
+    }
+
+    # Cómo se leen y escriben los registros que el código generado mantiene en locales
+    REGISTER_LOADS = {
+        'ac': "regs.get_AC().get_Dec_Value()",
+        'hi': "regs.get_HI().get_Dec_Value()",
+        'lo': "regs.get_LO().get_Dec_Value()",
+        'status': "regs.get_STATUS().get_Dec_Value()",
+        'z': "regs.get_FLAG_Z().get_value()",
+        'c': "regs.get_FLAG_C().get_value()",
+        'n': "regs.get_FLAG_N().get_value()",
+    }
+    REGISTER_STORES = {
+        'ac': "regs.set_AC(Bus(16, ac))",
+        'hi': "regs.set_HI(Bus(16, hi))",
+        'lo': "regs.set_LO(Bus(16, lo))",
+        'status': "regs.set_STATUS(Bus(8, status))",
+        'z': "regs.get_FLAG_Z().set_value(z)",
+        'c': "regs.get_FLAG_C().set_value(c)",
+        'n': "regs.get_FLAG_N().set_value(n)",
+    }
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+
+        # inicio -> Translated_Block (None = no traducible, se interpreta)
+        self.__blocks = {}
+        # dirección -> inicios de los bloques que la contienen
+        self.__owners = {}
+
+        # Estadísticas
+        self.hits = 0
+        self.translations = 0
+        self.invalidations = 0
+
+    # --- Consulta ---
+    def lookup(self, pc: int):
+        """Retorna el bloque que empieza en pc (traduciéndolo si hace falta) o None"""
+        blocks = self.__blocks
+        if pc in blocks:
+            block = blocks[pc]
+            if block is not None:
+                self.hits += 1
+            return block
+        return self.__translate(pc)
+
+    # --- Invalidación ---
+    def invalidate(self, start: int, count: int):
+        """Callback de escritura de la RAM: descarta los bloques afectados"""
+        owners = self.__owners
+        if not owners:
+            return
+        for address in range(start, start + count):
+            starts = owners.get(address)
+            if starts:
+                for block_start in list(starts):
+                    self.__discard(block_start)
+
+    def clear(self):
+        """Descarta todos los bloques traducidos"""
+        if self.cpu.profiler is not None:
+            for block in self.__blocks.values():
+                if block is not None:
+                    self.cpu.profiler.remove_block(block)
+        self.__blocks.clear()
+        self.__owners.clear()
+
+    def __discard(self, block_start: int):
+        block = self.__blocks.pop(block_start, None)
+        if block is not None and self.cpu.profiler is not None:
+            self.cpu.profiler.remove_block(block)
+        for address in (block.addresses if block is not None else (block_start,)):
+            starts = self.__owners.get(address)
+            if starts is not None:
+                starts.discard(block_start)
+                if not starts:
+                    del self.__owners[address]
+        self.invalidations += 1
+
+    def __register(self, block_start: int, block):
+        self.__blocks[block_start] = block
+        for address in (block.addresses if block is not None else (block_start,)):
+            self.__owners.setdefault(address, set()).add(block_start)
+
+    # --- Traducción ---
+    def __scan(self, start: int):
+        """Recorre la memoria desde start y retorna [(dirección, palabra, opcode, operando)]"""
+        cpu = self.cpu
+        memory = cpu.memory
+        builtin = cpu._builtin_dispatch
+        dispatch = cpu._dispatch
+
+        instructions = []
+        visited = set()
+        address = start
+        while address < memory.size and len(instructions) < self.MAX_BLOCK_LENGTH:
+            word = memory.read_word(address)
+            opcode = (word >> 12) & 0xF
+            operand = word & 0xFFF
+
+            # Handlers registrados por el usuario: los ejecuta el intérprete
+            if dispatch[opcode] is not builtin[opcode]:
+                break
+
+            instructions.append((address, word, opcode, operand))
+            visited.add(address)
+
+            if opcode == self.JZ or opcode == self.HALT:
+                break
+            if opcode == self.JUMP:
+                if operand in visited:
+                    break
+                address = operand
+            else:
+                address += 1
+
+        # Código automodificable: el bloque termina en el primer STORE que escribe dentro de él
+        for i, (_, _, opcode, operand) in enumerate(instructions):
+            if opcode == self.STORE and operand in visited:
+                del instructions[i + 1:]
+                break
+
+        return instructions
+
+    def __translate(self, start: int):
+        instructions = self.__scan(start)
+        if not instructions:
+            self.__register(start, None)
+            return None
+
+        profiler = self.cpu.profiler
+        namespace = {'Bus': Bus, 'compute': Functional_ALU.compute}
+        source = self.__generate(start, instructions, namespace, profiler is not None)
+        if profiler is not None:
+            namespace.update(runs=profiler.block_runs, taken=profiler.jz_taken, not_taken=profiler.jz_not_taken)
+        exec(compile(source, f"<block 0x{start:04X}>", "exec"), namespace)
+
+        block = Translated_Block(start, [address for address, _, _, _ in instructions], namespace['run'], source,
+                                 [word for _, word, _, _ in instructions])
+        self.__register(start, block)
+        if profiler is not None:
+            profiler.add_block(block)
+        self.translations += 1
+        return block
+
+    def __generate(self, start: int, instructions, namespace: dict, profile: bool = False) -> str:
+        body = []
+        loaded = set()    # locales leídos antes de escribirse (se cargan en el prólogo)
+        written = set()   # locales que hay que volcar a los registros
+        last_alu = None   # (ALUop, ModoFunción) de la última operación de ALU
+        mdr_written = False
+
+        def read(name):
+            if name not in written:
+                loaded.add(name)
+
+        def write(*names):
+            written.update(names)
+
+        # Accesos a memoria: por el puerto (arbitrado) o resueltos al traducir
+        port = self.cpu.port
+        direct = not port.arbitrated
+        bound = {}         # función del dispositivo -> nombre en el namespace
+        tallies = {}       # nombre del contador -> [lecturas, escrituras]
+        bus_accesses = 0
+
+        def bind(function, prefix):
+            if function not in bound:
+                bound[function] = f"{prefix}{len(bound)}"
+                namespace[bound[function]] = function
+            return bound[function]
+
+        def tally(count, reads, writes):
+            entry = tallies.setdefault(bind(count, 'count'), [0, 0])
+            entry[0] += reads
+            entry[1] += writes
+
+        def load(address):
+            nonlocal bus_accesses
+            if not direct:
+                return f"read(0x{address:03X})"
+            bus_accesses += 1
+            read_word, _, count, relative = port.resolve(address)
+            if read_word is None:
+                return "0xFFFF"
+            if count is not None:
+                tally(count, 1, 0)
+            return f"{bind(read_word, 'load')}(0x{relative:03X})"
+
+        def store(address, value):
+            nonlocal bus_accesses
+            if not direct:
+                return f"store(0x{address:03X}, {value})"
+            bus_accesses += 1
+            _, write_word, count, relative = port.resolve(address)
+            if write_word is None:
+                return "pass  # sin mapear"
+            if count is not None:
+                tally(count, 0, 1)
+            return f"{bind(write_word, 'store')}(0x{relative:03X}, {value})"
+
+        for address, word, opcode, operand in instructions:
+            body.append(f"# [{address:04X}] {word:04X}")
+            mdr_written = False
+            pc_expr = f"0x{address + 1:04X}"
+
+            if opcode == 0x1:  # LOAD
+                body.append(f"mar = 0x{operand:03X}")
+                body.append(f"mdr = {load(operand)}")
+                body.append("ac = mdr")
+                write('ac')
+                mdr_written = True
+
+            elif opcode == 0x2:  # STORE
+                read('ac')
+                body.append(f"mar = 0x{operand:03X}")
+                body.append("mdr = ac")
+                body.append(store(operand, "ac"))
+                mdr_written = True
+
+            elif opcode in self.ALU_OPS:
+                aluop, mode = self.ALU_OPS[opcode]
+                read('ac')
+                body.append(f"mar = 0x{operand:03X}")
+                body.append(f"mdr = {load(operand)}")
+                body.append("alu_a = ac")
+                body.append("alu_b = mdr")
+                body.append(f"ac, c, z, n = compute(alu_a, alu_b, {aluop}, {mode})")
+                write('ac', 'c', 'z', 'n')
+                last_alu = (aluop, mode)
+                mdr_written = True
+
+            elif opcode in self.SHIFT_OPS:
+                aluop, mode = self.SHIFT_OPS[opcode]
+                read('ac')
+                body.append("alu_a = ac")
+                body.append(f"alu_b = {operand & 0xF}")
+                body.append(f"ac, c, z, n = compute(alu_a, alu_b, {aluop}, {mode})")
+                write('ac', 'c', 'z', 'n')
+                last_alu = (aluop, mode)
+
+            elif opcode == 0x5:  # MULT
+                read('ac')
+                body.append(f"result = ac * {load(operand)}")
+                body.append("hi = (result >> 16) & 0xFFFF")
+                body.append("lo = result & 0xFFFF")
+                body.append("z = 1 if result == 0 else 0")
+                body.append("n = lo >> 15")
+                body.append("c = 1 if hi != 0 else 0")
+                write('hi', 'lo', 'z', 'n', 'c')
+
+            elif opcode == 0x6:  # DIV
+                # Las dos ramas escriben registros distintos: cargar todos antes
+                for name in ('ac', 'hi', 'lo', 'status', 'z', 'n', 'c'):
+                    read(name)
+                body.append(f"divisor = {load(operand)}")
+                body.append("if divisor == 0:")
+                body.append("    status = 0x01")
+                body.append("    c = 1")
+                body.append("else:")
+                body.append("    hi = ac % divisor")
+                body.append("    lo = ac // divisor")
+                body.append("    z = 1 if lo == 0 else 0")
+                body.append("    n = lo >> 15")
+                write('hi', 'lo', 'status', 'z', 'n', 'c')
+
+            elif opcode == 0x7:  # JUMP
+                pc_expr = f"0x{operand:03X}"
+
+            elif opcode == 0x8:  # JZ
+                read('z')
+                pc_expr = f"0x{operand:03X} if z == 1 else 0x{address + 1:04X}"
+
+            elif opcode == 0x9:  # LOADI
+                body.append(f"ac = 0x{operand:03X}")
+                write('ac')
+
+            elif opcode == 0xF:  # HALT
+                body.append("cpu.running.set_value(0)")
+
+            # NOP (0x0): sin efectos
+
+        last_address, last_word, last_opcode, _ = instructions[-1]
+
+        lines = ["def run(cpu):",
+                 "    regs = cpu.registers"]
+        if not direct:
+            lines.extend(["    port = cpu.port",
+                          "    read = port.read",
+                          "    store = port.write"])
+        for name in sorted(loaded):
+            lines.append(f"    {name} = {self.REGISTER_LOADS[name]}")
+        lines.extend("    " + line for line in body)
+
+        # Epílogo: estado final igual al de ejecutar instrucción por instrucción
+        lines.append(f"    regs.get_PC().set_Value_int({pc_expr})")
+        lines.append(f"    ir = Bus(16, 0x{last_word:04X})")
+        lines.append("    regs.set_IR(ir)")
+        if mdr_written:
+            lines.append("    regs.set_MAR(Bus(16, mar))")
+            lines.append("    regs.set_MDR(Bus(16, mdr))")
+        else:
+            # El fetch deja MAR = PC y MDR = IR (mismo Bus, como en CPU.fetch)
+            lines.append(f"    regs.set_MAR(Bus(16, 0x{last_address:04X}))")
+            lines.append("    regs.set_MDR(ir)")
+        for name in sorted(written):
+            lines.append(f"    {self.REGISTER_STORES[name]}")
+        lines.append(f"    regs.get_OP_TYPE().set_Value_int(0x{last_opcode:X})")
+        if profile:
+            lines.append(f"    runs[0x{start:04X}] += 1")
+            if last_opcode == self.JZ:
+                lines.append("    if z == 1:")
+                lines.append(f"        taken[0x{last_address:04X}] += 1")
+                lines.append("    else:")
+                lines.append(f"        not_taken[0x{last_address:04X}] += 1")
+        # Las instrucciones del bloque no se vuelven a leer: sus fetch se cuentan aquí
+        if direct:
+            for address, _, _, _ in instructions:
+                read_word, _, count, _ = port.resolve(address)
+                if count is not None:
+                    tally(count, 1, 0)
+            namespace['advance'] = port.advance
+            for name, (reads, writes) in sorted(tallies.items()):
+                lines.append(f"    {name}({reads}, {writes})")
+            # Suma los ciclos del bloque y es el punto de arbitraje con otros maestros (DMA)
+            lines.append(f"    advance({bus_accesses + len(instructions)})")
+        else:
+            lines.append(f"    port.fetched(0x{start:04X}, {len(instructions)})")
+        lines.append(f"    cpu.clock_cycle += {len(instructions)}")
+        lines.append(f"    cpu.instructions_executed += {len(instructions)}")
+        lines.append("    cpu.control_unit.load_instruction(ir)")
+        if last_alu is not None:
+            # Deja los latches de la ALU como tras la última operación
+            lines.append(f"    cpu.alu.execute_with_signals(alu_a, alu_b, {last_alu[0]}, {last_alu[1]})")
+
+        return "\n".join(lines) + "\n"
+
+    # --- Estadísticas ---
+    def get_stats(self):
+        """Retorna estadísticas de la caché"""
+        return {
+            'blocks': sum(1 for block in self.__blocks.values() if block is not None),
+            'hits': self.hits,
+            'translations': self.translations,
+            'invalidations': self.invalidations
+        }
+
+    def __len__(self):
+        return len(self.__blocks)
@@ -4,31 +4,185 @@ from Business.Basic_Components.Bus import Bus
 from Business.CPU_Core.Control_Unit.Record_Bank import Record_Bank
 from Business.CPU_Core.Control_Unit.Control_Unit import Control_Unit
 from Business.CPU_Core.Arithmetic_Logical_Unit.ALU import ALU
+from Business.CPU_Core.Arithmetic_Logical_Unit.Functional_ALU import Functional_ALU
 from Business.Memory.SystemBus import SystemBus
 from Business.Memory.RAM import RAM
+from Business.Memory.Cache import Cache_Hierarchy
+from Business.CPU_Core.Trace_Sink import Trace_Sink, Null_Sink
+from Business.CPU_Core.Block_Cache import Block_Cache
+from Business.CPU_Core.Microcode_Engine import Microcode_Engine
+from Business.CPU_Core.Execution_Profiler import Execution_Profiler
+from Business.Basic_Components.Gate_Activity import Gate_Activity
 
 class CPU:
     """Unidad Central de Procesamiento con ISA Estandarizado"""
     
-    def __init__(self, bus: SystemBus):
-        # Componentes principales
-        self.bus = bus
+    # Motores de ejecución de la ALU
+    # 'functional': aritmética entera (rápido, mismos resultados y flags)
+    # 'gate': circuito completo de compuertas (fidelidad de hardware)
+    # 'micro': microprogramado desde la ControlStore (un ciclo de reloj = un micro-paso)
+    ENGINES = ('functional', 'gate', 'micro')
+    
+    # Mnemónicos de la ALU por ALUop y ModoFunción
+    ALU_MNEMONICS = {
+        0b00: ("ADD", "SUB", "MULT", "DIV", "???", "???", "???", "???"),  # Aritmética
+        0b01: ("AND", "OR", "XOR", "NOT", "???", "???", "???", "???"),    # Lógica
+        0b10: ("SHL", "SHR", "ROL", "ROR", "ASR", "???", "???", "???"),   # Desplazamiento
+    }
+    
+    def __init__(self, bus: SystemBus, engine: str = 'functional', trace: Trace_Sink = None,
+                 block_cache: bool = True, alu_cache_size: int = 0):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor '{engine}' no válido. Opciones: {', '.join(self.ENGINES)}")
+        
+        # Traza (por defecto no se formatea ni se imprime nada)
+        self.trace = trace if trace is not None else Null_Sink()
+        
+        # Componentes principales (sin bus, la CPU usa uno propio del que es el único maestro)
+        self.bus = bus if bus is not None else SystemBus()
+        self.engine = engine
         self.registers = Record_Bank()
-        self.alu = ALU()
-        self.control_unit = Control_Unit()
+        # alu_cache_size: caché LRU de resultados de la ALU de compuertas (0 = sin caché)
+        self.alu = ALU(cache_size=alu_cache_size) if engine == 'gate' else Functional_ALU()
+        self.control_unit = Control_Unit(trace=self.trace)
         
         # Estado de la CPU
         self.running = Bit(0)
         self.clock_cycle = 0
         self.instructions_executed = 0
         
-        # Conexión con memoria
+        # Conexión con memoria: todos los accesos pasan por el puerto del SystemBus
         self.memory = None
+        self.port = None
+        
+        # Jerarquía de caché delante del puerto (opcional, ver enable_cache)
+        self.cache = None
+        
+        # Perfilador de ejecución (opcional, ver enable_profiler)
+        self.profiler = None
+        
+        # Monitor de actividad de compuertas (opcional, ver enable_gate_activity)
+        self.gate_activity = None
+        
+        # Tabla de despacho por opcode y caché de decodificación
+        self.block_cache = None
+        self._build_dispatch_table()
+        self._builtin_dispatch = list(self._dispatch)
+        self._builtin_mnemonics = list(self._mnemonics)
+        
+        # Caché de bloques básicos traducidos (solo con el motor funcional)
+        if block_cache and engine == 'functional':
+            self.block_cache = Block_Cache(self)
+        
+        # Secuenciador microprogramado (solo con el motor 'micro')
+        self.microcode = Microcode_Engine(self) if engine == 'micro' else None
         
     def connect_memory(self, memory: RAM):
         """Conecta la memoria a la CPU"""
+        if self.block_cache is not None:
+            if self.memory is not None:
+                self.memory.remove_write_listener(self.block_cache.invalidate)
+            self.block_cache.clear()
+            memory.add_write_listener(self.block_cache.invalidate)
         self.memory = memory
         
+        # La memoria se mapea desde 0 si nadie la conectó al bus
+        if not self.bus.is_connected(memory):
+            self.bus.connect_device(memory, "RAM", (0, memory.size - 1), "slave", verbose=False)
+        if self.port is None:
+            self.port = self.bus.get_port("CPU")
+            # Los bloques traducidos resuelven las direcciones con el mapa del bus
+            if self.block_cache is not None:
+                self.port.add_rebind_listener(self.block_cache.clear)
+        
+        # Los contadores del perfilador cubren la memoria conectada
+        if self.profiler is not None and self.profiler.memory_size != self._pc_space():
+            self.profiler = None
+            self.enable_profiler()
+    
+    def _pc_space(self) -> int:
+        """PCs posibles: la memoria conectada, como mucho lo que cabe en el PC de 16 bits"""
+        if self.memory is None:
+            return Execution_Profiler.ADDRESS_SPACE
+        return min(self.memory.size, 1 << 16)
+    
+    def enable_profiler(self) -> Execution_Profiler:
+        """Activa el perfilador de ejecución (se pone a cero en cada reset)"""
+        if self.profiler is None:
+            self.profiler = Execution_Profiler(self._pc_space())
+            self.profiler.set_custom_opcodes(self._custom_opcodes())
+            # Los bloques traducidos deben regenerarse con sus contadores
+            if self.block_cache is not None:
+                self.block_cache.clear()
+        return self.profiler
+    
+    def disable_profiler(self):
+        """Desactiva el perfilador; el último perfil sigue disponible en el objeto retornado"""
+        profiler = self.profiler
+        if profiler is not None:
+            if self.block_cache is not None:
+                self.block_cache.clear()
+            self.profiler = None
+        return profiler
+    
+    def enable_cache(self, hierarchy: Cache_Hierarchy) -> Cache_Hierarchy:
+        """
+        Interpone una jerarquía de caché entre la CPU y el puerto del bus
+        (se invalida en cada reset). Mientras está activa la CPU ejecuta
+        instrucción a instrucción para atribuir cada acceso a su PC.
+        """
+        if self.port is None:
+            raise ValueError("La caché requiere una memoria conectada (connect_memory)")
+        self.disable_cache()
+        hierarchy.connect(self.port)
+        self.port = self.cache = hierarchy
+        return hierarchy
+    
+    def disable_cache(self):
+        """Quita la jerarquía de caché; sus estadísticas siguen disponibles en el objeto retornado"""
+        hierarchy = self.cache
+        if hierarchy is not None:
+            self.port = hierarchy.disconnect()
+            self.cache = None
+        return hierarchy
+    
+    def enable_gate_activity(self) -> Gate_Activity:
+        """
+        Activa el conteo de evaluaciones y toggles por compuerta, con un
+        contexto por instrucción (su mnemónico). Solo con el motor 'gate':
+        mientras está activo la ALU recorre sus compuertas en lugar de usar
+        la netlist compilada.
+        """
+        if self.engine != 'gate':
+            raise ValueError("La actividad de compuertas requiere el motor 'gate'")
+        if self.gate_activity is None:
+            monitor = Gate_Activity()
+            monitor.register(self.alu, "ALU")
+            monitor.register(self.control_unit, "Control_Unit")
+            self.__alu_compiled = self.alu.is_compiled()
+            self.alu.set_compiled(False)
+            monitor.enable()
+            self.gate_activity = monitor
+        return self.gate_activity
+    
+    def disable_gate_activity(self):
+        """Desactiva el monitor; sus conteos siguen disponibles en el objeto retornado"""
+        monitor = self.gate_activity
+        if monitor is not None:
+            monitor.disable()
+            self.alu.set_compiled(self.__alu_compiled)
+            self.gate_activity = None
+        return monitor
+    
+    def _custom_opcodes(self):
+        """Opcodes cuyo handler no es el del ISA"""
+        return [opcode for opcode in range(16) if self._dispatch[opcode] is not self._builtin_dispatch[opcode]]
+    
+    def set_trace_sink(self, sink: Trace_Sink):
+        """Cambia el destino de la traza de la CPU y de su Unidad de Control"""
+        self.trace = sink
+        self.control_unit.set_trace_sink(sink)
+        
     def reset(self):
         """Resetea la CPU a estado inicial"""
         # Resetear registros usando setters
@@ -62,8 +216,13 @@ class CPU:
         
         # Resetear componentes
         self.control_unit.reset()
+        if self.profiler is not None:
+            self.profiler.reset()
+        if self.cache is not None:
+            self.cache.reset()
         
-        print("CPU: Reset completo")
+        if self.trace.enabled:
+            self.trace.emit("CPU", "CPU: Reset completo")
         
     def fetch(self):
         """Ciclo de fetch simplificado"""
@@ -77,9 +236,8 @@ class CPU:
         self.registers.set_MAR(Bus(16, pc_value))
         
         # Leer memoria
-        if self.memory:
-            data_bus = self.memory.read_direct(pc_value)
-            self.registers.set_MDR(data_bus)
+        if self.port is not None:
+            self.registers.set_MDR(Bus(16, self.port.fetch(pc_value)))
         
         # IR <- MDR
         self.registers.set_IR(self.registers.get_MDR().get_Value())
@@ -90,7 +248,8 @@ class CPU:
         # Cargar instrucción en Unidad de Control
         self.control_unit.load_instruction(self.registers.get_IR().get_Value())
         
-        print(f"CPU: Fetch en PC={pc_value:04X}, Inst={self.registers.get_IR().get_Hex_Value()}")
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: Fetch en PC={pc_value:04X}, Inst={self.registers.get_IR().get_Hex_Value()}")
         return True
     
     def execute(self):
@@ -98,78 +257,128 @@ class CPU:
         if not self.running.get_value():
             return False
         
-        # Obtener información de la instrucción
+        # Decodificación (cacheada por palabra de instrucción)
         ir_value = self.registers.get_IR().get_Dec_Value()
-        opcode = (ir_value >> 12) & 0xF
-        operand = ir_value & 0xFFF
+        decoded = self._decode_cache.get(ir_value)
+        if decoded is None:
+            decoded = self._decode(ir_value)
+        handler, opcode, operand, mnemonic = decoded
         
-        print(f"CPU: Ejecutando {self._get_mnemonic(opcode)} (0x{opcode:X}) con operando 0x{operand:03X}")
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: Ejecutando {mnemonic} (0x{opcode:X}) con operando 0x{operand:03X}")
         
         # Configurar OP_TYPE
-        self.registers.set_OP_TYPE(Bus(4, opcode))
+        self.registers.get_OP_TYPE().set_Value_int(opcode)
+        if self.gate_activity is not None:
+            self.gate_activity.begin(mnemonic)
         
         # Dispatch según ISA estandarizado
-        if opcode == 0x0:  # NOP
-            print("CPU: NOP - No operation")
-            
-        elif opcode == 0x1:  # LOAD
-            self._execute_load(operand)
-            
-        elif opcode == 0x2:  # STORE
-            self._execute_store(operand)
-            
-        elif opcode == 0x3:  # ADD
-            self._execute_alu_operation(operand, aluop=0b00, mode=0b000)
-            
-        elif opcode == 0x4:  # SUB
-            self._execute_alu_operation(operand, aluop=0b00, mode=0b001)
-            
-        elif opcode == 0x5:  # MULT
-            self._execute_multiplication(operand)
-            
-        elif opcode == 0x6:  # DIV
-            self._execute_division(operand)
-            
-        elif opcode == 0x7:  # JUMP
-            self.registers.get_PC().set_Value_int(operand)
-            print(f"CPU: JUMP a 0x{operand:03X}")
-            
-        elif opcode == 0x8:  # JZ (Jump if Zero)
-            if self.registers.get_FLAG_Z().get_value() == 1:
-                self.registers.get_PC().set_Value_int(operand)
-                print(f"CPU: JZ tomado a 0x{operand:03X} (Z=1)")
-            else:
-                print("CPU: JZ no tomado (Z=0)")
-            
-        elif opcode == 0x9:  # LOADI
-            self.registers.set_AC(Bus(16, operand))
-            print(f"CPU: LOADI 0x{operand:03X} -> AC=0x{operand:04X}")
-            
-        elif opcode == 0xA:  # AND
-            self._execute_alu_operation(operand, aluop=0b01, mode=0b000)
-            
-        elif opcode == 0xB:  # OR
-            self._execute_alu_operation(operand, aluop=0b01, mode=0b001)
-            
-        elif opcode == 0xC:  # XOR
-            self._execute_alu_operation(operand, aluop=0b01, mode=0b010)
-            
-        elif opcode == 0xD:  # SHL
-            self._execute_shift(operand, aluop=0b10, mode=0b000)
-            
-        elif opcode == 0xE:  # SHR
-            self._execute_shift(operand, aluop=0b10, mode=0b001)
-            
-        elif opcode == 0xF:  # HALT
-            print("CPU: HALT - Deteniendo ejecución")
-            self.running.set_value(0)
-            
-        else:
-            print(f"CPU: ERROR - Opcode 0x{opcode:X} no implementado")
+        handler(operand)
         
         self.instructions_executed += 1
         return True
     
+    # ===== TABLA DE DESPACHO =====
+    
+    def _build_dispatch_table(self):
+        """Construye la tabla opcode -> (handler, mnemónico) una sola vez"""
+        self._dispatch = [self._op_unknown] * 16
+        self._mnemonics = [f"UNKNOWN(0x{opcode:X})" for opcode in range(16)]
+        self._decode_cache = {}
+        
+        self.register_instruction(0x0, "NOP", self._op_nop)
+        self.register_instruction(0x1, "LOAD", self._execute_load)
+        self.register_instruction(0x2, "STORE", self._execute_store)
+        self.register_instruction(0x3, "ADD", lambda operand: self._execute_alu_operation(operand, aluop=0b00, mode=0b000))
+        self.register_instruction(0x4, "SUB", lambda operand: self._execute_alu_operation(operand, aluop=0b00, mode=0b001))
+        self.register_instruction(0x5, "MULT", self._execute_multiplication)
+        self.register_instruction(0x6, "DIV", self._execute_division)
+        self.register_instruction(0x7, "JUMP", self._op_jump)
+        self.register_instruction(0x8, "JZ", self._op_jz)
+        self.register_instruction(0x9, "LOADI", self._op_loadi)
+        self.register_instruction(0xA, "AND", lambda operand: self._execute_alu_operation(operand, aluop=0b01, mode=0b000))
+        self.register_instruction(0xB, "OR", lambda operand: self._execute_alu_operation(operand, aluop=0b01, mode=0b001))
+        self.register_instruction(0xC, "XOR", lambda operand: self._execute_alu_operation(operand, aluop=0b01, mode=0b010))
+        self.register_instruction(0xD, "SHL", lambda operand: self._execute_shift(operand, aluop=0b10, mode=0b000))
+        self.register_instruction(0xE, "SHR", lambda operand: self._execute_shift(operand, aluop=0b10, mode=0b001))
+        self.register_instruction(0xF, "HALT", self._op_halt)
+    
+    def register_instruction(self, opcode: int, mnemonic: str, handler):
+        """
+        Registra (o reemplaza) el handler de un opcode.
+        El handler recibe el operando de 12 bits de la instrucción. El registro
+        se mantiene tras reset() (run_program resetea la CPU); para volver al
+        handler del ISA se usa unregister_instruction().
+        """
+        if opcode < 0 or opcode > 0xF:
+            raise ValueError(f"Opcode {opcode:#x} fuera de rango (4 bits: 0x0-0xF)")
+        if not callable(handler):
+            raise TypeError(f"El handler debe ser invocable, no {type(handler).__name__}")
+        
+        self._dispatch[opcode] = handler
+        self._mnemonics[opcode] = mnemonic
+        
+        # Las entradas decodificadas y los bloques traducidos dependen del handler
+        self._decode_cache.clear()
+        if self.block_cache is not None:
+            self.block_cache.clear()
+        if self.profiler is not None:
+            self.profiler.set_custom_opcodes(self._custom_opcodes())
+    
+    def unregister_instruction(self, opcode: int):
+        """Vuelve a ejecutar el opcode con su handler del ISA"""
+        if opcode < 0 or opcode > 0xF:
+            raise ValueError(f"Opcode {opcode:#x} fuera de rango (4 bits: 0x0-0xF)")
+        if self._dispatch[opcode] is not self._builtin_dispatch[opcode]:
+            self.register_instruction(opcode, self._builtin_mnemonics[opcode], self._builtin_dispatch[opcode])
+    
+    def _decode(self, ir_value):
+        """Decodifica una palabra de instrucción y la guarda en la caché"""
+        opcode = (ir_value >> 12) & 0xF
+        decoded = (self._dispatch[opcode], opcode, ir_value & 0xFFF, self._mnemonics[opcode])
+        self._decode_cache[ir_value] = decoded
+        return decoded
+    
+    # ===== HANDLERS DE INSTRUCCIONES SIMPLES =====
+    
+    def _op_nop(self, operand):
+        """NOP: sin operación"""
+        if self.trace.enabled:
+            self.trace.emit("CPU", "CPU: NOP - No operation")
+    
+    def _op_jump(self, operand):
+        """JUMP: PC ← operando"""
+        self.registers.get_PC().set_Value_int(operand)
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: JUMP a 0x{operand:03X}")
+    
+    def _op_jz(self, operand):
+        """JZ: PC ← operando si Z=1"""
+        if self.registers.get_FLAG_Z().get_value() == 1:
+            self.registers.get_PC().set_Value_int(operand)
+            if self.trace.enabled:
+                self.trace.emit("CPU", f"CPU: JZ tomado a 0x{operand:03X} (Z=1)")
+        elif self.trace.enabled:
+            self.trace.emit("CPU", "CPU: JZ no tomado (Z=0)")
+    
+    def _op_loadi(self, operand):
+        """LOADI: AC ← operando (inmediato)"""
+        self.registers.set_AC(Bus(16, operand))
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: LOADI 0x{operand:03X} -> AC=0x{operand:04X}")
+    
+    def _op_halt(self, operand):
+        """HALT: detener CPU"""
+        if self.trace.enabled:
+            self.trace.emit("CPU", "CPU: HALT - Deteniendo ejecución")
+        self.running.set_value(0)
+    
+    def _op_unknown(self, operand):
+        """Opcode sin handler registrado"""
+        if self.trace.enabled:
+            opcode = self.registers.get_OP_TYPE().get_Dec_Value()
+            self.trace.emit("CPU", f"CPU: ERROR - Opcode 0x{opcode:X} no implementado")
+    
     # ===== MÉTODOS DE EJECUCIÓN DE INSTRUCCIONES =====
     
     def _execute_load(self, address):
@@ -178,11 +387,11 @@ class CPU:
         self.registers.set_MAR(Bus(16, address))
         
         # Leer memoria
-        if self.memory:
-            data_bus = self.memory.read_direct(address)
-            self.registers.set_MDR(data_bus)
+        if self.port is not None:
+            self.registers.set_MDR(Bus(16, self.port.read(address)))
             self.registers.set_AC(self.registers.get_MDR().get_Value())
-            print(f"CPU: LOAD [0x{address:03X}] = {self.registers.get_AC().get_Hex_Value()} -> AC")
+            if self.trace.enabled:
+                self.trace.emit("CPU", f"CPU: LOAD [0x{address:03X}] = {self.registers.get_AC().get_Hex_Value()} -> AC")
     
     def _execute_store(self, address):
         """STORE: Memoria[address] ← AC"""
@@ -193,10 +402,11 @@ class CPU:
         self.registers.set_MDR(self.registers.get_AC().get_Value())
         
         # Escribir memoria
-        if self.memory:
+        if self.port is not None:
             mdr_value = self.registers.get_MDR().get_Dec_Value()
-            self.memory.write_direct(address, mdr_value)
-            print(f"CPU: STORE AC={self.registers.get_AC().get_Hex_Value()} -> [0x{address:03X}]")
+            self.port.write(address, mdr_value)
+            if self.trace.enabled:
+                self.trace.emit("CPU", f"CPU: STORE AC={self.registers.get_AC().get_Hex_Value()} -> [0x{address:03X}]")
     
     def _execute_alu_operation(self, address, aluop, mode):
         """Operaciones ALU básicas: ADD, SUB, AND, OR, XOR"""
@@ -204,26 +414,17 @@ class CPU:
         self.registers.set_MAR(Bus(16, address))
         
         # Leer operando de memoria
-        if self.memory:
-            data_bus = self.memory.read_direct(address)
-            self.registers.set_MDR(data_bus)
-        
-        # Configurar ALU
-        self.alu.set_input_a(self.registers.get_AC().get_Value())
-        self.alu.set_input_b(self.registers.get_MDR().get_Value())
-        
-        aluop_bus = Bus(2)
-        aluop_bus.set_Binary_value(aluop)
-        
-        mode_bus = Bus(3)
-        mode_bus.set_Binary_value(mode)
-        
-        self.alu.set_aluop(aluop_bus)
-        self.alu.set_modo_funcion(mode_bus)
-        
-        # Ejecutar ALU
-        result = self.alu.execute()
-        self.registers.set_AC(result)
+        if self.port is not None:
+            self.registers.set_MDR(Bus(16, self.port.read(address)))
+        
+        # Ejecutar ALU (AC op MDR)
+        result = self.alu.execute_with_signals(
+            self.registers.get_AC().get_Dec_Value(),
+            self.registers.get_MDR().get_Dec_Value(),
+            aluop,
+            mode
+        )
+        self.registers.set_AC(Bus(16, result))
         
         # Actualizar flags
         try:
@@ -233,33 +434,23 @@ class CPU:
         except:
             pass
         
-        mnemonic = self._get_alu_mnemonic(aluop, mode)
-        print(f"CPU: {mnemonic} [0x{address:03X}]={self.registers.get_MDR().get_Hex_Value()}, AC={self.registers.get_AC().get_Hex_Value()}")
+        if self.trace.enabled:
+            mnemonic = self._get_alu_mnemonic(aluop, mode)
+            self.trace.emit("CPU", f"CPU: {mnemonic} [0x{address:03X}]={self.registers.get_MDR().get_Hex_Value()}, AC={self.registers.get_AC().get_Hex_Value()}")
     
     def _execute_shift(self, shift_amount, aluop, mode):
         """Operaciones de desplazamiento: SHL, SHR"""
         # Solo usar los 4 bits bajos para desplazamiento
         shift = shift_amount & 0xF
         
-        # Configurar ALU
-        self.alu.set_input_a(self.registers.get_AC().get_Value())
-        
-        # Para desplazamientos, usar shift amount como segundo operando
-        shift_bus = Bus(16, shift)
-        self.alu.set_input_b(shift_bus)
-        
-        aluop_bus = Bus(2)
-        aluop_bus.set_Binary_value(aluop)
-        
-        mode_bus = Bus(3)
-        mode_bus.set_Binary_value(mode)
-        
-        self.alu.set_aluop(aluop_bus)
-        self.alu.set_modo_funcion(mode_bus)
-        
-        # Ejecutar ALU
-        result = self.alu.execute()
-        self.registers.set_AC(result)
+        # Ejecutar ALU (shift amount como segundo operando)
+        result = self.alu.execute_with_signals(
+            self.registers.get_AC().get_Dec_Value(),
+            shift,
+            aluop,
+            mode
+        )
+        self.registers.set_AC(Bus(16, result))
         
         # Actualizar flags
         try:
@@ -269,17 +460,17 @@ class CPU:
         except:
             pass
         
-        mnemonic = "SHL" if mode == 0b000 else "SHR"
-        print(f"CPU: {mnemonic} AC por {shift} bits = {self.registers.get_AC().get_Hex_Value()}")
+        if self.trace.enabled:
+            mnemonic = "SHL" if mode == 0b000 else "SHR"
+            self.trace.emit("CPU", f"CPU: {mnemonic} AC por {shift} bits = {self.registers.get_AC().get_Hex_Value()}")
     
     def _execute_multiplication(self, address):
         """MULT: HI:LO ← AC × Memoria[address]"""
         multiplicand = self.registers.get_AC().get_Dec_Value()
         
         # Obtener multiplicador de memoria
-        if self.memory:
-            bus = self.memory.read_direct(address)
-            multiplier = bus.get_Decimal_value()
+        if self.port is not None:
+            multiplier = self.port.read(address)
         else:
             multiplier = address  # Fallback
         
@@ -296,16 +487,16 @@ class CPU:
         self.registers.set_FLAG_N(Bit(1 if (lo & 0x8000) else 0))
         self.registers.set_FLAG_C(Bit(1 if hi != 0 else 0))
         
-        print(f"CPU: MULT {multiplicand} × {multiplier} = {result} (HI=0x{hi:04X}, LO=0x{lo:04X})")
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: MULT {multiplicand} × {multiplier} = {result} (HI=0x{hi:04X}, LO=0x{lo:04X})")
     
     def _execute_division(self, address):
         """DIV: LO ← AC ÷ Memoria[address], HI ← resto"""
         dividendo = self.registers.get_AC().get_Dec_Value()
         
         # Obtener divisor de memoria
-        if self.memory:
-            bus = self.memory.read_direct(address)
-            divisor = bus.get_Decimal_value()
+        if self.port is not None:
+            divisor = self.port.read(address)
         else:
             divisor = address
         
@@ -313,7 +504,8 @@ class CPU:
             # Error: división por cero
             self.registers.set_STATUS(Bus(8, 0x01))
             self.registers.set_FLAG_C(Bit(1))
-            print("CPU: ERROR - División por cero")
+            if self.trace.enabled:
+                self.trace.emit("CPU", "CPU: ERROR - División por cero")
             return
         
         cociente = dividendo // divisor
@@ -326,62 +518,101 @@ class CPU:
         self.registers.set_FLAG_Z(Bit(1 if cociente == 0 else 0))
         self.registers.set_FLAG_N(Bit(1 if (cociente & 0x8000) else 0))
         
-        print(f"CPU: DIV {dividendo} ÷ {divisor} = {cociente} (resto {resto})")
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: DIV {dividendo} ÷ {divisor} = {cociente} (resto {resto})")
     
     # ===== MÉTODOS AUXILIARES =====
     
     def _get_mnemonic(self, opcode):
         """Devuelve el mnemónico para un opcode"""
-        mnemonics = {
-            0x0: "NOP", 0x1: "LOAD", 0x2: "STORE", 0x3: "ADD",
-            0x4: "SUB", 0x5: "MULT", 0x6: "DIV", 0x7: "JUMP",
-            0x8: "JZ", 0x9: "LOADI", 0xA: "AND", 0xB: "OR",
-            0xC: "XOR", 0xD: "SHL", 0xE: "SHR", 0xF: "HALT"
-        }
-        return mnemonics.get(opcode, f"UNKNOWN(0x{opcode:X})")
+        if 0 <= opcode <= 0xF:
+            return self._mnemonics[opcode]
+        return f"UNKNOWN(0x{opcode:X})"
     
     def _get_alu_mnemonic(self, aluop, mode):
         """Devuelve el mnemónico para operación ALU"""
-        if aluop == 0b00:  # Aritmética
-            return ["ADD", "SUB", "MULT", "DIV", "???", "???", "???", "???"][mode]
-        elif aluop == 0b01:  # Lógica
-            return ["AND", "OR", "XOR", "NOT", "???", "???", "???", "???"][mode]
-        elif aluop == 0b10:  # Desplazamiento
-            return ["SHL", "SHR", "ROL", "ROR", "ASR", "???", "???", "???"][mode]
+        if aluop in self.ALU_MNEMONICS:
+            return self.ALU_MNEMONICS[aluop][mode]
         return "UNKNOWN"
     
     def run_cycle(self):
         """Ejecuta un ciclo completo de la CPU"""
         if not self.running.get_value():
             return
+        
+        # Motor microprogramado: un ciclo de reloj = un micro-paso
+        if self.microcode is not None:
+            self.microcode.clock()
+            return
             
         self.clock_cycle += 1
         
         # Fetch y Execute
-        if self.fetch():
-            self.execute()
+        if self.profiler is None:
+            if self.fetch():
+                self.execute()
+        else:
+            pc = self.registers.get_PC().get_Dec_Value()
+            if self.fetch() and self.execute():
+                self.profiler.record(pc, self.registers.get_IR().get_Dec_Value(),
+                                     self.registers.get_FLAG_Z().get_value())
         
-        print(f"CPU: Ciclo {self.clock_cycle} completado. PC={self.registers.get_PC().get_Hex_Value()}")
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: Ciclo {self.clock_cycle} completado. PC={self.registers.get_PC().get_Hex_Value()}")
     
     def run_program(self, start_address: int = 0, max_cycles: int = 100):
         """Ejecuta un programa desde una dirección de memoria"""
-        print("=== INICIANDO EJECUCIÓN ===")
-        print(f"PC inicial: 0x{start_address:04X}")
+        if self.trace.enabled:
+            self.trace.emit("CPU", "=== INICIANDO EJECUCIÓN ===")
+            self.trace.emit("CPU", f"PC inicial: 0x{start_address:04X}")
         
         # Resetear
         self.reset()
         self.registers.get_PC().set_Value_int(start_address)
         self.running.set_value(1)
         
-        # Ciclo principal
-        while self.running.get_value() and self.clock_cycle < max_cycles:
-            self.run_cycle()
+        self.resume(max_cycles)
+        
+        if self.clock_cycle >= max_cycles and self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: Advertencia - Límite de {max_cycles} ciclos alcanzado")
+        
+        if self.trace.enabled:
+            self.trace.emit("CPU", "=== EJECUCIÓN FINALIZADA ===")
+            self.trace.emit("CPU", f"Ciclos: {self.clock_cycle}, Instrucciones: {self.instructions_executed}")
+        
+    def resume(self, max_cycles: int = 100):
+        """
+        Continúa la ejecución desde el estado actual, sin resetear
+        (p. ej. tras restaurar un snapshot), hasta HALT o hasta que
+        clock_cycle llegue a max_cycles. Llamarla con límites crecientes
+        ejecuta por cuadros: los dispositivos de E/S se vacían al final.
+        """
+        # Ciclo principal (bloques traducidos cuando nadie observa la traza ni hay caché que atribuir por PC)
+        if self.block_cache is not None and self.memory is not None and not self.trace.enabled and self.cache is None:
+            self._run_translated(max_cycles)
+        else:
+            while self.running.get_value() and self.clock_cycle < max_cycles:
+                self.run_cycle()
         
-        if self.clock_cycle >= max_cycles:
-            print(f"CPU: Advertencia - Límite de {max_cycles} ciclos alcanzado")
+        # Con la CPU detenida el bus queda ocioso: las transferencias pendientes (DMA) terminan
+        if not self.running.get_value():
+            self.bus.drain()
         
-        print("=== EJECUCIÓN FINALIZADA ===")
-        print(f"Ciclos: {self.clock_cycle}, Instrucciones: {self.instructions_executed}")
+        # Los dispositivos de E/S entregan su salida al terminar cada tramo (HALT o límite de ciclos)
+        self.bus.flush_devices()
+    
+    def _run_translated(self, max_cycles: int):
+        """Ejecuta bloque a bloque; instrucción a instrucción si el bloque no cabe o no es traducible"""
+        lookup = self.block_cache.lookup
+        registers = self.registers
+        running = self.running
+        
+        while running.get_value() and self.clock_cycle < max_cycles:
+            block = lookup(registers.get_PC().get_Dec_Value())
+            if block is not None and self.clock_cycle + block.length <= max_cycles:
+                block.run(self)
+            else:
+                self.run_cycle()
         
     def get_status(self):
         """Retorna el estado actual de la CPU con TODOS los registros"""
@@ -417,6 +648,30 @@ class CPU:
             }
         }
     
+    def snapshot(self) -> dict:
+        """Captura registros, ALU, Unidad de Control y contadores (la memoria no se incluye)"""
+        return {
+            'engine': self.engine,
+            'registers': self.registers.snapshot(),
+            'alu': self.alu.snapshot(),
+            'control_unit': self.control_unit.snapshot(),
+            'running': self.running.get_value(),
+            'clock_cycle': self.clock_cycle,
+            'instructions_executed': self.instructions_executed
+        }
+    
+    def restore(self, state: dict):
+        """Restaura un snapshot tomado con snapshot() en una CPU del mismo motor"""
+        if state['engine'] != self.engine:
+            raise ValueError(f"Snapshot del motor '{state['engine']}', la CPU usa '{self.engine}'")
+        
+        self.registers.restore(state['registers'])
+        self.alu.restore(state['alu'])
+        self.control_unit.restore(state['control_unit'])
+        self.running.set_value(state['running'])
+        self.clock_cycle = state['clock_cycle']
+        self.instructions_executed = state['instructions_executed']
+    
     def load_program(self, program: list, start_address: int = 0):
         """Carga un programa en memoria"""
         if not self.memory:
@@ -426,5 +681,6 @@ class CPU:
         for i, instruction in enumerate(program):
             self.memory.write_direct(start_address + i, instruction)
         
-        print(f"CPU: Programa cargado en memoria [0x{start_address:04X}-0x{start_address + len(program) - 1:04X}]")
+        if self.trace.enabled:
+            self.trace.emit("CPU", f"CPU: Programa cargado en memoria [0x{start_address:04X}-0x{start_address + len(program) - 1:04X}]")
         return True
\ No newline at end of file
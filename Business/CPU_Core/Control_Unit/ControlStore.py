@@ -87,7 +87,6 @@ class ControlStore:
         if step == 0:
             # Paso 0: MAR <- PC
             self._set_signal(control_word, 'MAR_LOAD', 1)
-            self._set_signal(control_word, 'PC_TO_BUS', 1)  # Nota: necesitaríamos esta señal
             
         elif step == 1:
             # Paso 1: MDR <- Mem[MAR], PC <- PC + 1
@@ -105,72 +104,48 @@ class ControlStore:
         
         return control_word
     
+    # Opcodes que operan AC con un dato de memoria (ALUop, ModoFunción)
+    ALU_MEMORY_OPS = {
+        0x3: (0b00, 0b000),  # ADD
+        0x4: (0b00, 0b001),  # SUB
+        0xA: (0b01, 0b000),  # AND
+        0xB: (0b01, 0b001),  # OR
+        0xC: (0b01, 0b010),  # XOR
+    }
+    
+    # Desplazamientos con cantidad inmediata (ALUop, ModoFunción)
+    ALU_SHIFT_OPS = {
+        0xD: (0b10, 0b000),  # SHL
+        0xE: (0b10, 0b001),  # SHR
+    }
+    
     def _generate_execution_microcode(self, control_word: Bus, opcode: int, step: int):
-        """Genera microcódigo de ejecución para cada instrucción"""
+        """
+        Genera microcódigo de ejecución para cada instrucción (ISA estandarizado).
         
-        # INSTRUCCIÓN HALT (0xF)
-        if opcode == 0xF:
-            if step == 3:
-                self._set_signal(control_word, 'HALT', 1)
-                self._set_signal(control_word, 'END_INSTR', 1)
+        El origen de cada carga lo fija el camino de datos: MAR toma PC en el
+        fetch y el operando de IR después; MDR toma la memoria si hay MEM_READ
+        y AC si no; AC toma MDR, el operando inmediato o la salida de la ALU.
+        """
         
-        # INSTRUCCIÓN ADD (0x3)
-        elif opcode == 0x3:
+        # Instrucciones con operando en memoria: MAR <- IR[11:0], MDR <- Mem[MAR]
+        if opcode in (0x1, 0x3, 0x4, 0x5, 0x6, 0xA, 0xB, 0xC):
             if step == 3:
-                # MAR <- IR[11:0] (dirección del operando)
                 self._set_signal(control_word, 'MAR_LOAD', 1)
-                self._set_signal(control_word, 'IR_OPERAND_TO_BUS', 1)
-            elif step == 4:
-                # MDR <- Mem[MAR]
+                return
+            if step == 4:
                 self._set_signal(control_word, 'MEM_READ', 1)
                 self._set_signal(control_word, 'MDR_LOAD', 1)
-            elif step == 5:
-                # Configurar ALU para suma
-                self._set_signal(control_word, 'ALUop0', 0)
-                self._set_signal(control_word, 'ALUop1', 0)  # 00: Aritmética
-                self._set_signal(control_word, 'ALUfunc0', 0)
-                self._set_signal(control_word, 'ALUfunc1', 0)
-                self._set_signal(control_word, 'ALUfunc2', 0)  # 000: Suma
-            elif step == 6:
-                # AC <- AC + MDR
-                self._set_signal(control_word, 'AC_LOAD', 1)
-                self._set_signal(control_word, 'UPDATE_FLAGS', 1)
-                self._set_signal(control_word, 'END_INSTR', 1)
+                return
         
-        # INSTRUCCIÓN SUB (0x4)
-        elif opcode == 0x4:
+        # INSTRUCCIÓN NOP (0x0)
+        if opcode == 0x0:
             if step == 3:
-                # MAR <- IR[11:0]
-                self._set_signal(control_word, 'MAR_LOAD', 1)
-                self._set_signal(control_word, 'IR_OPERAND_TO_BUS', 1)
-            elif step == 4:
-                # MDR <- Mem[MAR]
-                self._set_signal(control_word, 'MEM_READ', 1)
-                self._set_signal(control_word, 'MDR_LOAD', 1)
-            elif step == 5:
-                # Configurar ALU para resta
-                self._set_signal(control_word, 'ALUop0', 0)
-                self._set_signal(control_word, 'ALUop1', 0)  # 00: Aritmética
-                self._set_signal(control_word, 'ALUfunc0', 1)
-                self._set_signal(control_word, 'ALUfunc1', 0)
-                self._set_signal(control_word, 'ALUfunc2', 0)  # 001: Resta
-            elif step == 6:
-                # AC <- AC - MDR
-                self._set_signal(control_word, 'AC_LOAD', 1)
-                self._set_signal(control_word, 'UPDATE_FLAGS', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
         
         # INSTRUCCIÓN LOAD (0x1)
         elif opcode == 0x1:
-            if step == 3:
-                # MAR <- IR[11:0]
-                self._set_signal(control_word, 'MAR_LOAD', 1)
-                self._set_signal(control_word, 'IR_OPERAND_TO_BUS', 1)
-            elif step == 4:
-                # MDR <- Mem[MAR]
-                self._set_signal(control_word, 'MEM_READ', 1)
-                self._set_signal(control_word, 'MDR_LOAD', 1)
-            elif step == 5:
+            if step == 5:
                 # AC <- MDR
                 self._set_signal(control_word, 'AC_LOAD', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
@@ -180,46 +155,49 @@ class ControlStore:
             if step == 3:
                 # MAR <- IR[11:0]
                 self._set_signal(control_word, 'MAR_LOAD', 1)
-                self._set_signal(control_word, 'IR_OPERAND_TO_BUS', 1)
             elif step == 4:
                 # MDR <- AC
                 self._set_signal(control_word, 'MDR_LOAD', 1)
-                self._set_signal(control_word, 'AC_TO_BUS', 1)
             elif step == 5:
                 # Mem[MAR] <- MDR
                 self._set_signal(control_word, 'MEM_WRITE', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
         
-        # INSTRUCCIÓN JUMP (0x5)
-        elif opcode == 0x5:
-            if step == 3:
-                # PC <- IR[11:0]
-                self._set_signal(control_word, 'PC_LOAD', 1)
-                self._set_signal(control_word, 'IR_OPERAND_TO_BUS', 1)
+        # INSTRUCCIONES ADD, SUB, AND, OR, XOR
+        elif opcode in self.ALU_MEMORY_OPS:
+            if step == 5:
+                # AC <- AC op MDR (la ALU es combinacional: se configura y se carga en el mismo paso)
+                self._set_alu(control_word, *self.ALU_MEMORY_OPS[opcode])
+                self._set_signal(control_word, 'AC_LOAD', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
         
-        # INSTRUCCIÓN JZ (0x6) - Jump if Zero
-        elif opcode == 0x6:
-            if step == 3:
-                # Si FLAG_Z = 1, PC <- IR[11:0]
-                # Esto requiere lógica condicional en hardware
-                self._set_signal(control_word, 'COND_JUMP', 1)
+        # INSTRUCCIONES MULT (0x5) y DIV (0x6): algoritmo secuencial de 16 iteraciones
+        elif opcode in (0x5, 0x6):
+            if step == 5:
+                # HI <- 0, LO <- AC, MD_CNT <- 0 (DIV con divisor 0 termina aquí con error)
+                self._set_signal(control_word, 'MD_START', 1)
+            elif step == 6:
+                # MULT: suma y desplaza; DIV: desplaza y resta. Se repite hasta que MD_CNT da la vuelta
+                self._set_signal(control_word, 'MD_SHIFT', 1)
+                self._set_signal(control_word, 'MD_ADD' if opcode == 0x5 else 'MD_SUB', 1)
+            elif step == 7:
+                # HI:LO definitivos y banderas
+                self._set_signal(control_word, 'HI_LOAD', 1)
+                self._set_signal(control_word, 'LO_LOAD', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
         
-        # INSTRUCCIÓN IN (0x7)
+        # INSTRUCCIÓN JUMP (0x7)
         elif opcode == 0x7:
             if step == 3:
-                # AC <- Input Device
-                self._set_signal(control_word, 'AC_LOAD', 1)
-                self._set_signal(control_word, 'IO_READ', 1)
+                # PC <- IR[11:0]
+                self._set_signal(control_word, 'PC_LOAD', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
         
-        # INSTRUCCIÓN OUT (0x8)
+        # INSTRUCCIÓN JZ (0x8) - Jump if Zero
         elif opcode == 0x8:
             if step == 3:
-                # Output Device <- AC
-                self._set_signal(control_word, 'IO_WRITE', 1)
-                self._set_signal(control_word, 'AC_TO_BUS', 1)
+                # Si FLAG_Z = 1, PC <- IR[11:0] (PC_LOAD condicionado por Z)
+                self._set_signal(control_word, 'PC_LOAD', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
         
         # INSTRUCCIÓN LOADI (0x9) - Load Immediate
@@ -227,10 +205,29 @@ class ControlStore:
             if step == 3:
                 # AC <- IR[11:0] (valor inmediato)
                 self._set_signal(control_word, 'AC_LOAD', 1)
-                self._set_signal(control_word, 'IR_OPERAND_TO_BUS', 1)
                 self._set_signal(control_word, 'END_INSTR', 1)
         
-        # Instrucciones AND, OR, XOR, etc. seguirían aquí...
+        # INSTRUCCIONES SHL (0xD) y SHR (0xE)
+        elif opcode in self.ALU_SHIFT_OPS:
+            if step == 3:
+                # AC <- AC desplazado IR[3:0] posiciones
+                self._set_alu(control_word, *self.ALU_SHIFT_OPS[opcode])
+                self._set_signal(control_word, 'AC_LOAD', 1)
+                self._set_signal(control_word, 'END_INSTR', 1)
+        
+        # INSTRUCCIÓN HALT (0xF)
+        elif opcode == 0xF:
+            if step == 3:
+                self._set_signal(control_word, 'HALT', 1)
+                self._set_signal(control_word, 'END_INSTR', 1)
+    
+    def _set_alu(self, control_word: Bus, aluop: int, modo_funcion: int):
+        """Codifica ALUop (2 bits) y ModoFunción (3 bits) en la palabra de control"""
+        self._set_signal(control_word, 'ALUop0', aluop & 1)
+        self._set_signal(control_word, 'ALUop1', (aluop >> 1) & 1)
+        self._set_signal(control_word, 'ALUfunc0', modo_funcion & 1)
+        self._set_signal(control_word, 'ALUfunc1', (modo_funcion >> 1) & 1)
+        self._set_signal(control_word, 'ALUfunc2', (modo_funcion >> 2) & 1)
     
     def _set_signal(self, control_word: Bus, signal_name: str, value: int):
         """Establece una señal en la palabra de control"""
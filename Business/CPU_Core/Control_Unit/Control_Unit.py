@@ -5,13 +5,17 @@ from .SignalGenerator import SignalGenerator
 from .MicroCounter import MicroCounter
 from .FSM import FSM
 from .Decoder import Decoder
+from Business.CPU_Core.Trace_Sink import Trace_Sink, Null_Sink
 
 class Control_Unit:
     """
     Unidad de Control principal que coordina todos los componentes
     """
     
-    def __init__(self):
+    def __init__(self, trace: Trace_Sink = None):
+        # Traza (por defecto deshabilitada)
+        self.trace = trace if trace is not None else Null_Sink()
+        
         # Componentes de la UC
         self.control_store = ControlStore()
         self.signal_generator = SignalGenerator()
@@ -31,6 +35,10 @@ class Control_Unit:
         # Estadísticas
         self.cycles_executed = 0
     
+    def set_trace_sink(self, sink: Trace_Sink):
+        """Cambia el destino de la traza de la UC"""
+        self.trace = sink
+    
     def reset(self):
         """Resetea la Unidad de Control a estado inicial"""
         self.micro_counter.reset()
@@ -44,7 +52,8 @@ class Control_Unit:
         self.halted.set_value(0)
         self.cycles_executed = 0
         
-        print("UC: Unidad de Control reseteada")
+        if self.trace.enabled:
+            self.trace.emit("UC", "UC: Unidad de Control reseteada")
     
     def load_instruction(self, instruction_bus: Bus):
         """
@@ -61,8 +70,9 @@ class Control_Unit:
         self.micro_counter.reset()
         self.current_step = 0
         
-        print(f"UC: Instrucción cargada: {instruction_bus.get_Hexadecimal_value()}")
-        print(f"UC: Opcode decodificado: 0x{self.current_opcode:X}")
+        if self.trace.enabled:
+            self.trace.emit("UC", f"UC: Instrucción cargada: {instruction_bus.get_Hexadecimal_value()}")
+            self.trace.emit("UC", f"UC: Opcode decodificado: 0x{self.current_opcode:X}")
     
     def execute_cycle(self):
         """
@@ -70,7 +80,8 @@ class Control_Unit:
         Retorna True si la instrucción ha terminado
         """
         if self.halted.get_value() == 1:
-            print("UC: Sistema detenido")
+            if self.trace.enabled:
+                self.trace.emit("UC", "UC: Sistema detenido")
             return True
         
         # Obtener la palabra de control actual
@@ -88,7 +99,8 @@ class Control_Unit:
         end_instruction = False
         if self.signal_generator.get_signal_value('END_INSTR') == 1:
             end_instruction = True
-            print("UC: Fin de instrucción alcanzado")
+            if self.trace.enabled:
+                self.trace.emit("UC", "UC: Fin de instrucción alcanzado")
         
         # Incrementar contador si no es el final
         if not end_instruction:
@@ -103,7 +115,8 @@ class Control_Unit:
         # Verificar señal de HALT
         if self.signal_generator.get_signal_value('HALT') == 1:
             self.halted.set_value(1)
-            print("UC: Señal HALT recibida")
+            if self.trace.enabled:
+                self.trace.emit("UC", "UC: Señal HALT recibida")
         
         return end_instruction
     
@@ -169,6 +182,35 @@ class Control_Unit:
         """
         return self.decoder.get_instruction_type()
     
+    def snapshot(self) -> dict:
+        """Captura el estado de la UC y de sus componentes internos"""
+        return {
+            'instruction': self.current_instruction.get_Decimal_value(),
+            'opcode': self.current_opcode,
+            'micro_step': self.current_step,
+            'halted': self.halted.get_value(),
+            'cycles': self.cycles_executed,
+            'control_signals': dict(self.control_signals),
+            'micro_counter': self.micro_counter.get_value_int(),
+            'fsm_state': self.fsm.get_state(),
+            'signals': self.signal_generator.get_all_signals(),
+            'decoder': self.decoder.snapshot()
+        }
+    
+    def restore(self, state: dict):
+        """Restaura un snapshot tomado con snapshot()"""
+        self.current_instruction = Bus(16, state['instruction'])
+        self.current_opcode = state['opcode']
+        self.current_step = state['micro_step']
+        self.halted.set_value(state['halted'])
+        self.cycles_executed = state['cycles']
+        self.control_signals = dict(state['control_signals'])
+        
+        self.micro_counter.load(state['micro_counter'])
+        self.fsm.set_state(state['fsm_state'])
+        self.signal_generator.set_signals(state['signals'])
+        self.decoder.restore(state['decoder'])
+    
     def is_halted(self):
         """Retorna True si la UC está en estado HALT"""
         return self.halted.get_value() == 1
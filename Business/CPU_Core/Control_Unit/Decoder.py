@@ -31,21 +31,15 @@ class Decoder:
             
             self.__current_instruction = instruction_bus
             
-            # Extraer opcode (bits 15-12, índices 0-3 en MSB-first)
-            opcode = 0
-            for i in range(4):  # Bits 0-3 son opcode
-                bit_val = instruction_bus.get_Line_bit(i).get_value()
-                opcode = (opcode << 1) | bit_val
+            # El bus guarda la palabra empaquetada: los campos salen con desplazamientos
+            value = instruction_bus.get_Decimal_value()
             
+            # Extraer opcode (bits 15-12, índices 0-3 en MSB-first)
+            opcode = value >> 12
             self.__opcode = opcode
             
             # Extraer operando (bits 11-0, índices 4-15)
-            operand = 0
-            for i in range(4, 16):  # Bits 4-15 son operando
-                bit_val = instruction_bus.get_Line_bit(i).get_value()
-                operand = (operand << 1) | bit_val
-            
-            self.__operand = operand
+            self.__operand = value & 0xFFF
             
             # Determinar tipo de instrucción (ISA EXTENDIDO)
             if opcode == 0x0:
@@ -169,6 +163,23 @@ class Decoder:
         self.__operand = 0
         self.__instruction_type = "UNKNOWN"
     
+    # Snapshots
+    def snapshot(self) -> dict:
+        """Retorna la instrucción decodificada y sus campos"""
+        return {
+            'instruction': self.__current_instruction.get_Decimal_value(),
+            'opcode': self.__opcode,
+            'operand': self.__operand,
+            'instruction_type': self.__instruction_type
+        }
+    
+    def restore(self, state: dict):
+        """Restaura un snapshot del decoder"""
+        self.__current_instruction = Bus(16, state['instruction'])
+        self.__opcode = state['opcode']
+        self.__operand = state['operand']
+        self.__instruction_type = state['instruction_type']
+    
     def __str__(self):
         return (f"Decoder(Inst={self.__current_instruction.get_Hexadecimal_value()}, "
                 f"Opcode=0x{self.__opcode:X}, Type={self.__instruction_type}, "
@@ -179,6 +179,11 @@ class FSM:
     def get_state(self) -> int:
         return self.__get_state_value()
     
+    def set_state(self, value: int):
+        """Fuerza el estado actual (restaurar snapshots) y recalcula las salidas"""
+        self.__set_state_value(value)
+        self.__update_outputs()
+    
     def get_state_bus(self) -> Bus:
         """Retorna el estado actual como bus de 3 bits"""
         bus = Bus(3, 0)
@@ -115,4 +115,39 @@ class Record_Bank:
         self.__OP_TYPE.set_Value(Input)
 
     def set_STATUS(self, Input: Bus):
-        self.__STATUS.set_Value(Input)
\ No newline at end of file
+        self.__STATUS.set_Value(Input)
+
+    # Snapshots
+    def snapshot(self) -> dict:
+        """Retorna los valores de todos los registros y banderas como enteros"""
+        return {
+            'PC': self.__PC.get_Dec_Value(),
+            'IR': self.__IR.get_Dec_Value(),
+            'AC': self.__AC.get_Dec_Value(),
+            'MAR': self.__MAR.get_Dec_Value(),
+            'MDR': self.__MDR.get_Dec_Value(),
+            'TEMP': self.__TEMP.get_Dec_Value(),
+            'HI': self.__HI.get_Dec_Value(),
+            'LO': self.__LO.get_Dec_Value(),
+            'MD_CNT': self.__MD_CNT.get_Dec_Value(),
+            'MD_STATE': self.__MD_STATE.get_Dec_Value(),
+            'STEP_CNT': self.__STEP_CNT.get_Dec_Value(),
+            'OP_TYPE': self.__OP_TYPE.get_Dec_Value(),
+            'STATUS': self.__STATUS.get_Dec_Value(),
+            'FLAG_Z': self.__FLAG_Z.get_value(),
+            'FLAG_C': self.__FLAG_C.get_value(),
+            'FLAG_N': self.__FLAG_N.get_value(),
+        }
+
+    def restore(self, state: dict):
+        """Restaura un snapshot (cada registro recibe un Bus nuevo, sin alias)"""
+        for name, record in (('PC', self.__PC), ('IR', self.__IR), ('AC', self.__AC),
+                             ('MAR', self.__MAR), ('MDR', self.__MDR), ('TEMP', self.__TEMP),
+                             ('HI', self.__HI), ('LO', self.__LO), ('MD_CNT', self.__MD_CNT),
+                             ('MD_STATE', self.__MD_STATE), ('STEP_CNT', self.__STEP_CNT),
+                             ('OP_TYPE', self.__OP_TYPE), ('STATUS', self.__STATUS)):
+            record.set_Value(Bus(record.get_width(), state[name]))
+
+        self.__FLAG_Z.set_value(state['FLAG_Z'])
+        self.__FLAG_C.set_value(state['FLAG_C'])
+        self.__FLAG_N.set_value(state['FLAG_N'])
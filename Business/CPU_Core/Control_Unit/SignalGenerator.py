@@ -161,6 +161,11 @@ class SignalGenerator:
         """Retorna lista de señales activas"""
         return [name for name, bit in self.__signals.items() if bit.get_value() == 1]
     
+    def set_signals(self, values: dict):
+        """Establece varias señales desde un diccionario {nombre: 0/1}"""
+        for signal_name, value in values.items():
+            self.get_signal(signal_name).set_value(value)
+    
     def clear(self):
         """Desactiva todas las señales"""
         for signal in self.__signals.values():
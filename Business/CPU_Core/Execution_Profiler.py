@@ -0,0 +1,210 @@
+# Business/CPU_Core/Execution_Profiler.py
+import copy
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class Execution_Profiler:
+    """
+    Perfilador de programas invitados: cuenta instrucciones y ciclos por PC
+    y por opcode, saltos JZ tomados/no tomados por PC y lecturas/escrituras
+    de datos por dirección.
+
+    Los contadores son listas de enteros preasignadas e indexadas por
+    dirección (incrementar un elemento de lista es más barato que en un
+    array tipado), de modo que registrar una instrucción son unos pocos
+    incrementos. Los accesos a memoria se deducen del opcode y del operando
+    (el ISA solo tiene direccionamiento directo); los opcodes con handlers
+    registrados por el usuario se cuentan pero no se les atribuyen accesos.
+
+    Los contadores por PC cubren la memoria conectada; un PC fuera de ella
+    (la CPU se salió del programa) se cuenta en la última posición.
+
+    Con la caché de bloques, cada bloque traducido incrementa un único
+    contador de ejecuciones (block_runs[inicio]); sus instrucciones se
+    acumulan en los demás contadores al consultar el perfil (flush) o
+    cuando el bloque se descarta.
+    """
+
+    ADDRESS_SPACE = 1 << 12  # Operando de 12 bits
+
+    # Tipo de acceso de cada opcode del ISA
+    NONE, READ, WRITE, BRANCH = 0, 1, 2, 3
+    ISA_ACCESS = (NONE, READ, WRITE, READ, READ, READ, READ, NONE,
+                  BRANCH, NONE, READ, READ, READ, NONE, NONE, NONE)
+    MNEMONICS = ("NOP", "LOAD", "STORE", "ADD", "SUB", "MULT", "DIV", "JUMP",
+                 "JZ", "LOADI", "AND", "OR", "XOR", "SHL", "SHR", "HALT")
+
+    def __init__(self, memory_size: int = ADDRESS_SPACE):
+        if memory_size <= 0:
+            raise ValueError("memory_size debe ser mayor que 0")
+        self.memory_size = memory_size
+        pcs = memory_size + 1  # + PC fuera de memoria
+
+        self.executed = [0] * pcs        # Instrucciones por PC
+        self.cycles = [0] * pcs          # Ciclos por PC
+        self.jz_taken = [0] * pcs
+        self.jz_not_taken = [0] * pcs
+        self.block_runs = [0] * pcs      # Ejecuciones por inicio de bloque
+        self.reads = [0] * self.ADDRESS_SPACE
+        self.writes = [0] * self.ADDRESS_SPACE
+        self.opcodes = [0] * 16
+        self.opcode_cycles = [0] * 16
+
+        self.__access = bytearray(self.ISA_ACCESS)
+        self.__blocks = {}   # inicio -> bloque traducido con contador pendiente
+
+    # --- Registro ---
+    def record(self, pc: int, word: int, z: int, cycles: int = 1):
+        """Una instrucción completada en pc (z: bandera Z al terminar)"""
+        if pc >= self.memory_size:
+            pc = self.memory_size
+        opcode = word >> 12
+        self.executed[pc] += 1
+        self.cycles[pc] += cycles
+        self.opcodes[opcode] += 1
+        self.opcode_cycles[opcode] += cycles
+
+        access = self.__access[opcode]
+        if access == 1:    # READ
+            self.reads[word & 0xFFF] += 1
+        elif access == 2:  # WRITE
+            self.writes[word & 0xFFF] += 1
+        elif access == 3:  # BRANCH
+            if z == 1:
+                self.jz_taken[pc] += 1
+            else:
+                self.jz_not_taken[pc] += 1
+
+    def set_custom_opcodes(self, opcodes: Iterable[int]):
+        """Opcodes con handler del usuario: sin accesos a memoria deducidos"""
+        self.__access = bytearray(self.ISA_ACCESS)
+        for opcode in opcodes:
+            self.__access[opcode] = self.NONE
+
+    # --- Bloques traducidos ---
+    def add_block(self, block):
+        """Un bloque recién traducido cuyo código incrementa block_runs[block.start]"""
+        self.__fold(block)
+        self.__blocks[block.start] = block
+
+    def remove_block(self, block):
+        """El bloque se descarta: acumula sus ejecuciones pendientes"""
+        self.__fold(block)
+        if self.__blocks.get(block.start) is block:
+            del self.__blocks[block.start]
+
+    def flush(self):
+        """Acumula en los contadores las ejecuciones pendientes de todos los bloques"""
+        for block in self.__blocks.values():
+            self.__fold(block)
+
+    def __fold(self, block):
+        runs = self.block_runs[block.start]
+        if not runs:
+            return
+        self.block_runs[block.start] = 0
+        access = self.__access
+        for pc, word in zip(block.addresses, block.words):
+            opcode = word >> 12
+            self.executed[pc] += runs
+            self.cycles[pc] += runs
+            self.opcodes[opcode] += runs
+            self.opcode_cycles[opcode] += runs
+            # Los JZ del bloque cuentan tomado/no tomado en el propio código generado
+            if access[opcode] == self.READ:
+                self.reads[word & 0xFFF] += runs
+            elif access[opcode] == self.WRITE:
+                self.writes[word & 0xFFF] += runs
+
+    def reset(self):
+        """Pone a cero todos los contadores (los bloques siguen registrados)"""
+        # Sin instrucciones registradas ni bloques pendientes no hay nada que borrar
+        if not any(self.opcodes) and not any(self.block_runs[start] for start in self.__blocks):
+            return
+        # Se borran en el lugar: el código de los bloques referencia estas listas
+        zeros = [0] * max(len(self.executed), self.ADDRESS_SPACE)
+        for counters in (self.executed, self.cycles, self.jz_taken, self.jz_not_taken, self.block_runs,
+                         self.reads, self.writes, self.opcodes, self.opcode_cycles):
+            counters[:] = zeros[:len(counters)]
+
+    # --- Consulta ---
+    def get_report(self) -> Dict[str, Any]:
+        """Contadores no nulos: {'instructions', 'cycles', 'pcs', 'opcodes', 'memory'}"""
+        self.flush()
+        instructions = sum(self.opcodes)
+        cycles = sum(self.opcode_cycles)
+
+        pcs = {}
+        for pc in range(len(self.executed)):
+            if self.executed[pc]:
+                entry = {
+                    'count': self.executed[pc],
+                    'percent': round(100.0 * self.executed[pc] / instructions, 2),
+                    'cycles': self.cycles[pc],
+                    'cycles_percent': round(100.0 * self.cycles[pc] / cycles, 2),
+                }
+                if self.jz_taken[pc] or self.jz_not_taken[pc]:
+                    entry['taken'] = self.jz_taken[pc]
+                    entry['not_taken'] = self.jz_not_taken[pc]
+                pcs[pc] = entry
+
+        opcodes = {self.MNEMONICS[op]: {'count': self.opcodes[op], 'cycles': self.opcode_cycles[op],
+                                        'cycles_percent': round(100.0 * self.opcode_cycles[op] / cycles, 2)}
+                   for op in range(16) if self.opcodes[op]}
+
+        memory = {address: {'reads': self.reads[address], 'writes': self.writes[address]}
+                  for address in range(self.ADDRESS_SPACE) if self.reads[address] or self.writes[address]}
+
+        return {'instructions': instructions, 'cycles': cycles, 'pcs': pcs, 'opcodes': opcodes, 'memory': memory}
+
+    def annotate(self, program_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copia del programa JSON con un campo 'profile' en cada instrucción
+        ejecutada y en cada variable accedida, más un resumen 'profile_summary'.
+        """
+        report = self.get_report()
+        annotated = copy.deepcopy(program_data)
+        for instruction in annotated.get('program', []):
+            if instruction['address'] in report['pcs']:
+                instruction['profile'] = report['pcs'][instruction['address']]
+        for variable in annotated.get('data_section', {}).get('variables', {}).values():
+            if variable['address'] in report['memory']:
+                variable['profile'] = report['memory'][variable['address']]
+        annotated['profile_summary'] = {key: report[key] for key in ('instructions', 'cycles', 'opcodes')}
+        return annotated
+
+    def format_report(self, program_data: Optional[Dict[str, Any]] = None, top: int = 10) -> str:
+        """Puntos calientes por ciclos con el mnemónico y comentario del programa JSON"""
+        report = self.get_report()
+        source = {entry['address']: entry for entry in (program_data or {}).get('program', [])}
+        names = {var['address']: name for name, var in
+                 (program_data or {}).get('data_section', {}).get('variables', {}).items()}
+
+        lines = [f"PERFIL: {report['instructions']} instrucciones, {report['cycles']} ciclos"]
+
+        lines.append(f"Direcciones más costosas (top {top}):")
+        hot = sorted(report['pcs'].items(), key=lambda item: (-item[1]['cycles'], item[0]))[:top]
+        for pc, entry in hot:
+            info = source.get(pc, {})
+            mnemonic = info.get('mnemonic', '')
+            branch = ""
+            if 'taken' in entry:
+                branch = f"  tomado {entry['taken']} / no tomado {entry['not_taken']}"
+            comment = f"  ; {info['comment']}" if info.get('comment') else ""
+            lines.append(f"  [{pc:04X}] {mnemonic:<6} {entry['count']:>10} ({entry['percent']:5.1f}%)"
+                         f"  ciclos {entry['cycles_percent']:5.1f}%{branch}{comment}")
+
+        lines.append("Opcodes:")
+        for mnemonic, entry in sorted(report['opcodes'].items(), key=lambda item: -item[1]['cycles']):
+            lines.append(f"  {mnemonic:<6} {entry['count']:>10}  ciclos {entry['cycles']:>10} ({entry['cycles_percent']:5.1f}%)")
+
+        lines.append(f"Memoria más accedida (top {top}):")
+        busiest = sorted(report['memory'].items(), key=lambda item: (-(item[1]['reads'] + item[1]['writes']), item[0]))[:top]
+        for address, entry in busiest:
+            name = f"  ; {names[address]}" if address in names else ""
+            lines.append(f"  [{address:04X}] lecturas {entry['reads']:>10}  escrituras {entry['writes']:>10}{name}")
+
+        return "\n".join(lines)
+
+    def __str__(self):
+        return f"Execution_Profiler(instrucciones={sum(self.opcodes)}, bloques={len(self.__blocks)})"
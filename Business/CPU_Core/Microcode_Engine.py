@@ -0,0 +1,321 @@
+# Business/CPU_Core/Microcode_Engine.py
+from Business.Basic_Components.Bus import Bus
+from Business.Basic_Components.Bit import Bit
+from Business.CPU_Core.Control_Unit.ControlStore import ControlStore
+
+
+class Micro_Step:
+    """Palabra de control ya decodificada: acciones a aplicar y paso siguiente"""
+
+    def __init__(self, actions, next_step: int, signals):
+        self.actions = tuple(actions)  # action(operand) -> None o paso siguiente forzado
+        self.next_step = next_step     # 0 = fin de instrucción
+        self.signals = tuple(signals)  # Señales activas (traza/depuración)
+
+    def __str__(self):
+        return f"Micro_Step({' '.join(self.signals) or '-'} -> {self.next_step})"
+
+
+class Microcode_Engine:
+    """
+    Motor microprogramado: cada ciclo de reloj aplica una palabra de la
+    ControlStore al banco de registros, la ALU y la memoria.
+
+    Las 256 palabras se decodifican una sola vez en listas de acciones
+    (Micro_Step), así que el ciclo no pasa por SignalGenerator. El origen
+    de cada carga (MAR <- PC u operando, MDR <- memoria o AC, AC <- MDR,
+    inmediato o ALU, PC_LOAD condicionado en JZ) se resuelve en esa
+    decodificación a partir del opcode y el paso de la dirección.
+
+    Todo el estado vive en el Record_Bank: STEP_CNT es el micro-paso,
+    OP_TYPE el opcode, MD_CNT el contador de iteraciones de MULT/DIV y
+    MD_STATE el estado de la FSM (0=IDLE, 1=MULT_INIT, 2=MULT_CYCLE,
+    3=DIV_INIT, 4=DIV_CYCLE, 5=ERROR). Por eso los snapshots de la CPU
+    también capturan una instrucción a medias.
+    """
+
+    FETCH_STEPS = 3
+    MD_IDLE, MD_MULT_INIT, MD_MULT_CYCLE, MD_DIV_INIT, MD_DIV_CYCLE, MD_ERROR = range(6)
+
+    MULT, DIV, JZ = 0x5, 0x6, 0x8
+
+    def __init__(self, cpu, control_store: ControlStore = None):
+        self.cpu = cpu
+        self.control_store = control_store or cpu.control_unit.control_store
+        self.__table = []
+        self.rebuild()
+
+        # Instrucción en curso para el perfilador: PC y ciclo en que empezó
+        self.__instruction_pc = 0
+        self.__instruction_start = 0
+
+    def rebuild(self):
+        """Vuelve a decodificar la ControlStore (p. ej. tras load_from_file)"""
+        self.__table = [self.__decode(address) for address in range(256)]
+
+    def get_micro_step(self, opcode: int, step: int) -> Micro_Step:
+        """Retorna la palabra decodificada de (opcode, paso)"""
+        return self.__table[(opcode << 4) | step]
+
+    # --- Decodificación (una vez por dirección) ---
+    def __decode(self, address: int) -> Micro_Step:
+        opcode, step = address >> 4, address & 0xF
+        word = self.control_store.read(address)
+        signals = [name for name, position in ControlStore.SIGNAL_BITS.items()
+                   if word.get_Line_bit(position).get_value() == 1]
+        active = set(signals)
+
+        def signal(name):
+            return 1 if name in active else 0
+
+        aluop = signal('ALUop1') << 1 | signal('ALUop0')
+        modo_funcion = signal('ALUfunc2') << 2 | signal('ALUfunc1') << 1 | signal('ALUfunc0')
+        fetch = step < self.FETCH_STEPS
+
+        # Orden fijo dentro del micro-paso (transferencias de registro)
+        actions = []
+        if 'MAR_LOAD' in active:
+            actions.append(self._mar_from_pc if fetch else self._mar_from_operand)
+        if 'MDR_LOAD' in active:
+            if 'MEM_READ' not in active:
+                actions.append(self._mdr_from_ac)
+            else:
+                actions.append(self._mdr_from_fetch if fetch else self._mdr_from_memory)
+        if 'PC_INC' in active:
+            actions.append(self._pc_increment)
+        if 'IR_LOAD' in active:
+            actions.append(self._ir_from_mdr)
+        if 'AC_LOAD' in active:
+            if opcode in ControlStore.ALU_MEMORY_OPS:
+                actions.append(self.__alu_action(aluop, modo_funcion, from_memory=True))
+            elif opcode in ControlStore.ALU_SHIFT_OPS:
+                actions.append(self.__alu_action(aluop, modo_funcion, from_memory=False))
+            elif opcode == 0x9:
+                actions.append(self._ac_from_operand)
+            else:
+                actions.append(self._ac_from_mdr)
+        if 'PC_LOAD' in active:
+            actions.append(self._pc_load_if_zero if opcode == self.JZ else self._pc_load)
+        if 'MEM_WRITE' in active:
+            actions.append(self._mem_write)
+        if 'MD_START' in active:
+            actions.append(self._md_start_div if opcode == self.DIV else self._md_start_mult)
+        if 'MD_SHIFT' in active:
+            iteration = self._md_divide_step if 'MD_SUB' in active else self._md_multiply_step
+            actions.append(self.__loop_action(iteration, step))
+        if 'HI_LOAD' in active or 'LO_LOAD' in active:
+            actions.append(self._md_finish_div if opcode == self.DIV else self._md_finish_mult)
+        if 'HALT' in active:
+            actions.append(self._halt)
+
+        if 'END_INSTR' in active or step == 0xF:
+            next_step = 0
+        else:
+            next_step = step + 1
+
+        return Micro_Step(actions, next_step, signals)
+
+    def __alu_action(self, aluop: int, modo_funcion: int, from_memory: bool):
+        registers = self.cpu.registers
+
+        def ac_from_alu(operand):
+            b = registers.get_MDR().get_Dec_Value() if from_memory else operand & 0xF
+            self._alu(b, aluop, modo_funcion)
+        return ac_from_alu
+
+    def __loop_action(self, iteration, step: int):
+        registers = self.cpu.registers
+
+        def md_loop(operand):
+            iteration()
+            # MD_CNT da la vuelta (0 -> 15 -> 0) tras 16 iteraciones
+            count = (registers.get_MD_CNT().get_Dec_Value() + 1) & 0xF
+            registers.get_MD_CNT().set_Value_int(count)
+            return None if count == 0 else step
+        return md_loop
+
+    # --- Ciclo de reloj ---
+    def clock(self):
+        """Ejecuta un micro-ciclo (un ciclo de reloj)"""
+        cpu = self.cpu
+        registers = cpu.registers
+        step_register = registers.get_STEP_CNT()
+        step = step_register.get_Dec_Value()
+        opcode = registers.get_OP_TYPE().get_Dec_Value()
+        operand = registers.get_IR().get_Dec_Value() & 0xFFF
+
+        cpu.clock_cycle += 1
+        if step == 0 and cpu.profiler is not None:
+            self.__instruction_pc = registers.get_PC().get_Dec_Value()
+            self.__instruction_start = cpu.clock_cycle - 1
+
+        # Handler registrado por el usuario: se ejecuta en el primer paso tras el fetch
+        if step == self.FETCH_STEPS and cpu._dispatch[opcode] is not cpu._builtin_dispatch[opcode]:
+            if cpu.trace.enabled:
+                cpu.trace.emit("CPU", f"CPU: µ[{opcode:X}:{step:X}] handler {cpu._get_mnemonic(opcode)}")
+            cpu._dispatch[opcode](operand)
+            step_register.set_Value_int(0)
+            cpu.instructions_executed += 1
+            if cpu.profiler is not None:
+                self.__profile()
+            return
+
+        micro_step = self.__table[(opcode << 4) | step]
+        if cpu.trace.enabled:
+            cpu.trace.emit("CPU", f"CPU: µ[{opcode:X}:{step:X}] {' '.join(micro_step.signals) or '-'}")
+
+        next_step = micro_step.next_step
+        for action in micro_step.actions:
+            forced = action(operand)
+            if forced is not None:
+                next_step = forced
+
+        step_register.set_Value_int(next_step)
+        if next_step == 0:
+            cpu.instructions_executed += 1
+            if cpu.profiler is not None:
+                self.__profile()
+
+    def __profile(self):
+        """Registra en el perfilador la instrucción que acaba de terminar"""
+        cpu = self.cpu
+        registers = cpu.registers
+        cpu.profiler.record(self.__instruction_pc, registers.get_IR().get_Dec_Value(),
+                            registers.get_FLAG_Z().get_value(), cpu.clock_cycle - self.__instruction_start)
+
+    def run_instruction(self):
+        """Ejecuta micro-ciclos hasta terminar la instrucción en curso (o HALT)"""
+        cpu = self.cpu
+        step_register = cpu.registers.get_STEP_CNT()
+        self.clock()
+        while cpu.running.get_value() and step_register.get_Dec_Value() != 0:
+            self.clock()
+
+    # --- Acciones del camino de datos ---
+    def _mar_from_pc(self, operand):
+        registers = self.cpu.registers
+        registers.set_MAR(Bus(16, registers.get_PC().get_Dec_Value()))
+
+    def _mar_from_operand(self, operand):
+        self.cpu.registers.set_MAR(Bus(16, operand))
+
+    def _mdr_from_memory(self, operand):
+        cpu = self.cpu
+        if cpu.port is not None:
+            cpu.registers.set_MDR(Bus(16, cpu.port.read(cpu.registers.get_MAR().get_Dec_Value())))
+
+    def _mdr_from_fetch(self, operand):
+        cpu = self.cpu
+        if cpu.port is not None:
+            cpu.registers.set_MDR(Bus(16, cpu.port.fetch(cpu.registers.get_MAR().get_Dec_Value())))
+
+    def _mdr_from_ac(self, operand):
+        registers = self.cpu.registers
+        registers.set_MDR(registers.get_AC().get_Value())
+
+    def _pc_increment(self, operand):
+        pc = self.cpu.registers.get_PC()
+        pc.set_Value_int(pc.get_Dec_Value() + 1)
+
+    def _ir_from_mdr(self, operand):
+        cpu = self.cpu
+        registers = cpu.registers
+        registers.set_IR(registers.get_MDR().get_Value())
+        registers.get_OP_TYPE().set_Value_int(registers.get_IR().get_Dec_Value() >> 12)
+        cpu.control_unit.load_instruction(registers.get_IR().get_Value())
+
+    def _ac_from_mdr(self, operand):
+        registers = self.cpu.registers
+        registers.set_AC(registers.get_MDR().get_Value())
+
+    def _ac_from_operand(self, operand):
+        self.cpu.registers.set_AC(Bus(16, operand))
+
+    def _alu(self, b: int, aluop: int, modo_funcion: int):
+        cpu = self.cpu
+        registers = cpu.registers
+        result = cpu.alu.execute_with_signals(registers.get_AC().get_Dec_Value(), b, aluop, modo_funcion)
+        registers.set_AC(Bus(16, result))
+        registers.set_FLAG_Z(cpu.alu.get_zero_flag())
+        registers.set_FLAG_C(cpu.alu.get_carry_out())
+        registers.set_FLAG_N(cpu.alu.get_negative_flag())
+
+    def _pc_load(self, operand):
+        self.cpu.registers.get_PC().set_Value_int(operand)
+
+    def _pc_load_if_zero(self, operand):
+        registers = self.cpu.registers
+        if registers.get_FLAG_Z().get_value() == 1:
+            registers.get_PC().set_Value_int(operand)
+
+    def _mem_write(self, operand):
+        cpu = self.cpu
+        if cpu.port is not None:
+            cpu.port.write(cpu.registers.get_MAR().get_Dec_Value(), cpu.registers.get_MDR().get_Dec_Value())
+
+    def _halt(self, operand):
+        self.cpu.running.set_value(0)
+
+    # --- MULT/DIV secuenciales (HI = acumulador/resto, LO = multiplicador/cociente) ---
+    def __md_start(self, state: int):
+        registers = self.cpu.registers
+        registers.set_HI(Bus(16, 0))
+        registers.set_LO(Bus(16, registers.get_AC().get_Dec_Value()))
+        registers.set_MD_CNT(Bus(4, 0))
+        registers.set_MD_STATE(Bus(3, state))
+
+    def _md_start_mult(self, operand):
+        self.__md_start(self.MD_MULT_INIT)
+
+    def _md_start_div(self, operand):
+        registers = self.cpu.registers
+        if registers.get_MDR().get_Dec_Value() == 0:
+            # División por cero: STATUS = 0x01, C = 1, HI/LO sin cambios
+            registers.set_STATUS(Bus(8, 0x01))
+            registers.set_FLAG_C(Bit(1))
+            registers.set_MD_STATE(Bus(3, self.MD_ERROR))
+            return 0
+        self.__md_start(self.MD_DIV_INIT)
+        return None
+
+    def _md_multiply_step(self):
+        """Suma y desplaza: {C, HI, LO} >>= 1 tras sumar MDR si LO[0] = 1"""
+        registers = self.cpu.registers
+        hi = registers.get_HI().get_Dec_Value()
+        lo = registers.get_LO().get_Dec_Value()
+        if lo & 1:
+            hi += registers.get_MDR().get_Dec_Value()
+        combined = ((hi << 16) | lo) >> 1
+        registers.set_HI(Bus(16, combined >> 16))
+        registers.set_LO(Bus(16, combined & 0xFFFF))
+        registers.get_MD_STATE().set_Value_int(self.MD_MULT_CYCLE)
+
+    def _md_divide_step(self):
+        """Desplaza y resta (división con restauración): un bit de cociente por iteración"""
+        registers = self.cpu.registers
+        divisor = registers.get_MDR().get_Dec_Value()
+        lo = registers.get_LO().get_Dec_Value()
+        remainder = (registers.get_HI().get_Dec_Value() << 1) | (lo >> 15)
+        lo = (lo << 1) & 0xFFFF
+        if remainder >= divisor:
+            remainder -= divisor
+            lo |= 1
+        registers.set_HI(Bus(16, remainder))
+        registers.set_LO(Bus(16, lo))
+        registers.get_MD_STATE().set_Value_int(self.MD_DIV_CYCLE)
+
+    def _md_finish_mult(self, operand):
+        registers = self.cpu.registers
+        hi = registers.get_HI().get_Dec_Value()
+        lo = registers.get_LO().get_Dec_Value()
+        registers.set_FLAG_Z(Bit(1 if hi == 0 and lo == 0 else 0))
+        registers.set_FLAG_N(Bit(1 if (lo & 0x8000) else 0))
+        registers.set_FLAG_C(Bit(1 if hi != 0 else 0))
+        registers.get_MD_STATE().set_Value_int(self.MD_IDLE)
+
+    def _md_finish_div(self, operand):
+        registers = self.cpu.registers
+        lo = registers.get_LO().get_Dec_Value()
+        registers.set_FLAG_Z(Bit(1 if lo == 0 else 0))
+        registers.set_FLAG_N(Bit(1 if (lo & 0x8000) else 0))
+        registers.get_MD_STATE().set_Value_int(self.MD_IDLE)
@@ -0,0 +1,97 @@
+# Business/CPU_Core/Trace_Sink.py
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List, Optional, Tuple
+
+
+class Trace_Sink(ABC):
+    """
+    Destino de los mensajes de traza de la CPU y la Unidad de Control.
+
+    Los componentes consultan `enabled` antes de formatear un mensaje,
+    así que con un sink deshabilitado el ciclo no construye strings ni
+    escribe en stdout. Las subclases implementan emit().
+    """
+
+    enabled = True
+
+    @abstractmethod
+    def emit(self, source: str, message: str):
+        """Recibe una línea de traza ya formateada (source: 'CPU', 'UC', ...)"""
+
+    def flush(self):
+        """Vuelca lo pendiente (si el sink almacena algo)"""
+        pass
+
+
+class Null_Sink(Trace_Sink):
+    """Descarta todo. Es el sink por defecto para ejecuciones sin consola."""
+
+    enabled = False
+
+    def emit(self, source: str, message: str):
+        pass
+
+
+class Console_Sink(Trace_Sink):
+    """Imprime cada línea tal cual, igual que la salida histórica del simulador."""
+
+    def __init__(self, stream=None):
+        # Si no se indica stream se usa sys.stdout del momento (respeta redirecciones)
+        self.stream = stream
+
+    def emit(self, source: str, message: str):
+        print(message, file=self.stream or sys.stdout)
+
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+
+class Buffered_Sink(Trace_Sink):
+    """
+    Guarda las líneas en memoria como tuplas (source, message).
+    Con max_lines se comporta como buffer circular (conserva las últimas).
+    """
+
+    def __init__(self, max_lines: Optional[int] = None):
+        if max_lines is not None and max_lines <= 0:
+            raise ValueError("max_lines debe ser mayor que 0")
+        self.max_lines = max_lines
+        self.__records = deque(maxlen=max_lines)
+
+    def emit(self, source: str, message: str):
+        self.__records.append((source, message))
+
+    def get_records(self) -> List[Tuple[str, str]]:
+        return list(self.__records)
+
+    def get_lines(self, source: Optional[str] = None) -> List[str]:
+        return [message for src, message in self.__records if source is None or src == source]
+
+    def dump(self, stream=None):
+        """Escribe todas las líneas guardadas en un stream (stdout por defecto)"""
+        stream = stream or sys.stdout
+        for _, message in self.__records:
+            stream.write(message + "\n")
+
+    def clear(self):
+        self.__records.clear()
+
+    def __len__(self):
+        return len(self.__records)
+
+
+# Sinks disponibles por nombre (configuración del sistema)
+TRACE_SINKS = {
+    'null': Null_Sink,
+    'console': Console_Sink,
+    'buffered': Buffered_Sink,
+}
+
+
+def create_trace_sink(kind: str) -> Trace_Sink:
+    """Crea un sink a partir de su nombre ('null', 'console' o 'buffered')"""
+    if kind not in TRACE_SINKS:
+        raise ValueError(f"Sink de traza '{kind}' no válido. Opciones: {', '.join(TRACE_SINKS)}")
+    return TRACE_SINKS[kind]()
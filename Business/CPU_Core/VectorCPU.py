@@ -0,0 +1,325 @@
+# Business/CPU_Core/VectorCPU.py
+import contextlib
+import io
+
+import numpy as np
+
+from Business.Memory.RAM import RAM
+
+
+class VectorCPU:
+    """
+    K CPUs simuladas en paralelo (lockstep) sobre arreglos de NumPy.
+
+    Cada registro es un arreglo uint16[K] (STATUS/OP_TYPE/banderas uint8[K]) y la
+    RAM es uint16[K, tamaño]. En cada ciclo todas las máquinas activas hacen
+    fetch a la vez y luego se ejecuta cada opcode presente sobre el subconjunto
+    de máquinas que lo tiene (los PCs pueden divergir libremente).
+
+    Resultados idénticos a CPU.run_program (motor funcional) para todo el ISA.
+
+    Ejemplo (un mismo programa con K datos de entrada distintos):
+        vcpu = VectorCPU(count=len(valores))
+        vcpu.load_program(programa)
+        vcpu.write_word(0x100, valores)          # un valor por máquina
+        vcpu.run_program(start_address=0x0000, max_cycles=100)
+        resultados = vcpu.read_word(0x101)       # uint16[K]
+    """
+
+    WORD_MASK = 0xFFFF
+
+    # opcode -> (ALUop, ModoFunción), igual que la tabla de despacho de la CPU
+    ALU_OPS = {
+        0x3: (0b00, 0b000),  # ADD
+        0x4: (0b00, 0b001),  # SUB
+        0xA: (0b01, 0b000),  # AND
+        0xB: (0b01, 0b001),  # OR
+        0xC: (0b01, 0b010),  # XOR
+    }
+    SHIFT_OPS = {
+        0xD: (0b10, 0b000),  # SHL
+        0xE: (0b10, 0b001),  # SHR
+    }
+
+    def __init__(self, count: int, ram_size_kb: int = 4):
+        if count <= 0:
+            raise ValueError("El número de máquinas debe ser mayor que 0")
+
+        self.count = count
+        self.size = ram_size_kb * 1024
+        self.ram = np.zeros((count, self.size), dtype=np.uint16)
+
+        # Tabla de despacho: opcode -> handler(rows, operands, opcode)
+        self._dispatch = [self._op_nop, self._op_load, self._op_store, None,
+                          None, self._op_mult, self._op_div, self._op_jump,
+                          self._op_jz, self._op_loadi, None, None,
+                          None, None, None, self._op_halt]
+        for opcode in self.ALU_OPS:
+            self._dispatch[opcode] = self._op_alu
+        for opcode in self.SHIFT_OPS:
+            self._dispatch[opcode] = self._op_shift
+
+        self.reset()
+
+    def reset(self):
+        """Resetea registros, banderas y contadores de todas las máquinas (la RAM se conserva)"""
+        k = self.count
+        self.pc = np.zeros(k, dtype=np.uint16)
+        self.ir = np.zeros(k, dtype=np.uint16)
+        self.ac = np.zeros(k, dtype=np.uint16)
+        self.mar = np.zeros(k, dtype=np.uint16)
+        self.mdr = np.zeros(k, dtype=np.uint16)
+        self.temp = np.zeros(k, dtype=np.uint16)
+        self.hi = np.zeros(k, dtype=np.uint16)
+        self.lo = np.zeros(k, dtype=np.uint16)
+        self.status = np.zeros(k, dtype=np.uint8)
+        self.op_type = np.zeros(k, dtype=np.uint8)
+
+        self.flag_z = np.zeros(k, dtype=np.uint8)
+        self.flag_c = np.zeros(k, dtype=np.uint8)
+        self.flag_n = np.zeros(k, dtype=np.uint8)
+
+        self.running = np.zeros(k, dtype=bool)
+        self.clock_cycle = np.zeros(k, dtype=np.int64)
+        self.instructions_executed = np.zeros(k, dtype=np.int64)
+
+    # ===== CARGA Y ACCESO A MEMORIA =====
+
+    def load_program(self, program: list, start_address: int = 0):
+        """Copia las mismas palabras en la RAM de todas las máquinas"""
+        words = np.asarray(program, dtype=np.int64)
+        if start_address < 0 or start_address + len(words) > self.size:
+            raise ValueError(f"Programa fuera del rango de la RAM (0x0000-0x{self.size - 1:04X})")
+        if ((words < 0) | (words > self.WORD_MASK)).any():
+            raise ValueError("Las instrucciones deben ser palabras de 16 bits")
+        self.ram[:, start_address:start_address + len(words)] = words.astype(np.uint16)
+
+    def load_from_json(self, json_file: str):
+        """Carga un programa JSON (mismo formato que RAM.load_from_json) en todas las máquinas"""
+        ram = RAM(self.size // 1024)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ram.load_from_json(json_file)
+        self.ram[:] = np.frombuffer(ram.read_block(0, ram.size), dtype=np.uint16)
+
+    def write_word(self, address: int, values):
+        """Escribe en una dirección: un valor para todas o un arreglo con un valor por máquina"""
+        if address < 0 or address >= self.size:
+            raise ValueError(f"Dirección 0x{address:04X} fuera del rango de la RAM")
+        values = np.broadcast_to(np.asarray(values, dtype=np.int64), (self.count,))
+        if ((values < 0) | (values > self.WORD_MASK)).any():
+            raise ValueError("Los valores deben ser palabras de 16 bits")
+        self.ram[:, address] = values
+
+    def read_word(self, address: int) -> np.ndarray:
+        """Lee una dirección en todas las máquinas (uint16[K])"""
+        if address < 0 or address >= self.size:
+            raise ValueError(f"Dirección 0x{address:04X} fuera del rango de la RAM")
+        return self.ram[:, address].copy()
+
+    def _read(self, rows, addresses):
+        # Igual que RAM.read_direct: fuera de rango se lee 0xFFFF
+        values = np.full(len(rows), self.WORD_MASK, dtype=np.int64)
+        inside = addresses < self.size
+        values[inside] = self.ram[rows[inside], addresses[inside]]
+        return values
+
+    def _write(self, rows, addresses, values):
+        # Igual que RAM.write_direct: fuera de rango se ignora
+        inside = addresses < self.size
+        self.ram[rows[inside], addresses[inside]] = values[inside]
+
+    # ===== EJECUCIÓN =====
+
+    def run_program(self, start_address=0, max_cycles: int = 100):
+        """
+        Equivalente vectorial de CPU.run_program.
+        start_address puede ser un entero o un arreglo con un PC inicial por máquina.
+        """
+        self.reset()
+        self.pc[:] = start_address
+        self.running[:] = True
+
+        while True:
+            active = np.flatnonzero(self.running & (self.clock_cycle < max_cycles))
+            if len(active) == 0:
+                break
+            self._step(active)
+
+    def step(self):
+        """Ejecuta un ciclo en todas las máquinas que siguen corriendo"""
+        active = np.flatnonzero(self.running)
+        if len(active):
+            self._step(active)
+
+    def _step(self, rows):
+        # Fetch: MAR ← PC, MDR ← Memoria[PC], IR ← MDR, PC ← PC + 1
+        pcs = self.pc[rows].astype(np.int64)
+        words = self._read(rows, pcs)
+        self.mar[rows] = pcs
+        self.mdr[rows] = words
+        self.ir[rows] = words
+        self.pc[rows] = (pcs + 1) & self.WORD_MASK
+        self.clock_cycle[rows] += 1
+
+        opcodes = words >> 12
+        operands = words & 0xFFF
+        self.op_type[rows] = opcodes
+
+        # Ejecución agrupada por opcode
+        for opcode in np.unique(opcodes):
+            selected = opcodes == opcode
+            self._dispatch[opcode](rows[selected], operands[selected], int(opcode))
+
+        self.instructions_executed[rows] += 1
+
+    # ===== HANDLERS (rows: máquinas, operands: operandos de 12 bits) =====
+
+    def _op_nop(self, rows, operands, opcode):
+        pass
+
+    def _op_load(self, rows, operands, opcode):
+        values = self._read(rows, operands)
+        self.mar[rows] = operands
+        self.mdr[rows] = values
+        self.ac[rows] = values
+
+    def _op_store(self, rows, operands, opcode):
+        values = self.ac[rows].astype(np.int64)
+        self.mar[rows] = operands
+        self.mdr[rows] = values
+        self._write(rows, operands, values)
+
+    def _op_alu(self, rows, operands, opcode):
+        values = self._read(rows, operands)
+        self.mar[rows] = operands
+        self.mdr[rows] = values
+        aluop, mode = self.ALU_OPS[opcode]
+        self._alu(rows, self.ac[rows].astype(np.int64), values, aluop, mode)
+
+    def _op_shift(self, rows, operands, opcode):
+        aluop, mode = self.SHIFT_OPS[opcode]
+        self._alu(rows, self.ac[rows].astype(np.int64), operands & 0xF, aluop, mode)
+
+    def _op_mult(self, rows, operands, opcode):
+        result = self.ac[rows].astype(np.int64) * self._read(rows, operands)
+        hi = (result >> 16) & self.WORD_MASK
+        lo = result & self.WORD_MASK
+        self.hi[rows] = hi
+        self.lo[rows] = lo
+        self.flag_z[rows] = result == 0
+        self.flag_n[rows] = lo >> 15
+        self.flag_c[rows] = hi != 0
+
+    def _op_div(self, rows, operands, opcode):
+        dividend = self.ac[rows].astype(np.int64)
+        divisor = self._read(rows, operands)
+
+        # División por cero: STATUS = 0x01, C = 1 (el resto no cambia)
+        zero = divisor == 0
+        self.status[rows[zero]] = 0x01
+        self.flag_c[rows[zero]] = 1
+
+        valid = ~zero
+        rows, dividend, divisor = rows[valid], dividend[valid], divisor[valid]
+        quotient = dividend // divisor
+        self.hi[rows] = dividend % divisor
+        self.lo[rows] = quotient
+        self.flag_z[rows] = quotient == 0
+        self.flag_n[rows] = quotient >> 15
+
+    def _op_jump(self, rows, operands, opcode):
+        self.pc[rows] = operands
+
+    def _op_jz(self, rows, operands, opcode):
+        taken = self.flag_z[rows] == 1
+        self.pc[rows[taken]] = operands[taken]
+
+    def _op_loadi(self, rows, operands, opcode):
+        self.ac[rows] = operands
+
+    def _op_halt(self, rows, operands, opcode):
+        self.running[rows] = False
+
+    def _alu(self, rows, a, b, aluop, mode):
+        """Versión vectorial de Functional_ALU.compute (AC y banderas)"""
+        mask = self.WORD_MASK
+
+        # La unidad aritmética siempre se evalúa: de aquí sale el Carry
+        if mode & 1:
+            total = a + (~b & mask) + 1
+        else:
+            total = a + b
+
+        if aluop == 0b00:
+            result = total & mask
+        elif aluop == 0b01:
+            logic = mode & 0b11
+            if logic == 0b00:
+                result = a & b
+            elif logic == 0b01:
+                result = a | b
+            elif logic == 0b10:
+                result = a ^ b
+            else:
+                result = ~a & mask
+        elif mode == 0b000:  # LSL
+            result = (a << b) & mask
+        elif mode == 0b001:  # ASR
+            result = (np.where(a & 0x8000, a - 0x10000, a) >> b) & mask
+        elif mode == 0b100:  # LSR
+            result = a >> b
+        else:
+            raise ValueError(f"Modo de desplazamiento {mode:03b} no soportado en VectorCPU")
+
+        self.ac[rows] = result
+        self.flag_c[rows] = total >> 16
+        self.flag_z[rows] = result == 0
+        self.flag_n[rows] = result >> 15
+
+    # ===== ESTADO =====
+
+    def get_status(self, machine: int):
+        """Estado de una máquina con el mismo formato que CPU.get_status"""
+        i = machine
+        return {
+            'running': int(self.running[i]),
+            'clock_cycle': int(self.clock_cycle[i]),
+            'instructions': int(self.instructions_executed[i]),
+
+            # Registros principales
+            'pc': f"0x{int(self.pc[i]):04X}",
+            'ir': f"0x{int(self.ir[i]):04X}",
+            'ac': f"0x{int(self.ac[i]):04X}",
+            'mar': f"0x{int(self.mar[i]):04X}",
+            'mdr': f"0x{int(self.mdr[i]):04X}",
+            'temp': f"0x{int(self.temp[i]):04X}",
+
+            # Registros secuenciales
+            'hi': f"0x{int(self.hi[i]):04X}",
+            'lo': f"0x{int(self.lo[i]):04X}",
+            'md_cnt': "0x0",
+            'md_state': "0x0",
+
+            # Registros de control
+            'step_cnt': "0x0",
+            'op_type': f"0x{int(self.op_type[i]):X}",
+            'status': f"0x{int(self.status[i]):02X}",
+
+            # Banderas
+            'flags': {
+                'Z': int(self.flag_z[i]),
+                'C': int(self.flag_c[i]),
+                'N': int(self.flag_n[i])
+            }
+        }
+
+    def get_memory(self, machine: int) -> np.ndarray:
+        """Copia de la RAM de una máquina"""
+        return self.ram[machine].copy()
+
+    def __len__(self):
+        return self.count
+
+    def __str__(self):
+        running = int(self.running.sum())
+        return f"VectorCPU({self.count} máquinas, {running} en ejecución, RAM {self.size} palabras)"
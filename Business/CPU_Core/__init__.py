@@ -1,3 +1,12 @@
 from .CPU import CPU
+from .Trace_Sink import Trace_Sink, Null_Sink, Console_Sink, Buffered_Sink
+from .Execution_Profiler import Execution_Profiler
 
-__all__ = ['CPU']
\ No newline at end of file
+
+def get_VectorCPU():
+    """Importa y retorna VectorCPU (carga NumPy solo cuando se usa)"""
+    from .VectorCPU import VectorCPU
+    return VectorCPU
+
+
+__all__ = ['CPU', 'Trace_Sink', 'Null_Sink', 'Console_Sink', 'Buffered_Sink', 'Execution_Profiler', 'get_VectorCPU']
@@ -1,8 +1,12 @@
 # Business/SystemAssembler.py
 from Business.Memory.RAM import RAM
+from Business.Memory.Paged_RAM import Paged_RAM
 from Business.Memory.SystemBus import SystemBus
+from Business.Memory.Cache import Cache_Hierarchy
 from Business.CPU_Core.CPU import CPU
 from Business.CPU_Core.Control_Unit.Control_Unit import Control_Unit
+from Business.CPU_Core.Trace_Sink import Trace_Sink, create_trace_sink
+from Business.IO import Keyboard, Seven_Segment_Display, Console_Output, DMA_Controller
 from typing import Dict, Any, Optional, Tuple
 import json
 from pathlib import Path
@@ -14,6 +18,9 @@ class System:
     de todos los componentes (CPU, RAM, Bus, etc.)
     """
     
+    # Registros de E/S mapeados a partir de config['io_base'] (desplazamiento de cada dispositivo)
+    IO_LAYOUT = (('keyboard', 0x0), ('display', 0x4), ('console', 0x8), ('dma', 0xA))
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         Inicializa el ensamblador con configuración
@@ -26,20 +33,39 @@ class System:
             'data_width': 16,
             'address_width': 12,
             'ram_size_kb': 4,
+            'ram_paged': False,          # RAM dispersa de 2^address_width palabras (páginas al escribir)
             'cpu_frequency': 1_000_000,
             'enable_debug': True,
-            'bus_arbitration': True
+            'bus_arbitration': True,
+            'bus_priority': ['CPU', 'DMA', 'IO'],  # Maestros de mayor a menor prioridad
+            'bus_policy': 'priority',    # Arbitraje: 'priority' (prioridad fija) o 'round_robin'
+            'cpu_engine': 'functional',  # 'functional' (rápido) o 'gate' (compuertas)
+            'trace_sink': 'console',     # 'console', 'buffered' o 'null' (sin traza)
+            'block_cache': True,         # Traducción de bloques básicos (motor funcional)
+            'alu_cache_size': 0,         # Caché LRU de resultados de la ALU (motor 'gate', 0 = sin caché)
+            'profiler': False,           # Perfilador de ejecución por PC/opcode (ver get_profile_report)
+            'io_devices': False,         # Teclado, display de 7 segmentos, consola y DMA mapeados en memoria
+            'io_base': 0xFF0,            # Primera dirección de E/S (la RAM se mapea por debajo)
+            'cache': None                # Jerarquía de caché (ver Cache_Hierarchy), None = sin caché
         }
         
-        # Combinar configuración
-        self.config = {**self.default_config, **(config or {})}
+        # Combinar configuración (admite el formato de Data/Configs: sección 'system' anidada)
+        config = config or {}
+        self.config = {**self.default_config, **config.get('system', {}), **config}
         
         # Componentes del sistema (se inicializan en assemble())
         self.system_bus: Optional[SystemBus] = None
         self.ram: Optional[RAM] = None
         self.cpu: Optional[CPU] = None
+        self.trace: Optional[Trace_Sink] = None
         self.control_unit: Optional[Control_Unit] = None
         
+        # Dispositivos de E/S (solo con config['io_devices'])
+        self.keyboard: Optional[Keyboard] = None
+        self.display: Optional[Seven_Segment_Display] = None
+        self.console: Optional[Console_Output] = None
+        self.dma: Optional[DMA_Controller] = None
+        
         # Estado del ensamblaje
         self.assembled = False
         self.assembly_time: Optional[datetime] = None
@@ -76,6 +102,8 @@ class System:
                 data_width=self.config['data_width'],
                 addr_width=self.config['address_width']
             )
+            self.system_bus.set_priority(self.get_bus_priority())
+            self.system_bus.set_policy(self.get_bus_policy())
             
             self._log_step("SystemBus creado", True)
             if verbose:
@@ -86,7 +114,10 @@ class System:
             if verbose:
                 print("2. Creando RAM...")
             
-            self.ram = RAM(self.config['ram_size_kb'])
+            if self.config['ram_paged']:
+                self.ram = Paged_RAM(max(1, (1 << self.config['address_width']) // 1024))
+            else:
+                self.ram = RAM(self.config['ram_size_kb'])
             
             self._log_step("RAM creada", True)
             if verbose:
@@ -97,17 +128,21 @@ class System:
             if verbose:
                 print("3. Creando CPU...")
             
-            self.cpu = CPU(self.system_bus)
+            self.trace = create_trace_sink(self.config['trace_sink'])
+            self.cpu = CPU(self.system_bus, engine=self.config['cpu_engine'], trace=self.trace,
+                           block_cache=self.config['block_cache'],
+                           alu_cache_size=self.config['alu_cache_size'])
             
             self._log_step("CPU creada", True)
             if verbose:
-                print(f"   ✓ CPU: Procesador de {self.config['data_width']} bits")
+                print(f"   ✓ CPU: Procesador de {self.config['data_width']} bits "
+                      f"(motor {self.config['cpu_engine']})")
             
             # 4. Crear Unidad de Control
             if verbose:
                 print("4. Creando Unidad de Control...")
             
-            self.control_unit = Control_Unit()
+            self.control_unit = Control_Unit(trace=self.trace)
             
             self._log_step("Control Unit creada", True)
             if verbose:
@@ -117,16 +152,32 @@ class System:
             if verbose:
                 print("5. Conectando componentes...")
             
-            # Conectar RAM al SystemBus
+            # Conectar RAM al SystemBus (por debajo de la ventana de E/S si la hay)
+            ram_end = self.ram.size - 1
+            if self.config['io_devices']:
+                ram_end = min(ram_end, self.config['io_base'] - 1)
             self.system_bus.connect_device(
                 self.ram,
                 "RAM",
-                (0, self.ram.size - 1),
-                "slave"
+                (0, ram_end),
+                "slave",
+                verbose=verbose
             )
             
+            if self.config['io_devices']:
+                self._connect_io_devices(verbose)
+            
             # Conectar memoria a la CPU
             self.cpu.connect_memory(self.ram)
+            if self.config['profiler']:
+                self.cpu.enable_profiler()
+            # Contadores por PC: el PC es de 16 bits
+            hierarchy = Cache_Hierarchy.from_config(self.config['cache'], 1 << min(self.config['address_width'], 16))
+            if hierarchy is not None:
+                self.cpu.enable_cache(hierarchy)
+                if verbose:
+                    for cache in hierarchy.caches():
+                        print(f"   ✓ Caché {cache.describe()}")
             
             self._log_step("Componentes conectados", True)
             
@@ -164,10 +215,45 @@ class System:
             self.ram = None
             self.cpu = None
             self.control_unit = None
+            self.keyboard = self.display = self.console = self.dma = None
             self.assembled = False
             
             return False
     
+    def _connect_io_devices(self, verbose: bool):
+        """Crea el teclado, el display, la consola y el DMA y los mapea desde config['io_base']"""
+        self.keyboard = Keyboard()
+        self.display = Seven_Segment_Display()
+        self.console = Console_Output()
+        self.dma = DMA_Controller(self.system_bus)
+        
+        for name, offset in self.IO_LAYOUT:
+            device = getattr(self, name)
+            self.system_bus.connect_device(device, name.upper(), device.get_range(self.config['io_base'] + offset),
+                                           "slave", verbose=verbose)
+        self._log_step("Dispositivos de E/S conectados", True)
+    
+    def get_bus_priority(self) -> list:
+        """
+        Prioridad de los maestros del bus: config['bus']['priority'] (formato
+        de Data/Configs) o config['bus_priority']. Sin arbitraje
+        (bus_arbitration = False) todos los maestros tienen la misma.
+        """
+        bus_config = self.config.get('bus', {})
+        if not bus_config.get('arbitration', self.config['bus_arbitration']):
+            return []
+        return list(bus_config.get('priority', self.config['bus_priority']))
+    
+    def get_bus_policy(self) -> str:
+        """Política de arbitraje: config['bus']['policy'] o config['bus_policy']"""
+        return self.config.get('bus', {}).get('policy', self.config['bus_policy'])
+    
+    def get_io_devices(self) -> Dict[str, Any]:
+        """Dispositivos de E/S conectados: nombre -> (dirección base, dispositivo)"""
+        if self.keyboard is None:
+            return {}
+        return {name: (self.config['io_base'] + offset, getattr(self, name)) for name, offset in self.IO_LAYOUT}
+    
     def _log_step(self, message: str, success: bool):
         """Registra un paso del ensamblaje"""
         self.assembly_log.append({
@@ -190,6 +276,55 @@ class System:
         if self.ram:
             self.ram.read_count = 0
             self.ram.write_count = 0
+        
+        for _, device in self.get_io_devices().values():
+            device.reset()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Captura el estado completo del sistema: registros, ALU, Unidad de
+        Control, contadores del SystemBus, dispositivos de E/S y RAM (copia en
+        escritura por páginas, así que tomar muchos snapshots es barato).
+        
+        Returns:
+            Snapshot para pasar a restore()
+        """
+        if not self.assembled:
+            raise ValueError("Sistema no ensamblado. Ejecute assemble() primero.")
+        
+        return {
+            'cpu': self.cpu.snapshot(),
+            'control_unit': self.control_unit.snapshot(),
+            'system_bus': self.system_bus.snapshot(),
+            'ram': self.ram.snapshot(),
+            'io': {name: device.snapshot() for name, (_, device) in self.get_io_devices().items()},
+            'current_program': dict(self.current_program) if self.current_program else None,
+            'program_loaded': self.program_loaded,
+            'taken_at': datetime.now().isoformat()
+        }
+    
+    def restore(self, snapshot: Dict[str, Any]):
+        """
+        Vuelve al estado de un snapshot tomado con snapshot() en este sistema
+        (o en otro con la misma configuración). Un snapshot puede restaurarse
+        cualquier número de veces.
+        """
+        if not self.assembled:
+            raise ValueError("Sistema no ensamblado. Ejecute assemble() primero.")
+        
+        self.cpu.restore(snapshot['cpu'])
+        self.control_unit.restore(snapshot['control_unit'])
+        self.system_bus.restore(snapshot['system_bus'])
+        self.ram.restore(snapshot['ram'])
+        
+        devices = self.get_io_devices()
+        if set(snapshot['io']) != set(devices):
+            raise ValueError(f"El snapshot tiene los dispositivos {sorted(snapshot['io'])}, el sistema {sorted(devices)}")
+        for name, state in snapshot['io'].items():
+            devices[name][1].restore(state)
+        
+        self.current_program = dict(snapshot['current_program']) if snapshot['current_program'] else None
+        self.program_loaded = snapshot['program_loaded']
     
     def load_program_from_json(self, json_path: str, verbose: bool = True) -> bool:
         """
@@ -423,11 +558,18 @@ class System:
             status['components']['ram'] = self.ram.get_stats()
         
         if self.system_bus:
-            status['components']['system_bus'] = self.system_bus.get_status()
+            status['components']['system_bus'] = {**self.system_bus.get_status(),
+                                                   'masters': self.system_bus.get_master_stats()}
         
         if self.control_unit:
             status['components']['control_unit'] = self.control_unit.get_current_status()
         
+        if self.cpu and self.cpu.cache is not None:
+            status['components']['cache'] = self.cpu.cache.get_stats()
+        
+        for name, (base, device) in self.get_io_devices().items():
+            status['components'][name] = {'base': f"0x{base:04X}", **device.get_stats()}
+        
         # Información del programa
         if self.current_program:
             status['current_program'] = self.current_program
@@ -564,6 +706,33 @@ class System:
         
         return results
     
+    def get_profile_report(self, top: int = 10, annotated_path: Optional[str] = None) -> Optional[str]:
+        """
+        Reporte del perfilador sobre la última ejecución, anotado con los
+        mnemónicos y comentarios del programa JSON cargado
+        
+        Args:
+            top: Direcciones de código y de datos a listar
+            annotated_path: Si se indica, guarda ahí una copia del programa
+                            JSON con el perfil de cada instrucción y variable
+            
+        Returns:
+            Texto del reporte, o None si el perfilador no está activo
+        """
+        if self.cpu is None or self.cpu.profiler is None:
+            return None
+        
+        program_data = None
+        if self.current_program is not None:
+            with open(self.current_program['path'], 'r') as f:
+                program_data = json.load(f)
+        
+        if annotated_path is not None and program_data is not None:
+            with open(annotated_path, 'w') as f:
+                json.dump(self.cpu.profiler.annotate(program_data), f, indent=2, ensure_ascii=False)
+        
+        return self.cpu.profiler.format_report(program_data, top)
+    
     def get_assembly_log(self) -> list:
         """Obtiene el log completo del ensamblaje"""
         return self.assembly_log.copy()
\ No newline at end of file
@@ -0,0 +1,93 @@
+# Business/IO/Console_Output.py
+import sys
+from typing import Callable, Optional, TextIO
+from Business.IO.IO_Device import IO_Device
+
+
+class Console_Output(IO_Device):
+    """
+    Salida de consola con buffer.
+
+    Registros:
+        DATA   (0): escribir encola un carácter (código ASCII); se lee 0
+        STATUS (1): caracteres en el buffer; escribir cualquier valor lo vacía
+
+    Los caracteres se acumulan en una lista y se entregan de una vez en
+    flush(): al escribir STATUS, cuando el SystemBus vacía los dispositivos
+    (HALT o fin de cada tramo de ejecución, es decir, por cuadro) o, con
+    line_buffered, en cada salto de línea. El texto va a `stream` (por
+    defecto sys.stdout) o a `sink(texto)` y queda acumulado en get_output().
+    """
+
+    REGISTERS = ('DATA', 'STATUS')
+    DATA, STATUS = 0, 1
+
+    def __init__(self, stream: Optional[TextIO] = None, sink: Optional[Callable[[str], None]] = None,
+                 line_buffered: bool = False):
+        super().__init__()
+        self.stream = stream
+        self.sink = sink
+        self.line_buffered = line_buffered
+        self.__pending = []
+        self.__output = []
+        self.flushes = 0
+
+    def _load(self, register: int) -> int:
+        return len(self.__pending) if register == self.STATUS else 0
+
+    def _store(self, register: int, value: int):
+        if register == self.STATUS:
+            self.flush()
+            return
+        char = chr(value & 0xFF)
+        self.__pending.append(char)
+        if self.line_buffered and char == "\n":
+            self.flush()
+
+    def flush(self) -> str:
+        """Entrega el texto pendiente y lo retorna ('' si no había nada)"""
+        if not self.__pending:
+            return ""
+        text = "".join(self.__pending)
+        self.__pending.clear()
+        self.__output.append(text)
+        self.flushes += 1
+        if self.sink is not None:
+            self.sink(text)
+        else:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write(text)
+            stream.flush()
+        return text
+
+    def get_pending(self) -> str:
+        return "".join(self.__pending)
+
+    def get_output(self) -> str:
+        """Todo el texto entregado desde el último reset"""
+        return "".join(self.__output)
+
+    def reset(self):
+        """Descarta el buffer y la salida acumulada"""
+        super().reset()
+        self.__pending.clear()
+        self.__output.clear()
+        self.flushes = 0
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), 'pending': list(self.__pending), 'output': list(self.__output),
+                'flushes': self.flushes}
+
+    def restore(self, state: dict):
+        """
+        Restaura el buffer y la salida acumulada (get_output). El texto ya
+        entregado a stream/sink no se retira: al volver a ejecutar se entrega
+        de nuevo.
+        """
+        super().restore(state)
+        self.__pending[:] = state['pending']
+        self.__output[:] = state['output']
+        self.flushes = state['flushes']
+
+    def get_stats(self):
+        return {**super().get_stats(), 'pending': len(self.__pending), 'flushes': self.flushes}
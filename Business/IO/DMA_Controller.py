@@ -0,0 +1,123 @@
+# Business/IO/DMA_Controller.py
+from Business.IO.IO_Device import IO_Device
+
+
+class DMA_Controller(IO_Device):
+    """
+    Controlador DMA: segundo maestro del SystemBus que copia o rellena
+    bloques de memoria sin ejecutar instrucciones de la CPU.
+
+    Registros:
+        SOURCE  (0): dirección de origen
+        DEST    (1): dirección de destino
+        LENGTH  (2): palabras a transferir
+        FILL    (3): valor de relleno (modo FILL)
+        CONTROL (4): escritura: bit 0 START, bit 1 FILL (rellenar en vez de copiar);
+                     lectura: bit 0 BUSY
+        STOLEN  (5): ciclos robados a la CPU (16 bits bajos, solo lectura)
+
+    Escribir START con LENGTH > 0 toma una copia de los registros y pide el
+    bus (SystemBus.request); el bus la atiende por ráfagas de burst_size
+    palabras según la prioridad configurada. Cada ráfaga es una copia por
+    bloques en el host (SystemBus.copy_block/fill_block) y cuesta 2 ciclos
+    de bus por palabra copiada (lectura + escritura) o 1 por palabra
+    rellenada. START mientras BUSY se ignora.
+    """
+
+    REGISTERS = ('SOURCE', 'DEST', 'LENGTH', 'FILL', 'CONTROL', 'STOLEN')
+    SOURCE, DEST, LENGTH, FILL, CONTROL, STOLEN = range(6)
+    START, FILL_MODE = 0x1, 0x2     # Bits de CONTROL al escribir
+    BUSY = 0x1                      # Bit de CONTROL al leer
+
+    def __init__(self, bus, burst_size: int = 16, master_name: str = "DMA"):
+        super().__init__()
+        if burst_size <= 0:
+            raise ValueError("El tamaño de ráfaga del DMA debe ser mayor que 0")
+        self.bus = bus
+        self.burst_size = burst_size
+        self.master_name = master_name
+        self.__registers = [0] * len(self.REGISTERS)
+        self.__transfer = None      # [origen, destino, longitud, relleno, modo FILL, hechas]
+        self.transfers = 0
+        self.bursts = 0
+        self.words = 0
+
+    def is_busy(self) -> bool:
+        return self.__transfer is not None
+
+    def _load(self, register: int) -> int:
+        if register == self.CONTROL:
+            return self.BUSY if self.__transfer is not None else 0
+        if register == self.STOLEN:
+            return self.bus.get_stolen_cycles(self.master_name) & self.WORD_MASK
+        return self.__registers[register]
+
+    def _store(self, register: int, value: int):
+        if register == self.CONTROL:
+            if value & self.START:
+                self.start(bool(value & self.FILL_MODE))
+        elif register != self.STOLEN:
+            self.__registers[register] = value
+
+    def start(self, fill: bool = False) -> bool:
+        """Inicia la transferencia programada en los registros; retorna False si no se inició"""
+        length = self.__registers[self.LENGTH]
+        if self.__transfer is not None or not length:
+            return False
+        self.__transfer = [self.__registers[self.SOURCE], self.__registers[self.DEST], length,
+                           self.__registers[self.FILL], fill, 0]
+        self.bus.request(self.master_name, self.__burst)
+        return True
+
+    def __burst(self):
+        """Una ráfaga de la transferencia en curso: (ciclos de bus, terminó)"""
+        source, destination, length, value, fill, done = self.__transfer
+        count = min(self.burst_size, length - done)
+        if fill:
+            self.bus.fill_block(destination + done, count, value)
+        else:
+            self.bus.copy_block(source + done, destination + done, count)
+        self.__transfer[5] = done = done + count
+        self.bursts += 1
+        self.words += count
+        if done == length:
+            self.__transfer = None
+            self.transfers += 1
+            return (count if fill else 2 * count), True
+        return (count if fill else 2 * count), False
+
+    def reset(self):
+        """Pone a cero los registros y contadores (una transferencia en curso se abandona y se retira del bus)"""
+        super().reset()
+        if self.__transfer is not None:
+            self.bus.cancel(self.master_name)
+        self.__registers = [0] * len(self.REGISTERS)
+        self.__transfer = None
+        self.transfers = 0
+        self.bursts = 0
+        self.words = 0
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), 'registers': list(self.__registers),
+                'transfer': list(self.__transfer) if self.__transfer is not None else None,
+                'transfers': self.transfers, 'bursts': self.bursts, 'words': self.words}
+
+    def restore(self, state: dict):
+        """
+        Restaura registros, contadores y la transferencia en curso. La solicitud
+        pendiente vuelve con el snapshot del SystemBus; aquí solo se enlaza a
+        este controlador.
+        """
+        super().restore(state)
+        self.__registers = list(state['registers'])
+        self.__transfer = list(state['transfer']) if state['transfer'] is not None else None
+        self.transfers = state['transfers']
+        self.bursts = state['bursts']
+        self.words = state['words']
+        if self.__transfer is not None:
+            self.bus.set_service(self.master_name, self.__burst)
+
+    def get_stats(self):
+        return {**super().get_stats(), 'busy': self.is_busy(), 'transfers': self.transfers,
+                'bursts': self.bursts, 'words': self.words,
+                'stolen_cycles': self.bus.get_stolen_cycles(self.master_name)}
@@ -0,0 +1,84 @@
+# Business/IO/IO_Device.py
+from Business.Basic_Components.Bus import Bus
+
+
+class IO_Device:
+    """
+    Dispositivo de E/S mapeado en memoria.
+
+    Es un banco de registros de 16 bits (REGISTERS: nombre de cada registro,
+    su índice es la dirección relativa) que se conecta con
+    SystemBus.connect_device en el rango (base, base + size - 1). Las
+    subclases implementan _load(registro) y _store(registro, valor); la
+    clase base ofrece las dos interfaces del bus (read/write con Bus y
+    load_word/store_word con enteros) y cuenta los accesos.
+
+    Ningún dispositivo trabaja por ciclo de reloj: todo ocurre al acceder a
+    un registro o al vaciar su salida (flush, que el SystemBus llama al
+    terminar cada tramo de ejecución de la CPU).
+
+    snapshot()/restore() guardan el estado del dispositivo como un dict; las
+    subclases lo extienden con sus registros y buffers.
+    """
+
+    REGISTERS = ()
+    WORD_MASK = 0xFFFF
+
+    def __init__(self):
+        self.read_count = 0
+        self.write_count = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.REGISTERS)
+
+    def get_range(self, base: int) -> tuple:
+        """Rango de direcciones que ocupa el dispositivo a partir de base"""
+        return (base, base + self.size - 1)
+
+    # --- Interfaz del SystemBus ---
+    def load_word(self, address: int) -> int:
+        if 0 <= address < len(self.REGISTERS):
+            self.read_count += 1
+            return self._load(address)
+        return self.WORD_MASK
+
+    def store_word(self, address: int, value: int):
+        if 0 <= address < len(self.REGISTERS):
+            self.write_count += 1
+            self._store(address, value & self.WORD_MASK)
+
+    def read(self, address: int) -> Bus:
+        return Bus(16, self.load_word(address))
+
+    def write(self, address: int, data: Bus):
+        self.store_word(address, data.get_Decimal_value())
+
+    # --- Para las subclases ---
+    def _load(self, register: int) -> int:
+        return 0
+
+    def _store(self, register: int, value: int):
+        pass
+
+    def flush(self):
+        """Entrega la salida pendiente (sin efecto si el dispositivo no tiene salida)"""
+
+    def reset(self):
+        self.read_count = 0
+        self.write_count = 0
+
+    def snapshot(self) -> dict:
+        """Captura el estado del dispositivo (la base: contadores de acceso)"""
+        return {'reads': self.read_count, 'writes': self.write_count}
+
+    def restore(self, state: dict):
+        """Restaura un snapshot tomado con snapshot() en un dispositivo del mismo tipo"""
+        self.read_count = state['reads']
+        self.write_count = state['writes']
+
+    def get_stats(self):
+        return {'reads': self.read_count, 'writes': self.write_count}
+
+    def __str__(self):
+        return f"{type(self).__name__}(registros={self.size}, lecturas={self.read_count}, escrituras={self.write_count})"
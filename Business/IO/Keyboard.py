@@ -0,0 +1,82 @@
+# Business/IO/Keyboard.py
+from typing import Iterable, Union
+from Business.IO.IO_Device import IO_Device
+
+
+class Keyboard(IO_Device):
+    """
+    Teclado ASCII con buffer circular no bloqueante.
+
+    Registros:
+        STATUS (0): caracteres pendientes en el buffer (solo lectura)
+        DATA   (1): lee y consume el siguiente carácter; 0 si el buffer está vacío
+
+    El host lo alimenta con feed() (texto, bytes o códigos), por ejemplo
+    desde un script antes de ejecutar el programa. Si el buffer se llena,
+    los caracteres sobrantes se descartan y se cuentan en dropped.
+    """
+
+    REGISTERS = ('STATUS', 'DATA')
+    STATUS, DATA = 0, 1
+
+    def __init__(self, capacity: int = 64, script: Union[str, bytes, Iterable[int]] = None):
+        super().__init__()
+        if capacity <= 0:
+            raise ValueError("La capacidad del buffer del teclado debe ser mayor que 0")
+        self.capacity = capacity
+        self.__buffer = [0] * capacity
+        self.__head = 0     # Próximo carácter a leer
+        self.__count = 0
+        self.dropped = 0
+        if script is not None:
+            self.feed(script)
+
+    def feed(self, data: Union[str, bytes, Iterable[int]]) -> int:
+        """Encola caracteres; retorna cuántos entraron en el buffer"""
+        codes = [ord(char) for char in data] if isinstance(data, str) else data
+        accepted = 0
+        for code in codes:
+            if self.__count == self.capacity:
+                self.dropped += 1
+                continue
+            self.__buffer[(self.__head + self.__count) % self.capacity] = code & self.WORD_MASK
+            self.__count += 1
+            accepted += 1
+        return accepted
+
+    def pending(self) -> int:
+        return self.__count
+
+    def _load(self, register: int) -> int:
+        if register == self.STATUS:
+            return self.__count
+        if not self.__count:
+            return 0
+        code = self.__buffer[self.__head]
+        self.__head = (self.__head + 1) % self.capacity
+        self.__count -= 1
+        return code
+
+    def reset(self):
+        """Vacía el buffer y pone a cero los contadores"""
+        super().reset()
+        self.__head = 0
+        self.__count = 0
+        self.dropped = 0
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), 'buffer': list(self.__buffer), 'head': self.__head,
+                'count': self.__count, 'dropped': self.dropped}
+
+    def restore(self, state: dict):
+        """Restaura el buffer: los caracteres consumidos después del snapshot vuelven a estar pendientes"""
+        if len(state['buffer']) != self.capacity:
+            raise ValueError(f"El snapshot tiene un buffer de {len(state['buffer'])} caracteres, el teclado {self.capacity}")
+        super().restore(state)
+        self.__buffer = list(state['buffer'])
+        self.__head = state['head']
+        self.__count = state['count']
+        self.dropped = state['dropped']
+
+    def get_stats(self):
+        return {**super().get_stats(), 'pending': self.__count, 'dropped': self.dropped}
@@ -0,0 +1,133 @@
+# Business/IO/Seven_Segment_Display.py
+from typing import Callable, Optional, Tuple
+from Business.IO.IO_Device import IO_Device
+
+
+def to_bcd(value: int, digits: int = 5) -> Tuple[int, ...]:
+    """Convierte un valor de 16 bits (0-65535) en `digits` dígitos decimales, el más significativo primero"""
+    result = []
+    for _ in range(digits):
+        value, digit = divmod(value, 10)
+        result.append(digit)
+    return tuple(reversed(result))
+
+
+class Seven_Segment_Display(IO_Device):
+    """
+    Display de 7 segmentos con conversor decimal a BCD y un decodificador
+    por dígito (como el 7447: dígito 0-9 -> segmentos a-g).
+
+    Registros:
+        VALUE   (0): valor a mostrar (0-65535, en decimal)
+        CONTROL (1): bit 0 = apagar el display
+
+    Solo se vuelve a renderizar cuando lo que se ve cambia: escribir el
+    mismo valor no hace nada. Cada render actualiza get_segments(), cuenta
+    en renders y llama a on_render(display) si se definió; el texto ASCII
+    (get_text) se construye recién cuando alguien lo pide.
+    """
+
+    REGISTERS = ('VALUE', 'CONTROL')
+    VALUE, CONTROL = 0, 1
+    BLANK = 0x1
+
+    # Segmentos (a, b, c, d, e, f, g) de cada dígito decimal
+    SEGMENTS = (
+        (1, 1, 1, 1, 1, 1, 0),  # 0
+        (0, 1, 1, 0, 0, 0, 0),  # 1
+        (1, 1, 0, 1, 1, 0, 1),  # 2
+        (1, 1, 1, 1, 0, 0, 1),  # 3
+        (0, 1, 1, 0, 0, 1, 1),  # 4
+        (1, 0, 1, 1, 0, 1, 1),  # 5
+        (1, 0, 1, 1, 1, 1, 1),  # 6
+        (1, 1, 1, 0, 0, 0, 0),  # 7
+        (1, 1, 1, 1, 1, 1, 1),  # 8
+        (1, 1, 1, 1, 0, 1, 1),  # 9
+    )
+    OFF = (0, 0, 0, 0, 0, 0, 0)
+
+    def __init__(self, digits: int = 5, on_render: Optional[Callable[["Seven_Segment_Display"], None]] = None):
+        super().__init__()
+        if digits <= 0:
+            raise ValueError("El display debe tener al menos un dígito")
+        self.digits = digits
+        self.on_render = on_render
+        self.__registers = [0, 0]
+        self.__segments = None
+        self.__text = None
+        self.renders = 0
+        self.__render()
+
+    def _load(self, register: int) -> int:
+        return self.__registers[register]
+
+    def _store(self, register: int, value: int):
+        if self.__registers[register] == value:
+            return
+        was_blank = self.__registers[self.CONTROL] & self.BLANK
+        self.__registers[register] = value
+        # Cambiar el valor de un display apagado no cambia lo que se ve
+        if register == self.VALUE and was_blank:
+            return
+        if register == self.CONTROL and (value & self.BLANK) == was_blank:
+            return
+        self.__render()
+
+    def __render(self):
+        if self.__registers[self.CONTROL] & self.BLANK:
+            self.__segments = (self.OFF,) * self.digits
+        else:
+            self.__segments = tuple(self.SEGMENTS[digit] for digit in to_bcd(self.__registers[self.VALUE], self.digits))
+        self.__text = None
+        self.renders += 1
+        if self.on_render is not None:
+            self.on_render(self)
+
+    def get_value(self) -> int:
+        return self.__registers[self.VALUE]
+
+    def is_blank(self) -> bool:
+        return bool(self.__registers[self.CONTROL] & self.BLANK)
+
+    def get_segments(self) -> Tuple[Tuple[int, ...], ...]:
+        """Segmentos (a-g) encendidos de cada dígito, el más significativo primero"""
+        return self.__segments
+
+    def get_text(self) -> str:
+        """Los dígitos dibujados en tres líneas de texto"""
+        if self.__text is None:
+            rows = ["", "", ""]
+            for a, b, c, d, e, f, g in self.__segments:
+                rows[0] += " " + ("_" if a else " ") + " "
+                rows[1] += ("|" if f else " ") + ("_" if g else " ") + ("|" if b else " ")
+                rows[2] += ("|" if e else " ") + ("_" if d else " ") + ("|" if c else " ")
+            self.__text = "\n".join(rows)
+        return self.__text
+
+    def reset(self):
+        """Vuelve a mostrar 0 (cuenta un render si lo visible cambia)"""
+        super().reset()
+        if self.__registers != [0, 0]:
+            self.__registers = [0, 0]
+            self.__render()
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), 'registers': list(self.__registers),
+                'segments': self.__segments, 'renders': self.renders}
+
+    def restore(self, state: dict):
+        """
+        Restaura registros, segmentos y renders; on_render se llama si lo
+        visible cambia (sin contar un render, el del snapshot ya se contó)
+        """
+        super().restore(state)
+        changed = state['segments'] != self.__segments
+        self.__registers = list(state['registers'])
+        self.__segments = state['segments']
+        self.__text = None
+        self.renders = state['renders']
+        if changed and self.on_render is not None:
+            self.on_render(self)
+
+    def get_stats(self):
+        return {**super().get_stats(), 'value': self.get_value(), 'renders': self.renders}
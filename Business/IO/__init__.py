@@ -0,0 +1,8 @@
+# Business/IO/__init__.py
+from .IO_Device import IO_Device
+from .Keyboard import Keyboard
+from .Seven_Segment_Display import Seven_Segment_Display, to_bcd
+from .Console_Output import Console_Output
+from .DMA_Controller import DMA_Controller
+
+__all__ = ['IO_Device', 'Keyboard', 'Seven_Segment_Display', 'to_bcd', 'Console_Output', 'DMA_Controller']
@@ -0,0 +1,361 @@
+# Business/Memory/Cache.py
+import random
+from typing import Any, Dict, List, Optional
+
+
+class Cache:
+    """
+    Un nivel de caché (solo etiquetas): organización directa o asociativa
+    por conjuntos de N vías, reemplazo LRU, FIFO o aleatorio y escritura
+    write-back (con asignación en escritura) o write-through (sin
+    asignación). Los tamaños se miden en palabras y deben ser potencias de 2.
+
+    No guarda datos: los valores siguen en la memoria y la caché solo decide
+    qué accesos llegan al nivel siguiente (next_level: otra Cache o la
+    memoria). Los desplazamientos y máscaras de índice/etiqueta se calculan
+    al construirla, así que un acierto son unas pocas operaciones de bits y
+    una búsqueda en la lista de vías del conjunto.
+
+    Cuenta aciertos, fallos, desalojos y write-backs en total y por PC
+    (la instrucción que hizo el acceso; un PC fuera de rango se cuenta en la
+    última posición).
+    """
+
+    REPLACEMENTS = ('lru', 'fifo', 'random')
+    WRITE_POLICIES = ('write_back', 'write_through')
+
+    def __init__(self, name: str = "L1", size: int = 64, block_size: int = 4, associativity: int = 1,
+                 replacement: str = 'lru', write_policy: str = 'write_back', seed: int = 0,
+                 address_space: int = 1 << 12):
+        for label, value in (('size', size), ('block_size', block_size), ('associativity', associativity)):
+            if value <= 0 or value & (value - 1):
+                raise ValueError(f"{name}: {label} debe ser una potencia de 2 (recibido {value})")
+        if block_size * associativity > size:
+            raise ValueError(f"{name}: {associativity} vías de {block_size} palabras no caben en {size} palabras")
+        if replacement not in self.REPLACEMENTS:
+            raise ValueError(f"{name}: reemplazo desconocido '{replacement}' (opciones: {', '.join(self.REPLACEMENTS)})")
+        if write_policy not in self.WRITE_POLICIES:
+            raise ValueError(f"{name}: política de escritura desconocida '{write_policy}' "
+                             f"(opciones: {', '.join(self.WRITE_POLICIES)})")
+
+        self.name = name
+        self.size = size
+        self.block_size = block_size
+        self.associativity = associativity
+        self.replacement = replacement
+        self.write_policy = write_policy
+        self.next_level = None
+
+        # Máscaras precalculadas: dirección = etiqueta | índice | desplazamiento
+        self.sets = size // (block_size * associativity)
+        self.offset_bits = block_size.bit_length() - 1
+        self.index_bits = self.sets.bit_length() - 1
+        self.index_mask = self.sets - 1
+
+        self.__lru = replacement == 'lru'
+        self.__random = random.Random(seed) if replacement == 'random' else None
+        self.__write_back = write_policy == 'write_back'
+        self.__pcs = address_space + 1
+        self.reset()
+
+    def reset(self):
+        """Invalida todas las líneas y pone a cero los contadores"""
+        self.__ways: List[List[int]] = [[] for _ in range(self.sets)]   # Etiquetas por conjunto (la primera es la más reciente)
+        self.__dirty = set()                                            # Bloques modificados (write-back)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self.pc_hits = [0] * self.__pcs
+        self.pc_misses = [0] * self.__pcs
+        self.pc_evictions = [0] * self.__pcs
+
+    # --- Acceso ---
+    def access(self, address: int, write: bool = False, pc: int = 0) -> bool:
+        """Un acceso a una palabra; retorna True si fue acierto"""
+        block = address >> self.offset_bits
+        index = block & self.index_mask
+        tag = block >> self.index_bits
+        ways = self.__ways[index]
+        if pc >= self.__pcs:
+            pc = self.__pcs - 1
+
+        if tag in ways:
+            self.hits += 1
+            self.pc_hits[pc] += 1
+            if self.__lru and ways[0] != tag:
+                ways.remove(tag)
+                ways.insert(0, tag)
+            if write:
+                if self.__write_back:
+                    self.__dirty.add(block)
+                else:
+                    self.next_level.write_through(address, pc)
+            return True
+
+        self.misses += 1
+        self.pc_misses[pc] += 1
+        if write and not self.__write_back:
+            self.next_level.write_through(address, pc)     # Sin asignación en escritura
+            return False
+
+        if len(ways) == self.associativity:
+            # Reemplazo: FIFO y LRU desalojan la última; aleatorio, cualquiera
+            victim = ways.pop(self.__random.randrange(len(ways)) if self.__random is not None else -1)
+            self.evictions += 1
+            self.pc_evictions[pc] += 1
+            victim_block = victim << self.index_bits | index
+            if victim_block in self.__dirty:
+                self.__dirty.discard(victim_block)
+                self.writebacks += 1
+                self.next_level.write_back(victim_block << self.offset_bits, self.block_size, pc)
+        self.next_level.fill(block << self.offset_bits, self.block_size, pc)
+        ways.insert(0, tag)
+        if write:
+            self.__dirty.add(block)
+        return False
+
+    # --- Interfaz de nivel siguiente (para el nivel superior) ---
+    def fill(self, address: int, words: int, pc: int = 0):
+        """El nivel superior trae un bloque (cabe en un bloque de este nivel)"""
+        self.access(address, False, pc)
+
+    def write_back(self, address: int, words: int, pc: int = 0):
+        """El nivel superior devuelve un bloque modificado"""
+        self.access(address, True, pc)
+
+    def write_through(self, address: int, pc: int = 0):
+        """El nivel superior propaga una escritura de una palabra"""
+        self.access(address, True, pc)
+
+    def flush(self):
+        """Escribe en el nivel siguiente todos los bloques modificados (quedan limpios)"""
+        for block in sorted(self.__dirty):
+            self.writebacks += 1
+            self.next_level.write_back(block << self.offset_bits, self.block_size)
+        self.__dirty.clear()
+
+    # --- Consulta ---
+    def get_stats(self) -> Dict[str, Any]:
+        accesses = self.hits + self.misses
+        return {
+            'accesses': accesses,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'writebacks': self.writebacks,
+            'dirty': len(self.__dirty),
+            'hit_rate': round(self.hits / accesses, 4) if accesses else 0.0
+        }
+
+    def get_pc_stats(self) -> Dict[int, Dict[str, int]]:
+        """Aciertos, fallos y desalojos por PC (solo los PC con accesos)"""
+        return {pc: {'hits': self.pc_hits[pc], 'misses': self.pc_misses[pc], 'evictions': self.pc_evictions[pc]}
+                for pc in range(self.__pcs) if self.pc_hits[pc] or self.pc_misses[pc]}
+
+    def describe(self) -> str:
+        organization = "directa" if self.associativity == 1 else f"{self.associativity} vías"
+        return (f"{self.name}: {self.size} palabras, bloques de {self.block_size}, {organization}, "
+                f"{self.replacement}, {self.write_policy}")
+
+    def __str__(self):
+        return f"Cache({self.describe()}, aciertos={self.hits}, fallos={self.misses})"
+
+
+class Memory_Level:
+    """
+    Último nivel de la jerarquía: la memoria detrás del SystemBus. Cada
+    bloque traído o devuelto cuesta una palabra por ciclo de bus y se cuenta
+    en los accesos del dispositivo (RAM).
+    """
+
+    name = "MEM"
+
+    def __init__(self):
+        self.port = None
+        self.reset()
+
+    def reset(self):
+        self.words_read = 0
+        self.words_written = 0
+
+    def __transfer(self, address: int, reads: int, writes: int):
+        count = self.port.resolve(address)[2]
+        if count is not None:
+            count(reads, writes)
+        self.port.advance(reads + writes)
+        self.words_read += reads
+        self.words_written += writes
+
+    def fill(self, address: int, words: int, pc: int = 0):
+        self.__transfer(address, words, 0)
+
+    def write_back(self, address: int, words: int, pc: int = 0):
+        self.__transfer(address, 0, words)
+
+    def write_through(self, address: int, pc: int = 0):
+        self.__transfer(address, 0, 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'words_read': self.words_read, 'words_written': self.words_written}
+
+
+class Cache_Hierarchy:
+    """
+    Jerarquía de cachés entre la CPU y el SystemBus.
+
+    Se usa como el puerto de la CPU (CPU.enable_cache): fetch(address) pasa
+    por la caché de instrucciones y read/write por la de datos; con el
+    primer nivel dividido (split) son dos cachés, si no la misma. Los fallos
+    bajan por los niveles hasta la memoria, que cuenta el tráfico en el bus.
+    Los accesos a dispositivos sin acceso por palabra sin contar (E/S) no
+    se cachean y van directo al puerto del bus.
+
+    Los valores se leen y escriben siempre en la memoria (sin contar), así
+    que el resultado del programa no depende de la caché; las escrituras de
+    otro maestro (DMA) no invalidan líneas, solo pueden hacer optimistas
+    las estadísticas.
+
+    Configuración (Data/Configs, clave "cache"):
+        {"enabled": true, "levels": [
+            {"name": "L1", "size": 64, "block_size": 4, "associativity": 2,
+             "replacement": "lru", "write_policy": "write_back", "split": true},
+            {"name": "L2", "size": 512, "block_size": 8, "associativity": 4}]}
+    """
+
+    def __init__(self, levels: List[Dict[str, Any]], address_space: int = 1 << 12):
+        if not levels:
+            raise ValueError("La jerarquía de caché necesita al menos un nivel")
+        self.memory_level = Memory_Level()
+        self.levels: List[List[Cache]] = []
+
+        for position, level in enumerate(levels):
+            options = {key: value for key, value in level.items() if key not in ('name', 'split')}
+            name = level.get('name', f"L{position + 1}")
+            if level.get('split', False):
+                if position:
+                    raise ValueError(f"{name}: solo el primer nivel puede dividirse en instrucciones y datos")
+                caches = [Cache(f"{name}I", address_space=address_space, **options),
+                          Cache(f"{name}D", address_space=address_space, **options)]
+            else:
+                caches = [Cache(name, address_space=address_space, **options)]
+            if self.levels and caches[0].block_size < self.levels[-1][0].block_size:
+                raise ValueError(f"{name}: el bloque no puede ser menor que el del nivel anterior")
+            for upper in self.levels[-1] if self.levels else []:
+                upper.next_level = caches[0]
+            self.levels.append(caches)
+        for cache in self.levels[-1]:
+            cache.next_level = self.memory_level
+
+        self.icache = self.levels[0][0]
+        self.dcache = self.levels[0][-1]
+        self.port = None
+        self.pc = 0
+        self.__resolved = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], address_space: int = 1 << 12) -> Optional["Cache_Hierarchy"]:
+        """Jerarquía descrita en la clave "cache" de una configuración (None si está deshabilitada)"""
+        if not config or not config.get('enabled', True):
+            return None
+        return cls(config['levels'], address_space)
+
+    # --- Conexión ---
+    def connect(self, port):
+        """Se interpone delante del puerto del bus de un maestro"""
+        if self.port is not None:
+            self.port.remove_rebind_listener(self.__resolved.clear)
+        self.port = port
+        self.memory_level.port = port
+        self.__resolved.clear()
+        port.add_rebind_listener(self.__resolved.clear)
+
+    def disconnect(self):
+        """Retorna el puerto del bus que tenía delante"""
+        port = self.port
+        port.remove_rebind_listener(self.__resolved.clear)
+        self.port = self.memory_level.port = None
+        return port
+
+    def __resolve(self, address: int):
+        """(read_word, write_word, relativa) si la dirección es cacheable, si no None"""
+        read_word, write_word, count, rel_addr = self.port.resolve(address)
+        access = (read_word, write_word, rel_addr) if count is not None else None
+        self.__resolved[address] = access
+        return access
+
+    # --- Interfaz de puerto (la usa la CPU) ---
+    def fetch(self, address: int) -> int:
+        self.pc = address
+        self.port.advance(0)    # Punto de arbitraje por instrucción aunque todo acierte
+        access = self.__resolved.get(address, False)
+        if access is False:
+            access = self.__resolve(address)
+        if access is None:
+            return self.port.read(address)
+        self.icache.access(address, False, address)
+        return access[0](access[2])
+
+    def read(self, address: int) -> int:
+        access = self.__resolved.get(address, False)
+        if access is False:
+            access = self.__resolve(address)
+        if access is None:
+            return self.port.read(address)
+        self.dcache.access(address, False, self.pc)
+        return access[0](access[2])
+
+    def write(self, address: int, value: int):
+        access = self.__resolved.get(address, False)
+        if access is False:
+            access = self.__resolve(address)
+        if access is None:
+            self.port.write(address, value)
+            return
+        self.dcache.access(address, True, self.pc)
+        access[1](access[2], value)
+
+    # --- Control y estadísticas ---
+    def caches(self) -> List[Cache]:
+        return [cache for level in self.levels for cache in level]
+
+    def reset(self):
+        """Invalida todos los niveles y pone a cero las estadísticas (inicio de una ejecución)"""
+        for cache in self.caches():
+            cache.reset()
+        self.memory_level.reset()
+        self.pc = 0
+
+    def flush(self):
+        """Escribe los bloques modificados de todos los niveles, de arriba hacia abajo"""
+        for cache in self.caches():
+            cache.flush()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {cache.name: cache.get_stats() for cache in self.caches()}
+        stats[self.memory_level.name] = self.memory_level.get_stats()
+        return stats
+
+    def get_pc_stats(self, name: Optional[str] = None) -> Dict[str, Dict[int, Dict[str, int]]]:
+        """Aciertos/fallos/desalojos por PC de cada caché (o solo de name)"""
+        return {cache.name: cache.get_pc_stats() for cache in self.caches() if name is None or cache.name == name}
+
+    def format_report(self, top: int = 5) -> str:
+        lines = ["JERARQUÍA DE CACHÉ"]
+        for cache in self.caches():
+            stats = cache.get_stats()
+            lines.append(f"  {cache.describe()}")
+            lines.append(f"    {stats['accesses']:>10} accesos  {stats['hits']:>10} aciertos  {stats['misses']:>8} fallos "
+                         f"({100 * stats['hit_rate']:.1f}% aciertos)  {stats['evictions']:>8} desalojos  "
+                         f"{stats['writebacks']:>8} write-backs")
+            worst = sorted(cache.get_pc_stats().items(), key=lambda item: (-item[1]['misses'], item[0]))[:top]
+            for pc, entry in worst:
+                if entry['misses']:
+                    lines.append(f"    [{pc:04X}] {entry['misses']:>8} fallos  {entry['hits']:>10} aciertos  "
+                                 f"{entry['evictions']:>6} desalojos")
+        memory = self.memory_level.get_stats()
+        lines.append(f"  Memoria: {memory['words_read']} palabras leídas, {memory['words_written']} escritas")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return f"Cache_Hierarchy({', '.join(cache.name for cache in self.caches())})"
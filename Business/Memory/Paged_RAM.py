@@ -0,0 +1,181 @@
+# Business/Memory/Paged_RAM.py
+from array import array
+from Business.Basic_Components.Bus import Bus
+from Business.Memory.RAM import RAM, RAM_Snapshot
+
+
+class Paged_RAM_Snapshot(RAM_Snapshot):
+    """Snapshot de una Paged_RAM: solo las páginas residentes (las demás valen 0)"""
+
+    def __init__(self, pages: dict, size: int, read_count: int, write_count: int):
+        super().__init__(pages, read_count, write_count)
+        self.size = size
+
+    def get_word(self, address: int) -> int:
+        page = self.pages.get(address >> RAM.PAGE_BITS)
+        return page[address & (RAM.PAGE_SIZE - 1)] if page is not None else 0
+
+    def __len__(self):
+        return self.size
+
+
+class Paged_RAM(RAM):
+    """
+    RAM dispersa por páginas de PAGE_SIZE palabras.
+
+    Misma interfaz que RAM, pero sin reservar la memoria al construirla: una
+    página se crea en su primera escritura y leer una página no residente
+    retorna 0 sin crearla. Construirla es O(1) sea cual sea el tamaño, y la
+    memoria usada crece con las páginas que el programa toca
+    (get_resident_pages), no con el espacio de direcciones configurado.
+
+    Las páginas sucias (snapshot/restore) se guardan en un conjunto en lugar
+    de un bytearray por página, por la misma razón.
+    """
+
+    def _allocate(self):
+        if self.size <= 0:
+            raise ValueError(f"Tamaño de RAM inválido: {self.size} palabras")
+        self.pages = {}                 # página -> array('H') de PAGE_SIZE palabras
+        self.page_count = (self.size + self.PAGE_SIZE - 1) >> self.PAGE_BITS
+        self._dirty_pages = set()
+        self._base_pages = None
+        self._zero_page = array('H', [0]) * self.PAGE_SIZE     # Solo lectura
+
+    def _page(self, page: int) -> array:
+        """Página residente, creada con ceros si es la primera escritura"""
+        words = self.pages.get(page)
+        if words is None:
+            words = self.pages[page] = array('H', self._zero_page)
+        self._dirty_pages.add(page)
+        return words
+
+    def get_resident_pages(self) -> list:
+        """Páginas creadas (escritas al menos una vez), en orden"""
+        return sorted(self.pages)
+
+    # --- Acceso por palabra ---
+    def read_word(self, address: int) -> int:
+        if 0 <= address < self.size:
+            words = self.pages.get(address >> self.PAGE_BITS)
+            return words[address & (self.PAGE_SIZE - 1)] if words is not None else 0
+        return 0xFFFF
+
+    def write_word(self, address: int, value: int):
+        if 0 <= address < self.size:
+            self._page(address >> self.PAGE_BITS)[address & (self.PAGE_SIZE - 1)] = self._check_word(value)
+            if self._write_listeners:
+                self._notify_write(address, 1)
+
+    def load_word(self, address: int) -> int:
+        if 0 <= address < self.size:
+            self.read_count += 1
+            words = self.pages.get(address >> self.PAGE_BITS)
+            return words[address & (self.PAGE_SIZE - 1)] if words is not None else 0
+        return 0xFFFF
+
+    def store_word(self, address: int, value: int):
+        if 0 <= address < self.size:
+            self.write_count += 1
+            self._page(address >> self.PAGE_BITS)[address & (self.PAGE_SIZE - 1)] = self._check_word(value)
+            if self._write_listeners:
+                self._notify_write(address, 1)
+
+    def read(self, address: int) -> Bus:
+        return Bus(16, self.load_word(address))
+
+    def write(self, address: int, data: Bus):
+        self.store_word(address, data.get_Decimal_value())
+
+    def read_direct(self, address: int) -> Bus:
+        return Bus(16, self.read_word(address))
+
+    def write_direct(self, address: int, value: int):
+        self.write_word(address, value)
+
+    # --- Bloques ---
+    def read_block(self, start: int, count: int) -> memoryview:
+        """Vista de solo lectura; si el bloque cruza páginas se arma una copia"""
+        self._check_block(start, count)
+        page, offset = start >> self.PAGE_BITS, start & (self.PAGE_SIZE - 1)
+        if offset + count <= self.PAGE_SIZE:
+            words = self.pages.get(page, self._zero_page)
+            return memoryview(words)[offset:offset + count].toreadonly()
+        block = array('H')
+        while count:
+            take = min(count, self.PAGE_SIZE - offset)
+            block.extend(self.pages.get(page, self._zero_page)[offset:offset + take])
+            page, offset, count = page + 1, 0, count - take
+        return memoryview(block).toreadonly()
+
+    def write_block(self, start: int, values):
+        words = self._to_words(values)
+        self._check_block(start, len(words))
+        page, offset, done = start >> self.PAGE_BITS, start & (self.PAGE_SIZE - 1), 0
+        while done < len(words):
+            take = min(len(words) - done, self.PAGE_SIZE - offset)
+            self._page(page)[offset:offset + take] = words[done:done + take]
+            page, offset, done = page + 1, 0, done + take
+        if self._write_listeners and words:
+            self._notify_write(start, len(words))
+
+    def _mark_dirty(self, start: int, count: int):
+        if count > 0:
+            self._dirty_pages.update(range(start >> self.PAGE_BITS, ((start + count - 1) >> self.PAGE_BITS) + 1))
+
+    # --- Carga desde JSON ---
+    def _load_word(self, address: int, value: int):
+        self._page(address >> self.PAGE_BITS)[address & (self.PAGE_SIZE - 1)] = self._check_word(value)
+
+    def _loaded(self):
+        # Solo se avisan las páginas residentes: el resto sigue en 0
+        if self._write_listeners:
+            for page in self.get_resident_pages():
+                start = page << self.PAGE_BITS
+                self._notify_write(start, min(self.PAGE_SIZE, self.size - start))
+
+    # --- Snapshots ---
+    def snapshot(self) -> Paged_RAM_Snapshot:
+        base = self._base_pages
+        dirty = self._dirty_pages
+        pages = {page: words[:] if base is None or page in dirty or page not in base else base[page]
+                 for page, words in self.pages.items()}
+        self._base_pages = pages
+        dirty.clear()
+        return Paged_RAM_Snapshot(pages, self.size, self.read_count, self.write_count)
+
+    def restore(self, snapshot: Paged_RAM_Snapshot):
+        if not isinstance(snapshot, Paged_RAM_Snapshot) or snapshot.size != self.size:
+            raise ValueError(f"El snapshot tiene {len(snapshot)} palabras, la RAM {self.size}")
+        base = self._base_pages
+        dirty = self._dirty_pages
+        changed = []
+        for page in list(self.pages):
+            if page not in snapshot.pages:
+                del self.pages[page]        # Vuelve a ser una página de ceros
+                changed.append(page)
+        for page, words in snapshot.pages.items():
+            if base is not None and page not in dirty and base.get(page) is words and page in self.pages:
+                continue
+            self.pages[page] = words[:]
+            changed.append(page)
+
+        self._base_pages = snapshot.pages
+        dirty.clear()
+        self.read_count = snapshot.read_count
+        self.write_count = snapshot.write_count
+        if self._write_listeners:
+            for page in changed:
+                start = page << self.PAGE_BITS
+                self._notify_write(start, min(self.PAGE_SIZE, self.size - start))
+
+    def get_dirty_pages(self) -> list:
+        return sorted(self._dirty_pages)
+
+    def get_stats(self):
+        return {**super().get_stats(), 'resident_pages': len(self.pages),
+                'resident_words': len(self.pages) * self.PAGE_SIZE}
+
+    def __str__(self):
+        return (f"Paged_RAM({self.size} words, {len(self.pages)}/{self.page_count} páginas residentes, "
+                f"{self.read_count} reads, {self.write_count} writes)")
@@ -1,16 +1,49 @@
 import json
+from array import array
 from Business.Basic_Components.Bus import Bus
 from Business.Basic_Components.Bit import Bit
 
+class RAM_Snapshot:
+    """
+    Copia inmutable de la RAM, guardada por páginas.
+    Las páginas que no cambiaron entre dos snapshots son el mismo objeto
+    (se comparten), así que tomar muchos snapshots cuesta solo las páginas escritas.
+    """
+    
+    def __init__(self, pages: tuple, read_count: int, write_count: int):
+        self.pages = pages              # tuple de array('H'), nunca se modifican
+        self.read_count = read_count
+        self.write_count = write_count
+    
+    def get_word(self, address: int) -> int:
+        """Lee una palabra del snapshot"""
+        return self.pages[address >> RAM.PAGE_BITS][address & (RAM.PAGE_SIZE - 1)]
+    
+    def __len__(self):
+        return len(self.pages) * RAM.PAGE_SIZE
+
+
 class RAM:
     """
     Memoria RAM con carga desde JSON
     Implementa 4K palabras de 16 bits (4096 direcciones)
+    
+    Las palabras se guardan en un array('H') compacto; los Bus solo se
+    crean cuando un llamador pide una palabra como Bus (read/read_direct).
+    
+    snapshot()/restore() trabajan por páginas de PAGE_SIZE palabras con
+    copia en escritura: cada escritura marca su página como sucia, un
+    snapshot solo copia las páginas sucias (el resto se comparte con el
+    snapshot anterior) y restore() solo copia las páginas que difieren.
     """
     
+    WORD_MASK = 0xFFFF
+    PAGE_BITS = 8
+    PAGE_SIZE = 1 << PAGE_BITS  # 256 palabras por página
+    
     def __init__(self, size_kb: int = 4):
         self.size = size_kb * 1024  # 4096 palabras
-        self.memory = [Bus(16, 0) for _ in range(self.size)]
+        self._allocate()
         
         # Control
         self.read_enable = Bit(0)
@@ -19,6 +52,32 @@ class RAM:
         # Estadísticas
         self.read_count = 0
         self.write_count = 0
+        
+        # Observadores de escritura: callback(start, count)
+        self._write_listeners = []
+    
+    def _allocate(self):
+        """Reserva el almacenamiento de self.size palabras"""
+        self.memory = array('H', [0]) * self.size
+        
+        # Copia en escritura: páginas escritas desde el último snapshot/restore
+        self.page_count = self.size >> self.PAGE_BITS
+        self._dirty = bytearray(b'\x01') * self.page_count
+        self._base_pages = None  # Páginas del último snapshot/restore (None = ninguno)
+    
+    def add_write_listener(self, callback):
+        """Registra un callback(start, count) que se llama tras cada escritura"""
+        if callback not in self._write_listeners:
+            self._write_listeners.append(callback)
+    
+    def remove_write_listener(self, callback):
+        """Elimina un callback registrado con add_write_listener"""
+        if callback in self._write_listeners:
+            self._write_listeners.remove(callback)
+    
+    def _notify_write(self, start: int, count: int):
+        for callback in self._write_listeners:
+            callback(start, count)
     
     def load_from_json(self, json_file: str):
         """Carga programa desde archivo JSON usando la plantilla"""
@@ -42,7 +101,7 @@ class RAM:
                         value = instruction['instruction']
                     
                     if 0 <= addr < self.size:
-                        self.memory[addr] = Bus(16, value)
+                        self._load_word(addr, value)
                         program_loaded += 1
                         
                         # Mostrar información de la instrucción
@@ -60,7 +119,7 @@ class RAM:
                         value = var_data['value']
                         
                         if 0 <= addr < self.size:
-                            self.memory[addr] = Bus(16, value)
+                            self._load_word(addr, value)
                             data_loaded += 1
                             print(f"  [{addr:04X}] {value:04X}  ; Variable: {var_name}")
                 
@@ -72,7 +131,7 @@ class RAM:
                         
                         for i, char in enumerate(string):
                             if addr + i < self.size:
-                                self.memory[addr + i] = Bus(16, ord(char))
+                                self._load_word(addr + i, ord(char))
                                 data_loaded += 1
             
             print(f"Programa cargado: {program_loaded} instrucciones, {data_loaded} datos")
@@ -88,30 +147,175 @@ class RAM:
             print(f"Error: {json_file} no es un JSON válido")
         except Exception as e:
             print(f"Error cargando programa: {e}")
+        
+        self._loaded()
+    
+    def _load_word(self, address: int, value: int):
+        """Escritura de la carga desde JSON (sin contar ni avisar: ver _loaded)"""
+        self.memory[address] = self._check_word(value)
+    
+    def _loaded(self):
+        """Fin de la carga: escribió directamente en el array, toda la memoria queda sucia"""
+        self._mark_dirty(0, self.size)
+        if self._write_listeners:
+            self._notify_write(0, self.size)
+    
+    def _check_word(self, value: int) -> int:
+        """Valida que el valor quepa en una palabra de 16 bits"""
+        if value < 0 or value > self.WORD_MASK:
+            raise ValueError(f"Valor {value} fuera del rango de una palabra de 16 bits")
+        return value
     
     def read(self, address: int) -> Bus:
         """Lee una palabra de memoria"""
         if 0 <= address < self.size:
             self.read_count += 1
-            return self.memory[address]
+            return Bus(16, self.memory[address])
         return Bus(16, 0xFFFF)  # Error
     
     def write(self, address: int, data: Bus):
         """Escribe una palabra en memoria"""
         if 0 <= address < self.size:
             self.write_count += 1
-            self.memory[address] = data
+            self.memory[address] = data.get_Decimal_value()
+            self._dirty[address >> self.PAGE_BITS] = 1
+            if self._write_listeners:
+                self._notify_write(address, 1)
     
     def read_direct(self, address: int) -> Bus:  # Asegurar que retorna Bus
         """Lee directamente un valor de memoria (retorna Bus)"""
         if 0 <= address < self.size:
-            return self.memory[address]
+            return Bus(16, self.memory[address])
         return Bus(16, 0xFFFF)
     
     def write_direct(self, address: int, value: int):
         """Escribe directamente un valor entero"""
         if 0 <= address < self.size:
-            self.memory[address] = Bus(16, value)
+            self.memory[address] = self._check_word(value)
+            self._dirty[address >> self.PAGE_BITS] = 1
+            if self._write_listeners:
+                self._notify_write(address, 1)
+    
+    # ===== ACCESO POR PALABRA (sin crear Bus) =====
+    
+    def read_word(self, address: int) -> int:
+        """Lee una palabra como entero, sin envolverla en un Bus"""
+        if 0 <= address < self.size:
+            return self.memory[address]
+        return 0xFFFF
+    
+    def write_word(self, address: int, value: int):
+        """Escribe una palabra desde un entero, sin crear un Bus"""
+        if 0 <= address < self.size:
+            self.memory[address] = self._check_word(value)
+            self._dirty[address >> self.PAGE_BITS] = 1
+            if self._write_listeners:
+                self._notify_write(address, 1)
+    
+    def load_word(self, address: int) -> int:
+        """Como read (cuenta la lectura), pero retorna un entero: acceso del SystemBus"""
+        if 0 <= address < self.size:
+            self.read_count += 1
+            return self.memory[address]
+        return 0xFFFF
+    
+    def store_word(self, address: int, value: int):
+        """Como write (cuenta la escritura), pero desde un entero: acceso del SystemBus"""
+        if 0 <= address < self.size:
+            self.write_count += 1
+            self.memory[address] = self._check_word(value)
+            self._dirty[address >> self.PAGE_BITS] = 1
+            if self._write_listeners:
+                self._notify_write(address, 1)
+    
+    def count_accesses(self, reads: int, writes: int):
+        """Cuenta accesos hechos con read_word/write_word (código traducido, por lotes)"""
+        self.read_count += reads
+        self.write_count += writes
+    
+    def read_block(self, start: int, count: int) -> memoryview:
+        """
+        Lee un bloque de palabras consecutivas.
+        Retorna una vista de solo lectura sobre la memoria (sin copia);
+        el llamador debe copiarla si necesita conservar los valores.
+        """
+        self._check_block(start, count)
+        return memoryview(self.memory)[start:start + count].toreadonly()
+    
+    def write_block(self, start: int, values):
+        """Escribe un bloque de palabras consecutivas desde un iterable de enteros"""
+        words = self._to_words(values)
+        self._check_block(start, len(words))
+        self.memory[start:start + len(words)] = words
+        self._mark_dirty(start, len(words))
+        if self._write_listeners and words:
+            self._notify_write(start, len(words))
+    
+    def _to_words(self, values) -> array:
+        """Convierte un iterable en array('H'); un valor de más de 16 bits da ValueError como _check_word"""
+        if isinstance(values, array) and values.typecode == 'H':
+            return values
+        try:
+            return array('H', values)
+        except OverflowError:
+            raise ValueError("Bloque con valores fuera del rango de una palabra de 16 bits") from None
+    
+    def _check_block(self, start: int, count: int):
+        """Valida que el bloque [start, start + count) este dentro de la RAM"""
+        if count < 0 or start < 0 or start + count > self.size:
+            raise ValueError(f"Bloque [0x{start:04X}, +{count}] fuera del rango de la RAM")
+    
+    def _mark_dirty(self, start: int, count: int):
+        """Marca como sucias las páginas que tocan [start, start + count)"""
+        if count > 0:
+            first = start >> self.PAGE_BITS
+            last = (start + count - 1) >> self.PAGE_BITS
+            self._dirty[first:last + 1] = b'\x01' * (last - first + 1)
+    
+    # ===== SNAPSHOTS (copia en escritura por páginas) =====
+    
+    def snapshot(self) -> RAM_Snapshot:
+        """Captura la memoria; solo copia las páginas escritas desde el último snapshot/restore"""
+        page_size = self.PAGE_SIZE
+        memory = self.memory
+        base = self._base_pages
+        dirty = self._dirty
+        
+        pages = tuple(
+            memory[page * page_size:(page + 1) * page_size] if base is None or dirty[page] else base[page]
+            for page in range(self.page_count)
+        )
+        
+        self._base_pages = pages
+        self._dirty[:] = bytes(self.page_count)
+        return RAM_Snapshot(pages, self.read_count, self.write_count)
+    
+    def restore(self, snapshot: RAM_Snapshot):
+        """Vuelve al estado de un snapshot; solo copia las páginas que difieren"""
+        if len(snapshot.pages) != self.page_count:
+            raise ValueError(f"El snapshot tiene {len(snapshot)} palabras, la RAM {self.size}")
+        
+        page_size = self.PAGE_SIZE
+        base = self._base_pages
+        dirty = self._dirty
+        
+        for page, words in enumerate(snapshot.pages):
+            # Página limpia y compartida con el snapshot: ya es idéntica
+            if base is not None and not dirty[page] and base[page] is words:
+                continue
+            start = page * page_size
+            self.memory[start:start + page_size] = words
+            if self._write_listeners:
+                self._notify_write(start, page_size)
+        
+        self._base_pages = snapshot.pages
+        self._dirty[:] = bytes(self.page_count)
+        self.read_count = snapshot.read_count
+        self.write_count = snapshot.write_count
+    
+    def get_dirty_pages(self) -> list:
+        """Páginas escritas desde el último snapshot/restore"""
+        return [page for page in range(self.page_count) if self._dirty[page]]
     
     def dump(self, start_addr: int = 0, count: int = 32):
         """Muestra contenido de memoria"""
@@ -123,7 +327,7 @@ class RAM:
         for i in range(count):
             addr = start_addr + i
             if addr < self.size:
-                word = self.memory[addr]
+                word = Bus(16, self.read_word(addr))
                 dec_val = word.get_Decimal_value()
                 if dec_val != 0:  # Mostrar solo valores no cero
                     print(f"0x{addr:04X}      {word.get_Hexadecimal_value():<6} "
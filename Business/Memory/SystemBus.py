@@ -1,12 +1,96 @@
+from array import array
+from bisect import bisect_right
 from Business.Basic_Components.Bus import Bus
 from Business.Basic_Components.Bit import Bit
 
+
+class Bus_Port:
+    """
+    Acceso de un maestro al SystemBus con enteros, sin crear un Bus por acceso.
+    
+    read(address) -> int, write(address, value), fetch(address) (lectura de
+    una instrucción), fetched(address, count) y advance(cycles) los enlaza el bus y los vuelve a enlazar cuando cambian sus dispositivos
+    o sus maestros. Con un único maestro se omite el arbitraje y, si un solo
+    dispositivo empieza en 0, se llama directamente a su acceso por palabra.
+    Los ciclos del bus y las estadísticas del dispositivo se cuentan siempre.
+    
+    Sin arbitraje (arbitrated = False), resolve(address) entrega el acceso
+    del dispositivo de una dirección fija para que el código traducido lo
+    llame sin pasar por el bus y cuente los accesos por lotes. Esa
+    resolución vale hasta el próximo reenlace, que se avisa a los callbacks
+    registrados con add_rebind_listener; el código traducido suma sus
+    ciclos con advance, que es además un punto de arbitraje.
+    """
+    
+    def __init__(self, bus: "SystemBus", master: str):
+        self.bus = bus
+        self.master = master
+        self.arbitrated = False
+        self.read = None
+        self.write = None
+        self.fetch = None
+        self.fetched = None
+        self.advance = None
+        self.resolve = None
+        self._rebind_listeners = []
+    
+    def add_rebind_listener(self, callback):
+        """Registra un callback() que se llama cada vez que el bus reenlaza el puerto"""
+        if callback not in self._rebind_listeners:
+            self._rebind_listeners.append(callback)
+    
+    def remove_rebind_listener(self, callback):
+        """Elimina un callback registrado con add_rebind_listener"""
+        if callback in self._rebind_listeners:
+            self._rebind_listeners.remove(callback)
+    
+    def __str__(self):
+        return f"Bus_Port({self.master})"
+
+
 class SystemBus:
     """
     Bus del sistema principal con arbitraje
     Conecta CPU, memoria y dispositivos de E/S
+    
+    La decodificación de direcciones usa una tabla de páginas de PAGE_SIZE
+    direcciones que se reconstruye solo al conectar un dispositivo: una
+    página cubierta entera por un dispositivo apunta directamente a su
+    entrada; una página compartida (p. ej. varios registros de E/S) guarda
+    los pocos dispositivos que la tocan, ordenados para buscar con bisect.
+    El costo de find_device no crece con el número de dispositivos. Un
+    dispositivo de más de LARGE_PAGES páginas (p. ej. una Paged_RAM con un
+    espacio de direcciones grande) solo registra sus páginas de los bordes;
+    el interior se resuelve con bisect sobre la lista de esos dispositivos,
+    así que conectarlo no recorre todas sus páginas.
+    
+    Los dispositivos pueden ofrecer acceso por palabra con enteros:
+    load_word/store_word cuentan el acceso igual que read/write; si además
+    tienen read_word/write_word (sin contar) y count_accesses(reads, writes),
+    el código traducido los usa y cuenta los accesos por lotes. Si no tienen
+    acceso por palabra, el bus lo adapta sobre read/write. Los maestros
+    acceden con enteros a través de un Bus_Port (get_port).
+    
+    Arbitraje: las solicitudes que no se conceden esperan en una cola de
+    pendientes. Los maestros sin puerto (p. ej. el DMA) piden el bus con
+    request y se atienden por ráfagas en los puntos de arbitraje, tras cada
+    transacción del maestro activo. Con la política 'priority' (orden de
+    priority) un solicitante más prioritario que el maestro activo termina
+    toda su transferencia y uno menos prioritario roba una ráfaga por punto
+    de arbitraje; con 'round_robin' cada solicitante recibe una ráfaga por
+    turno. Un maestro con puerto al que se le niega el bus espera a que el
+    dueño termine sus ráfagas pendientes en lugar de leer un valor falso.
+    Por maestro se cuentan concesiones, latencia de concesión, ciclos de
+    espera y ciclos de uso (get_master_stats); los ciclos tomados mientras
+    otro maestro estaba activo son robados (get_stolen_cycles). Con el bus
+    ocioso (drain) no se roban ciclos.
     """
     
+    PAGE_BITS = 8
+    PAGE_SIZE = 1 << PAGE_BITS
+    LARGE_PAGES = 256
+    POLICIES = ('priority', 'round_robin')
+    
     def __init__(self, data_width: int = 16, addr_width: int = 12):
         # Buses principales
         self.data_bus = Bus(data_width, 0)
@@ -15,16 +99,28 @@ class SystemBus:
         
         # Dispositivos conectados
         self.devices = []
+        self.__intervals = []   # Entradas ordenadas por dirección de inicio
+        self.__pages = {}       # página -> entrada, o (inicios, entradas) si es compartida
+        self.__large = ((), ())  # (inicios, entradas) de los dispositivos grandes
+        self.__ports = {}       # maestro -> Bus_Port
+        self.__flushes = []     # flush() de los dispositivos con salida pendiente (E/S)
         
         # Señales de arbitraje
         self.bus_request = Bit(0)
         self.bus_grant = Bit(0)
         self.current_master = None
+        self.priority = []      # Maestros de mayor a menor prioridad
+        self.policy = 'priority'
+        self.__requests = []    # Solicitudes pendientes en orden de llegada: {'master', 'service', 'since'}
+        self.__stats = {}       # maestro -> contadores de arbitraje
+        self.__stolen = {}      # maestro -> ciclos robados al maestro activo
+        self.__last_grant = None
         
         # Temporización
         self.clock_cycles = 0
     
-    def connect_device(self, device, name: str, address_range: tuple, device_type: str = "slave"):
+    def connect_device(self, device, name: str, address_range: tuple, device_type: str = "slave",
+                       verbose: bool = True):
         """
         Conecta un dispositivo al bus
         
@@ -33,23 +129,116 @@ class SystemBus:
             name: Nombre identificador
             address_range: (start_addr, end_addr)
             device_type: "master" (CPU) o "slave" (memoria, E/S)
+            verbose: Informar la conexión por consola
         """
-        self.devices.append({
+        start, end = address_range
+        if start < 0 or end < start:
+            raise ValueError(f"Rango de direcciones inválido para {name}: {address_range}")
+        
+        # Detección de solapamiento contra los vecinos en el índice ordenado
+        starts = [entry['start'] for entry in self.__intervals]
+        position = bisect_right(starts, start)
+        for neighbor in self.__intervals[max(position - 1, 0):position + 1]:
+            if neighbor['start'] <= end and start <= neighbor['end']:
+                raise ValueError(f"El rango {start:04X}-{end:04X} de {name} se solapa con "
+                                 f"{neighbor['name']} ({neighbor['start']:04X}-{neighbor['end']:04X})")
+        
+        entry = {
             'name': name,
             'device': device,
             'address_range': address_range,
-            'type': device_type
-        })
+            'type': device_type,
+            'start': start,
+            'end': end,
+            # Métodos resueltos una sola vez (camino rápido de read/write)
+            'read': device.read,
+            'write': device.write,
+            'load': getattr(device, 'load_word', None) or self.__load_adapter(device),
+            'store': getattr(device, 'store_word', None) or self.__store_adapter(device),
+            'raw': self.__raw_access(device)
+        }
+        self.devices.append(entry)
+        self.__intervals.insert(position, entry)
+        if callable(getattr(device, 'flush', None)):
+            self.__flushes.append(device.flush)
+        self.__build_pages()
+        self.__bind_ports()
+        
+        if verbose:
+            print(f"Dispositivo {name} conectado al bus (rango: {start:04X}-{end:04X})")
+    
+    @staticmethod
+    def __raw_access(device):
+        """(read_word, write_word, count_accesses) si el dispositivo permite contar por lotes"""
+        names = ('read_word', 'write_word', 'count_accesses')
+        if all(callable(getattr(device, name, None)) for name in names):
+            return tuple(getattr(device, name) for name in names)
+        return None
+    
+    @staticmethod
+    def __load_adapter(device):
+        def load(address):
+            return device.read(address).get_Decimal_value()
+        return load
+    
+    def __store_adapter(self, device):
+        width = self.data_bus.width
+        
+        def store(address, value):
+            device.write(address, Bus(width, value))
+        return store
+    
+    def __build_pages(self):
+        """Reconstruye la tabla de páginas a partir del índice de intervalos"""
+        touching = {}
+        large = []
+        for entry in self.__intervals:
+            first, last = entry['start'] >> self.PAGE_BITS, entry['end'] >> self.PAGE_BITS
+            if last - first + 1 > self.LARGE_PAGES:
+                large.append(entry)
+                pages = (first, last)   # El interior se resuelve con bisect
+            else:
+                pages = range(first, last + 1)
+            for page in pages:
+                touching.setdefault(page, []).append(entry)
+        self.__large = (tuple(entry['start'] for entry in large), tuple(large))
         
-        print(f"Dispositivo {name} conectado al bus (rango: {address_range[0]:04X}-{address_range[1]:04X})")
+        pages = {}
+        for page, entries in touching.items():
+            first = page << self.PAGE_BITS
+            last = first + self.PAGE_SIZE - 1
+            if len(entries) == 1 and entries[0]['start'] <= first and entries[0]['end'] >= last:
+                pages[page] = entries[0]
+            else:
+                pages[page] = (tuple(entry['start'] for entry in entries), tuple(entries))
+        self.__pages = pages
     
     def find_device(self, address: int):
         """Encuentra el dispositivo que maneja una dirección"""
-        for dev in self.devices:
-            start, end = dev['address_range']
-            if start <= address <= end:
-                return dev, address - start  # Devuelve dispositivo y dirección relativa
-        return None, None
+        entry = self.__pages.get(address >> self.PAGE_BITS)
+        if entry is None:
+            entry = self.__large    # Interior de un dispositivo grande (o sin mapear)
+        if type(entry) is tuple:
+            # Página compartida: el último dispositivo que empieza antes de la dirección
+            starts, entries = entry
+            index = bisect_right(starts, address) - 1
+            if index < 0 or address > entries[index]['end']:
+                return None, None
+            entry = entries[index]
+        return entry, address - entry['start']  # Devuelve dispositivo y dirección relativa
+    
+    def flush_devices(self):
+        """Vacía la salida pendiente de los dispositivos (HALT o fin de un tramo de ejecución)"""
+        for flush in self.__flushes:
+            flush()
+    
+    def is_connected(self, device) -> bool:
+        """Indica si el objeto ya está conectado al bus"""
+        return any(entry['device'] is device for entry in self.devices)
+    
+    def get_memory_map(self) -> list:
+        """Dispositivos ordenados por dirección: (inicio, fin, nombre)"""
+        return [(entry['start'], entry['end'], entry['name']) for entry in self.__intervals]
     
     def read(self, address: int, master_name: str = None) -> Bus:
         """
@@ -62,8 +251,8 @@ class SystemBus:
         Returns:
             Bus con el dato leído
         """
-        if master_name and not self._request_bus(master_name):
-            return Bus(self.data_bus.width, 0)
+        if master_name:
+            self.__acquire(master_name)
         
         # Colocar dirección en el bus
         self.address_bus.set_Binary_value(address)
@@ -72,7 +261,7 @@ class SystemBus:
         dev_info, rel_addr = self.find_device(address)
         if dev_info:
             # Leer del dispositivo
-            data = dev_info['device'].read(rel_addr)
+            data = dev_info['read'](rel_addr)
             # Colocar en bus de datos
             self.data_bus = data
         else:
@@ -83,7 +272,7 @@ class SystemBus:
         self.clock_cycles += 1
         
         if master_name:
-            self._release_bus(master_name)
+            self.__finish(master_name)
             
         return data
     
@@ -96,8 +285,8 @@ class SystemBus:
             data: Dato a escribir
             master_name: Nombre del maestro que escribe
         """
-        if master_name and not self._request_bus(master_name):
-            return
+        if master_name:
+            self.__acquire(master_name)
         
         # Colocar dirección y dato en los buses
         self.address_bus.set_Binary_value(address)
@@ -107,22 +296,135 @@ class SystemBus:
         dev_info, rel_addr = self.find_device(address)
         if dev_info:
             # Escribir en el dispositivo
-            dev_info['device'].write(rel_addr, data)
+            dev_info['write'](rel_addr, data)
         
         self.clock_cycles += 1
         
         if master_name:
-            self._release_bus(master_name)
+            self.__finish(master_name)
+    
+    # ===== ACCESO POR PALABRA (enteros) =====
+    
+    def read_word(self, address: int, master_name: str = None) -> int:
+        """Como read, pero con enteros: lee la palabra de la dirección (0xFFFF sin mapear)"""
+        if master_name:
+            self.__acquire(master_name)
+        
+        self.address_bus.set_Binary_value(address)
+        dev_info, rel_addr = self.find_device(address)
+        value = dev_info['load'](rel_addr) if dev_info is not None else 0xFFFF
+        self.data_bus = Bus(self.data_bus.width, value & ((1 << self.data_bus.width) - 1))
+        self.clock_cycles += 1
+        
+        if master_name:
+            self.__finish(master_name)
+        return value
+    
+    def write_word(self, address: int, value: int, master_name: str = None):
+        """Como write, pero con enteros"""
+        if master_name:
+            self.__acquire(master_name)
+        
+        self.address_bus.set_Binary_value(address)
+        self.data_bus = Bus(self.data_bus.width, value)
+        dev_info, rel_addr = self.find_device(address)
+        if dev_info is not None:
+            dev_info['store'](rel_addr, value)
+        self.clock_cycles += 1
+        
+        if master_name:
+            self.__finish(master_name)
+    
+    def count_fetches(self, address: int, count: int):
+        """Cuenta count lecturas de instrucciones desde address que el maestro no repitió"""
+        self.clock_cycles += count
+        dev_info, rel_addr = self.find_device(address)
+        if dev_info is not None and dev_info['raw'] is not None:
+            dev_info['raw'][2](count, 0)
+        elif dev_info is not None:
+            # Sin conteo por lotes: el dispositivo cuenta al leer
+            for offset in range(count):
+                dev_info['load'](rel_addr + offset)
+    
+    def __block_device(self, address: int, count: int):
+        """(entrada, relativa) si [address, address + count) cae entero en un dispositivo con acceso por bloques"""
+        dev_info, rel_addr = self.find_device(address)
+        if (dev_info is not None and address + count - 1 <= dev_info['end'] and dev_info['raw'] is not None
+                and callable(getattr(dev_info['device'], 'read_block', None))
+                and callable(getattr(dev_info['device'], 'write_block', None))):
+            return dev_info, rel_addr
+        return None, None
+    
+    def copy_block(self, source: int, destination: int, count: int):
+        """
+        Copia count palabras sin pasar por un puerto (transferencias DMA).
+        Los accesos se cuentan en los dispositivos; los ciclos los cuenta
+        quien atiende la solicitud. Si origen y destino caen cada uno en un
+        dispositivo con read_block/write_block, la copia es una sola
+        operación en el host; si no, palabra a palabra (0xFFFF sin mapear).
+        """
+        src_info, src_rel = self.__block_device(source, count)
+        dst_info, dst_rel = self.__block_device(destination, count)
+        if src_info is not None and dst_info is not None:
+            dst_info['device'].write_block(dst_rel, src_info['device'].read_block(src_rel, count))
+            src_info['raw'][2](count, 0)
+            dst_info['raw'][2](0, count)
+            return
+        for offset in range(count):
+            dev_info, rel_addr = self.find_device(source + offset)
+            value = dev_info['load'](rel_addr) if dev_info is not None else 0xFFFF
+            dev_info, rel_addr = self.find_device(destination + offset)
+            if dev_info is not None:
+                dev_info['store'](rel_addr, value)
+    
+    def fill_block(self, destination: int, count: int, value: int):
+        """Escribe value en count palabras desde destination (mismas reglas que copy_block)"""
+        dst_info, dst_rel = self.__block_device(destination, count)
+        if dst_info is not None:
+            dst_info['device'].write_block(dst_rel, array('H', [value]) * count)
+            dst_info['raw'][2](0, count)
+            return
+        for offset in range(count):
+            dev_info, rel_addr = self.find_device(destination + offset)
+            if dev_info is not None:
+                dev_info['store'](rel_addr, value)
+    
+    # ===== ARBITRAJE =====
+    
+    def set_priority(self, priority):
+        """Orden de prioridad de los maestros (el primero gana); los no listados van al final"""
+        self.priority = list(priority)
+    
+    def set_policy(self, policy: str):
+        """Política de arbitraje: 'priority' (prioridad fija) o 'round_robin' (turnos)"""
+        if policy not in self.POLICIES:
+            raise ValueError(f"Política de arbitraje desconocida: {policy} (opciones: {', '.join(self.POLICIES)})")
+        self.policy = policy
+    
+    def _rank(self, master_name: str) -> int:
+        if master_name in self.priority:
+            return self.priority.index(master_name)
+        return len(self.priority)
+    
+    def __stats_of(self, master_name: str) -> dict:
+        stats = self.__stats.get(master_name)
+        if stats is None:
+            stats = self.__stats[master_name] = {'requests': 0, 'grants': 0, 'latency': 0, 'max_latency': 0,
+                                                 'wait_cycles': 0, 'busy_cycles': 0}
+        return stats
     
     def _request_bus(self, master_name: str) -> bool:
-        """Solicita control del bus"""
-        if self.current_master is None:
-            self.current_master = master_name
-            self.bus_grant.set_value(1)
+        """
+        Solicita control del bus. Si otro maestro lo tiene, la solicitud
+        queda en la cola de pendientes y retorna False.
+        """
+        self.__stats_of(master_name)['requests'] += 1
+        if self.current_master is None or self.current_master == master_name:
+            self.__grant(master_name, self.clock_cycles)
             return True
-        
-        # Si ya hay un maestro, esperar (en hardware real habría prioridades)
-        # Por simplicidad, denegamos si ya hay otro maestro
+        if not any(request['master'] == master_name for request in self.__requests):
+            self.__requests.append({'master': master_name, 'service': None, 'since': self.clock_cycles})
+        self.bus_request.set_value(1)
         return False
     
     def _release_bus(self, master_name: str):
@@ -131,6 +433,311 @@ class SystemBus:
             self.current_master = None
             self.bus_grant.set_value(0)
     
+    def __grant(self, master_name: str, since: int):
+        """Concede el bus a master_name, que lo pidió en el ciclo since"""
+        self.current_master = master_name
+        self.bus_grant.set_value(1)
+        self.__last_grant = master_name
+        latency = self.clock_cycles - since
+        stats = self.__stats_of(master_name)
+        stats['grants'] += 1
+        stats['latency'] += latency
+        stats['wait_cycles'] += latency
+        if latency > stats['max_latency']:
+            stats['max_latency'] = latency
+    
+    def __acquire(self, master_name: str):
+        """Obtiene el bus para una transacción; si está ocupado, espera en la cola"""
+        if self._request_bus(master_name):
+            return
+        waiting = next(request for request in self.__requests if request['master'] == master_name)
+        # El dueño avanza con sus ráfagas pendientes hasta liberar el bus
+        while self.current_master is not None:
+            holder = self.current_master
+            request = next((request for request in self.__requests
+                            if request['master'] == holder and request['service'] is not None), None)
+            if request is None:
+                self.__requests.remove(waiting)
+                self.bus_request.set_value(1 if self.__requests else 0)
+                raise ValueError(f"{master_name} espera el bus, retenido por {holder} sin transferencias pendientes")
+            self.__burst(request, master_name, queued=True)
+        # Antes de conceder, terminan los pendientes que le ganan a master_name
+        self.__requests.remove(waiting)
+        self.__serve(master_name, steal=False, queued=True)
+        self.__grant(master_name, waiting['since'])
+    
+    def __finish(self, master_name: str, cycles: int = 1):
+        """Fin de una transacción de master_name: libera el bus y arbitra"""
+        self.__stats_of(master_name)['busy_cycles'] += cycles
+        self._release_bus(master_name)
+        if self.__requests:
+            self.arbitrate(master_name)
+    
+    def request(self, master_name: str, service):
+        """
+        Solicita el bus para una transferencia por ráfagas.
+        
+        Args:
+            master_name: Nombre del maestro solicitante
+            service: service() hace una ráfaga y retorna (ciclos de bus, terminó)
+        """
+        self.__stats_of(master_name)['requests'] += 1
+        self.__requests.append({'master': master_name, 'service': service, 'since': self.clock_cycles})
+        self.bus_request.set_value(1)
+    
+    def cancel(self, master_name: str) -> int:
+        """Retira las transferencias pendientes de master_name (p. ej. al resetearlo); retorna cuántas retiró"""
+        cancelled = [request for request in self.__requests
+                     if request['master'] == master_name and request['service'] is not None]
+        for request in cancelled:
+            self.__requests.remove(request)
+        self.bus_request.set_value(1 if self.__requests else 0)
+        return len(cancelled)
+    
+    def set_service(self, master_name: str, service) -> int:
+        """Cambia el servicio de las transferencias pendientes de master_name; retorna cuántas cambió"""
+        changed = 0
+        for request in self.__requests:
+            if request['master'] == master_name and request['service'] is not None:
+                request['service'] = service
+                changed += 1
+        return changed
+    
+    def has_requests(self) -> bool:
+        return any(request['service'] is not None for request in self.__requests)
+    
+    def get_pending(self) -> list:
+        """Maestros con solicitudes pendientes, en orden de llegada"""
+        return [request['master'] for request in self.__requests]
+    
+    def __order(self) -> list:
+        """Solicitudes con transferencia pendiente en el orden en que la política las atiende"""
+        pending = [request for request in self.__requests if request['service'] is not None]
+        if self.policy == 'round_robin':
+            # Turnos en el orden de priority (los no listados, por llegada) desde el último concedido
+            ring = list(self.priority)
+            ring.extend(request['master'] for request in pending if request['master'] not in ring)
+            last = ring.index(self.__last_grant) if self.__last_grant in ring else -1
+            return sorted(pending, key=lambda request: (ring.index(request['master']) - last - 1) % len(ring))
+        return sorted(pending, key=lambda request: self._rank(request['master']))
+    
+    def __burst(self, request: dict, holder, queued: bool = False):
+        """
+        Concede el bus a una solicitud para una ráfaga; holder (si hay) espera
+        mientras tanto. Con queued, holder espera en la cola y esos ciclos ya
+        los cuenta la latencia de su concesión (__grant), no se suman aquí.
+        """
+        master = request['master']
+        self.__grant(master, request['since'])
+        cycles, done = request['service']()
+        self.clock_cycles += cycles
+        self.__stats_of(master)['busy_cycles'] += cycles
+        if holder is not None:
+            if not queued:
+                self.__stats_of(holder)['wait_cycles'] += cycles
+            self.__stolen[master] = self.__stolen.get(master, 0) + cycles
+        self._release_bus(master)
+        if done:
+            self.__requests.remove(request)
+        else:
+            request['since'] = self.clock_cycles    # Vuelve a la cola
+    
+    def __serve(self, holder, steal: bool, queued: bool = False):
+        """Atiende las solicitudes pendientes frente a holder según la política"""
+        for request in self.__order():
+            if self.policy == 'priority' and self._rank(request['master']) < self._rank(holder):
+                while request in self.__requests:
+                    self.__burst(request, holder, queued)   # Más prioritario: termina la transferencia
+            elif steal:
+                self.__burst(request, holder, queued)   # Una ráfaga: robo de ciclos o turno
+        self.bus_request.set_value(1 if self.__requests else 0)
+    
+    def arbitrate(self, holder: str):
+        """Punto de arbitraje tras una transacción de holder: atiende las solicitudes pendientes"""
+        self.__serve(holder, steal=True)
+    
+    def advance(self, cycles: int, holder: str):
+        """Suma ciclos de holder y arbitra (código traducido: una vez por bloque)"""
+        self.clock_cycles += cycles
+        if self.__requests:
+            self.arbitrate(holder)
+    
+    def drain(self):
+        """Bus ocioso (p. ej. CPU detenida): termina las solicitudes sin robar ciclos"""
+        while self.has_requests():
+            for request in self.__order():
+                if self.policy == 'priority':
+                    while request in self.__requests:
+                        self.__burst(request, None)
+                else:
+                    self.__burst(request, None)
+        self.bus_request.set_value(1 if self.__requests else 0)
+    
+    def get_stolen_cycles(self, master_name: str = None) -> int:
+        """Ciclos que master_name (o todos) tomó mientras otro maestro usaba el bus"""
+        if master_name is None:
+            return sum(self.__stolen.values())
+        return self.__stolen.get(master_name, 0)
+    
+    def get_master_stats(self) -> dict:
+        """
+        Contadores de arbitraje por maestro: solicitudes, concesiones,
+        latencia de concesión (media y máxima), ciclos de espera, ciclos de
+        uso y utilización (fracción de los ciclos del bus). Los accesos del
+        maestro único sin arbitraje no pasan por la cola: se le atribuyen los
+        ciclos del bus que no usó ningún otro maestro.
+        """
+        stats = {master: dict(counters) for master, counters in self.__stats.items()}
+        unarbitrated = [port.master for port in self.__ports.values() if not port.arbitrated]
+        for master in unarbitrated:
+            entry = stats.setdefault(master, {'requests': 0, 'grants': 0, 'latency': 0, 'max_latency': 0,
+                                              'wait_cycles': 0, 'busy_cycles': 0})
+            entry['busy_cycles'] = self.clock_cycles - sum(counters['busy_cycles'] for other, counters
+                                                           in stats.items() if other != master)
+        for master, entry in stats.items():
+            latency = entry.pop('latency')
+            entry['avg_latency'] = round(latency / entry['grants'], 2) if entry['grants'] else 0.0
+            entry['utilization'] = round(entry['busy_cycles'] / self.clock_cycles, 4) if self.clock_cycles else 0.0
+            entry['stolen_cycles'] = self.__stolen.get(master, 0)
+        return stats
+    
+    def format_master_stats(self) -> str:
+        lines = [f"ARBITRAJE ({self.policy}, prioridad: {', '.join(self.priority) or '-'}), "
+                 f"{self.clock_cycles} ciclos de bus"]
+        for master, entry in self.get_master_stats().items():
+            lines.append(f"  {master:<8} uso {100 * entry['utilization']:5.1f}%  {entry['grants']:>8} concesiones  "
+                         f"latencia media {entry['avg_latency']:>7} (máx {entry['max_latency']})  "
+                         f"espera {entry['wait_cycles']:>8}  robados {entry['stolen_cycles']:>8}")
+        return "\n".join(lines)
+    
+    # ===== PUERTOS DE MAESTROS =====
+    
+    def get_port(self, master_name: str) -> Bus_Port:
+        """Puerto de acceso con enteros para un maestro (se crea la primera vez)"""
+        port = self.__ports.get(master_name)
+        if port is None:
+            port = self.__ports[master_name] = Bus_Port(self, master_name)
+            self.__bind_ports()
+        return port
+    
+    def get_masters(self) -> list:
+        """Maestros del bus: los que tienen puerto y los dispositivos de tipo 'master'"""
+        masters = list(self.__ports)
+        masters.extend(entry['name'] for entry in self.devices
+                       if entry['type'] == 'master' and entry['name'] not in self.__ports)
+        return masters
+    
+    def __bind_ports(self):
+        single_master = len(self.get_masters()) == 1
+        for port in self.__ports.values():
+            self.__bind(port, single_master)
+            for callback in list(port._rebind_listeners):
+                callback()
+    
+    def __resolve(self, address: int):
+        """
+        (lectura, escritura, contador, dirección relativa) de una dirección fija.
+        Con contador, lectura/escritura no cuentan y el llamador debe llamar
+        contador(reads, writes); sin él, cada acceso se cuenta solo.
+        Dirección sin mapear: (None, None, None, 0).
+        """
+        dev_info, rel_addr = self.find_device(address)
+        if dev_info is None:
+            return None, None, None, 0
+        if dev_info['raw'] is not None:
+            read_word, write_word, count = dev_info['raw']
+            return read_word, write_word, count, rel_addr
+        return dev_info['load'], dev_info['store'], None, rel_addr
+    
+    def __bind(self, port: Bus_Port, single_master: bool):
+        """Enlaza los accesos del puerto según los maestros y el mapa actual"""
+        bus = self
+        master = port.master
+        requests = self.__requests
+        port.arbitrated = not single_master
+        resolve = self.__resolve
+        
+        def resolve_arbitrated(address):
+            read, write, count, rel_addr = resolve(address)
+            if read is None or count is not None:
+                return read, write, count, rel_addr
+            # E/S: cada acceso es un punto de arbitraje (p. ej. el START del DMA)
+            def load(address):
+                value = read(address)
+                if requests:
+                    bus.arbitrate(master)
+                return value
+            
+            def store(address, value):
+                write(address, value)
+                if requests:
+                    bus.arbitrate(master)
+            return load, store, None, rel_addr
+        
+        def fetched(address, count):
+            bus.count_fetches(address, count)
+            if not single_master:
+                bus.__stats_of(master)['busy_cycles'] += count
+            if requests:
+                bus.arbitrate(master)
+        
+        def advance(cycles):
+            bus.clock_cycles += cycles
+            if requests:
+                bus.arbitrate(master)
+        
+        port.fetched = fetched
+        port.advance = advance
+        port.resolve = resolve_arbitrated
+        
+        if not single_master:
+            # Varios maestros: cada acceso pasa por el arbitraje
+            port.read = lambda address: bus.read_word(address, master)
+            port.write = lambda address, value: bus.write_word(address, value, master)
+            port.fetch = port.read
+            return
+        
+        if len(self.__intervals) == 1 and self.__intervals[0]['start'] == 0:
+            # Un solo dispositivo desde 0: la dirección es la relativa, sin decodificar
+            entry = self.__intervals[0]
+            load, store, end = entry['load'], entry['store'], entry['end']
+            
+            def read(address):
+                bus.clock_cycles += 1
+                value = load(address) if address <= end else 0xFFFF
+                if requests:
+                    bus.arbitrate(master)
+                return value
+            
+            def write(address, value):
+                bus.clock_cycles += 1
+                if address <= end:
+                    store(address, value)
+                if requests:
+                    bus.arbitrate(master)
+        else:
+            find_device = self.find_device
+            
+            def read(address):
+                bus.clock_cycles += 1
+                dev_info, rel_addr = find_device(address)
+                value = dev_info['load'](rel_addr) if dev_info is not None else 0xFFFF
+                if requests:
+                    bus.arbitrate(master)
+                return value
+            
+            def write(address, value):
+                bus.clock_cycles += 1
+                dev_info, rel_addr = find_device(address)
+                if dev_info is not None:
+                    dev_info['store'](rel_addr, value)
+                if requests:
+                    bus.arbitrate(master)
+        
+        port.read = read
+        port.write = write
+        port.fetch = read
+    
     def reset(self):
         """Resetea el bus"""
         self.data_bus.set_Binary_value(0)
@@ -140,6 +747,48 @@ class SystemBus:
         self.bus_grant.set_value(0)
         self.current_master = None
         self.clock_cycles = 0
+        self.__requests.clear()
+        self.__stats.clear()
+        self.__stolen.clear()
+        self.__last_grant = None
+    
+    def snapshot(self) -> dict:
+        """
+        Captura valores de los buses, señales y estado de arbitraje (solicitudes
+        pendientes, estadísticas por maestro, ciclos robados) y contadores
+        """
+        return {
+            'data': self.data_bus.get_Decimal_value(),
+            'address': self.address_bus.get_Decimal_value(),
+            'control': self.control_bus.get_Decimal_value(),
+            'bus_request': self.bus_request.get_value(),
+            'bus_grant': self.bus_grant.get_value(),
+            'current_master': self.current_master,
+            'clock_cycles': self.clock_cycles,
+            'requests': [dict(request) for request in self.__requests],
+            'stats': {master: dict(counters) for master, counters in self.__stats.items()},
+            'stolen': dict(self.__stolen),
+            'last_grant': self.__last_grant
+        }
+    
+    def restore(self, state: dict):
+        """
+        Restaura un snapshot (los dispositivos conectados no cambian). Las
+        solicitudes pendientes vuelven con el servicio del snapshot; un maestro
+        de otro sistema lo reemplaza con set_service().
+        """
+        self.data_bus = Bus(self.data_bus.width, state['data'])
+        self.address_bus.set_Binary_value(state['address'])
+        self.control_bus.set_Binary_value(state['control'])
+        self.bus_request.set_value(state['bus_request'])
+        self.bus_grant.set_value(state['bus_grant'])
+        self.current_master = state['current_master']
+        self.clock_cycles = state['clock_cycles']
+        # Se modifica en el lugar: los puertos enlazados guardan la lista
+        self.__requests[:] = [dict(request) for request in state['requests']]
+        self.__stats = {master: dict(counters) for master, counters in state['stats'].items()}
+        self.__stolen = dict(state['stolen'])
+        self.__last_grant = state['last_grant']
     
     def get_status(self):
         """Retorna estado del bus"""
@@ -148,6 +797,8 @@ class SystemBus:
             'data': self.data_bus.get_Hexadecimal_value(),
             'control': self.control_bus.get_Binary_value(),
             'current_master': self.current_master,
+            'policy': self.policy,
+            'pending': self.get_pending(),
             'cycles': self.clock_cycles
         }
     
@@ -3,11 +3,13 @@
 import sys
 
 # Importamos solo lo necesario para evitar ciclos
-from .SystemBus import SystemBus
+from .SystemBus import SystemBus, Bus_Port
 from .RAM import RAM
+from .Paged_RAM import Paged_RAM
+from .Cache import Cache, Cache_Hierarchy
 
 # Importación diferida de ROM para evitar ciclos
-__all__ = ['SystemBus', 'RAM', 'ROM']
+__all__ = ['SystemBus', 'Bus_Port', 'RAM', 'Paged_RAM', 'Cache', 'Cache_Hierarchy', 'ROM']
 
 # Función para obtener ROM cuando sea necesario
 def get_ROM():
@@ -93,6 +93,42 @@ def test_bus():
         print(f"  Línea 0 (MSB): {bus8.get_Line_bit(0).get_value()}")
         print(f"  Línea 7 (LSB): {bus8.get_Line_bit(7).get_value()}")
         
+        # Valor empaquetado: ida y vuelta por decimal, binario y líneas
+        import random
+        rng = random.Random(7)
+        for width in (1, 4, 8, 12, 16, 33, 64):
+            for value in (0, (1 << width) - 1, 1 << (width - 1), rng.randrange(1 << width)):
+                bus = Bus(width, value)
+                lines = bus.get_Lines_values()
+                from_lines = int("".join(str(lines[i]) for i in range(width)), 2)
+                copy = Bus(width)
+                copy.set_Binary_value(bus.get_Decimal_value())
+                if (bus.get_Decimal_value() != value or int(bus.get_Binary_value(), 2) != value or from_lines != value
+                        or int(bus.get_Hexadecimal_value(), 16) != value or copy.get_Binary_value() != bus.get_Binary_value()):
+                    print(f"✗ ERROR: ida y vuelta incorrecta para Bus({width}, {value})")
+                    return False
+        print("Valores empaquetados: ida y vuelta correcta en anchos 1-64")
+        
+        # Vistas vivas: get_Line_bit lee y escribe sobre el valor del bus
+        bus16 = Bus(16, 0)
+        msb, lsb = bus16.get_Line_bit(0), bus16.get_Line_bit(15)
+        bus16.set_Binary_value(0x8001)
+        before = (msb.get_value(), lsb.get_value())
+        msb.set_value(0)
+        bus16.get_Line_bit(14).set_value(1)
+        if before != (1, 1) or bus16.get_Decimal_value() != 0x0003 or bus16.get_Line_bit(0) is not msb:
+            print("✗ ERROR: las vistas de línea no siguen al bus")
+            return False
+        
+        # set_Line_bit copia el valor: el Bit original queda desenlazado del bus
+        bit = Bit(1)
+        bus16.set_Line_bit(4, bit)
+        bit.set_value(0)
+        if bus16.get_Line_bit(4).get_value() != 1 or bus16.get_Decimal_value() != 0x0803:
+            print("✗ ERROR: set_Line_bit debería copiar el valor del Bit")
+            return False
+        print(f"Vistas vivas y copia con set_Line_bit: {bus16}")
+        
         print("✓ Bus: PRUEBA EXITOSA\n")
         return True
     except Exception as e:
@@ -122,6 +158,54 @@ def test_ram():
             print(f"✗ ERROR: Valor incorrecto. Esperado: 0x1234, Obtenido: 0x{value:04X}")
             return False
         
+        # Acceso por palabra: load_word/store_word cuentan accesos, read_word/write_word no
+        ram.store_word(0x200, 0xBEEF)
+        ram.write_word(0x201, 0x0042)
+        if (ram.load_word(0x200), ram.read_word(0x201), ram.read_count, ram.write_count) != (0xBEEF, 0x42, 1, 1):
+            print("✗ ERROR: acceso por palabra o contadores incorrectos")
+            return False
+        
+        # Bloques: read_block es una vista de solo lectura
+        ram.write_block(0x0FF0, range(16))
+        block = ram.read_block(0x0FF0, 16)
+        try:
+            block[0] = 1
+            print("ERROR: read_block debería ser de solo lectura")
+            return False
+        except TypeError:
+            pass
+        if not isinstance(block, memoryview) or not block.readonly or block.tolist() != list(range(16)):
+            print("✗ ERROR: read_block no retornó la vista esperada")
+            return False
+        
+        # Bloques fuera de rango y palabras de más de 16 bits
+        for operation in (lambda: ram.read_block(0x0FF8, 9), lambda: ram.read_block(-1, 2),
+                          lambda: ram.read_block(0, -1), lambda: ram.write_block(0x0FFF, [1, 2]),
+                          lambda: ram.write_block(0, [0x10000]), lambda: ram.store_word(0, -1)):
+            try:
+                operation()
+                print("ERROR: Debería haber lanzado ValueError")
+                return False
+            except ValueError:
+                pass
+        print("Bloques: vista de solo lectura, 6 accesos fuera de rango rechazados")
+        
+        # Snapshot/restore: deshace las escrituras posteriores y solo copia páginas sucias
+        snapshot = ram.snapshot()
+        ram.write_word(0x100, 0xAAAA)
+        ram.write_block(0x0300, [7] * 300)
+        dirty = ram.get_dirty_pages()
+        ram.restore(snapshot)
+        if (ram.read_word(0x100), ram.read_word(0x0300), ram.read_word(0x042B)) != (0x1234, 0, 0) or ram.get_dirty_pages():
+            print("✗ ERROR: restore no deshizo las escrituras")
+            return False
+        again = ram.snapshot()
+        shared = sum(1 for a, b in zip(snapshot.pages, again.pages) if a is b)
+        print(f"Snapshot/restore: páginas sucias {dirty}, compartidas tras restore {shared}/{len(again.pages)}")
+        if dirty != [1, 3, 4] or shared != len(again.pages):
+            print("✗ ERROR: páginas sucias o compartidas incorrectas")
+            return False
+        
         # Cargar programa desde JSON
         json_path = project_root / "Data" / "Programs" / "Test.json"
         if not json_path.exists():
@@ -170,6 +254,78 @@ def test_ram():
         traceback.print_exc()
         return False
 
+def test_paged_ram():
+    """Prueba la RAM dispersa por páginas con un espacio de direcciones grande"""
+    print("=== Prueba de RAM paginada ===")
+    try:
+        import contextlib
+        import io
+        import time
+        from Business.Memory.Paged_RAM import Paged_RAM
+        from Business.Computer_System import System
+        
+        # 2^24 palabras: construirla no reserva memoria
+        start = time.perf_counter()
+        ram = Paged_RAM(16 * 1024)
+        elapsed = time.perf_counter() - start
+        print(f"Paged_RAM de {ram.size} palabras creada en {elapsed * 1000:.3f} ms")
+        if ram.size != 1 << 24 or ram.get_resident_pages() or elapsed > 0.05:
+            print("✗ ERROR: la construcción no es O(1)")
+            return False
+        
+        # Leer páginas sin tocar no las crea; escribir crea solo la página tocada
+        if ram.read_word(0xABCDEF) != 0 or ram.load_word(0x123456) != 0 or ram.get_resident_pages():
+            print("✗ ERROR: leer una página no residente la creó o no retornó 0")
+            return False
+        ram.write_word(0xABCDEF, 0x1234)
+        ram.write_block(0x1FE, range(1, 5))    # Cruza el límite de dos páginas
+        print(f"Páginas residentes: {ram.get_resident_pages()}, {ram.get_stats()}")
+        if ram.get_resident_pages() != [0x1, 0x2, 0xABCD] or ram.read_word(0xABCDEF) != 0x1234:
+            print("✗ ERROR: páginas residentes incorrectas")
+            return False
+        if list(ram.read_block(0x1FD, 6)) != [0, 1, 2, 3, 4, 0]:
+            print("✗ ERROR: bloque entre páginas incorrecto")
+            return False
+        
+        # Snapshot/restore: una página creada después del snapshot desaparece
+        snapshot = ram.snapshot()
+        ram.write_word(0x800000, 9)
+        ram.write_word(0xABCDEF, 0x5678)
+        ram.restore(snapshot)
+        if 0x8000 in ram.get_resident_pages() or ram.read_word(0xABCDEF) != 0x1234 or snapshot.get_word(0x777777) != 0:
+            print("✗ ERROR: restore de la RAM paginada incorrecto")
+            return False
+        
+        # Sistema con 20 bits de dirección: mismo resultado que la RAM densa y pocas páginas residentes
+        project_root = Path(__file__).parent
+        program = project_root / "Data" / "Benchmarks" / "MemoryStream.json"
+        memories = []
+        for paged in (False, True):
+            system = System({'trace_sink': 'null', 'ram_paged': paged, 'address_width': 20 if paged else 12})
+            with contextlib.redirect_stdout(io.StringIO()):
+                system.assemble(verbose=False)
+                system.load_program_from_json(str(program), verbose=False)
+            system.cpu.run_program(start_address=0, max_cycles=2000)
+            memories.append(list(system.ram.read_block(0, 4096)))
+        print(f"RAM paginada de {system.ram.size} palabras: {len(system.ram.get_resident_pages())} páginas residentes")
+        if memories[0] != memories[1] or len(system.ram.get_resident_pages()) > 4:
+            print("✗ ERROR: la RAM paginada cambió el resultado o reservó de más")
+            return False
+        
+        # Direcciones por encima de 12 bits a través del SystemBus
+        system.system_bus.write_word(0xF0000, 7)
+        if system.ram.read_word(0xF0000) != 7 or system.system_bus.read_word(0xFFFFF) != 0:
+            print("✗ ERROR: acceso por el bus fuera de los 12 bits")
+            return False
+        
+        print("✓ RAM paginada: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ RAM paginada: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_system_bus():
     """Prueba el bus del sistema - CORREGIDO"""
     print("=== Prueba de SystemBus ===")
@@ -225,6 +381,435 @@ def test_system_bus():
         traceback.print_exc()
         return False
 
+def test_bus_address_decoding():
+    """Prueba la tabla de páginas del SystemBus y la detección de solapamientos"""
+    print("=== Prueba de decodificación de direcciones ===")
+    try:
+        from Business.Memory.SystemBus import SystemBus
+        from Business.Memory.RAM import RAM
+        from Business.Basic_Components.Bus import Bus
+        
+        sysbus = SystemBus(data_width=16, addr_width=12)
+        ram = RAM(2)
+        registers = [RAM(1) for _ in range(3)]
+        sysbus.connect_device(ram, "RAM", (0x000, 0x7FF))
+        # Tres dispositivos pequeños compartiendo una página
+        for i, device in enumerate(registers):
+            sysbus.connect_device(device, f"IO{i}", (0xF00 + 4 * i, 0xF03 + 4 * i))
+        
+        try:
+            sysbus.connect_device(RAM(1), "Solapado", (0x7F0, 0x80F))
+            print("✗ ERROR: no se detectó el solapamiento")
+            return False
+        except ValueError as e:
+            print(f"Solapamiento detectado: {e}")
+        
+        device, relative = sysbus.find_device(0x0123)
+        if device['name'] != "RAM" or relative != 0x123:
+            print(f"✗ ERROR: decodificación de RAM incorrecta: {device and device['name']} {relative}")
+            return False
+        
+        sysbus.write(0xF05, Bus(16, 0x1234))
+        if registers[1].read_word(1) != 0x1234 or sysbus.read(0xF05).get_Decimal_value() != 0x1234:
+            print("✗ ERROR: acceso a un dispositivo de página compartida incorrecto")
+            return False
+        
+        # Huecos: dentro de la página compartida y en una página sin dispositivos
+        for address in (0xF0C, 0xEFF, 0x900):
+            if sysbus.find_device(address) != (None, None):
+                print(f"✗ ERROR: 0x{address:03X} debería estar sin mapear")
+                return False
+        
+        print(f"Mapa de memoria: {[(f'{s:03X}-{e:03X}', n) for s, e, n in sysbus.get_memory_map()]}")
+        print("✓ Decodificación de direcciones: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Decodificación de direcciones: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_bus_routing():
+    """Prueba que todos los accesos de la CPU pasen por el SystemBus"""
+    print("=== Prueba de accesos de la CPU por el SystemBus ===")
+    try:
+        from Business.CPU_Core.CPU import CPU
+        from Business.Memory.SystemBus import SystemBus
+        from Business.Memory.RAM import RAM
+        
+        # Bucle de 5 vueltas: LOAD cnt / ADD acc / STORE acc / LOAD cnt / SUB one / STORE cnt / JZ fin / JUMP 0
+        program = [0x1021, 0x3020, 0x2020, 0x1021, 0x4022, 0x2021, 0x8008, 0x7000, 0xF000]
+        instructions = 5 * 8   # La última vuelta ejecuta HALT en lugar de JUMP
+        expected = {'reads': instructions + 5 * 4, 'writes': 5 * 2}
+        
+        results = {}
+        for engine, masters in (('functional', 1), ('gate', 1), ('functional', 2)):
+            sysbus = SystemBus()
+            ram = RAM(4)
+            cpu = CPU(sysbus, engine=engine)
+            cpu.connect_memory(ram)   # Se mapea sola en el bus
+            if masters == 2:
+                sysbus.get_port("DMA")
+            cpu.load_program(program)
+            ram.write_direct(0x20, 0)
+            ram.write_direct(0x21, 5)
+            ram.write_direct(0x22, 1)
+            cpu.run_program(start_address=0, max_cycles=200)
+            results[(engine, masters)] = (ram.read_count, ram.write_count, sysbus.clock_cycles,
+                                          ram.read_word(0x20), cpu.port.arbitrated)
+            print(f"{engine} ({masters} maestro/s): lecturas={ram.read_count}, escrituras={ram.write_count}, "
+                  f"ciclos de bus={sysbus.clock_cycles}, arbitrado={cpu.port.arbitrated}")
+        
+        for (engine, masters), (reads, writes, cycles, total, arbitrated) in results.items():
+            if (reads, writes, cycles) != (expected['reads'], expected['writes'], expected['reads'] + expected['writes']):
+                print(f"✗ ERROR: conteos incorrectos con {engine}/{masters}, esperado {expected}")
+                return False
+            if total != 5 + 4 + 3 + 2 + 1 or arbitrated != (masters > 1):
+                print(f"✗ ERROR: resultado o arbitraje incorrecto con {engine}/{masters}")
+                return False
+        
+        print("✓ Accesos por el SystemBus: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Accesos por el SystemBus: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_io_devices():
+    """Prueba el teclado, el display de 7 segmentos y la consola mapeados en memoria"""
+    print("=== Prueba de E/S mapeada en memoria ===")
+    try:
+        import contextlib
+        import io
+        from Business.Computer_System import System
+        
+        project_root = Path(__file__).parent
+        json_path = project_root / "Data" / "Programs" / "KeyboardEcho.json"
+        
+        for engine in ('functional', 'gate', 'micro'):
+            system = System({'io_devices': True, 'trace_sink': 'null', 'cpu_engine': engine})
+            with contextlib.redirect_stdout(io.StringIO()):
+                system.assemble(verbose=False)
+                system.load_program_from_json(str(json_path), verbose=False)
+            flushed = []
+            system.console.sink = flushed.append
+            system.keyboard.feed("Hola\n")
+            
+            # Por cuadros de 20 ciclos: la consola solo entrega al final de cada cuadro
+            system.cpu.run_program(start_address=0, max_cycles=20)
+            while system.cpu.running.get_value():
+                system.cpu.resume(system.cpu.clock_cycle + 20)
+            
+            output = "".join(flushed)
+            print(f"{engine}: consola={output!r} en {len(flushed)} entregas, display={system.display.get_value()} "
+                  f"({system.display.renders} renders), teclado={system.keyboard.get_stats()}")
+            if output != "Hola\n" or system.display.get_value() != 5 or system.ram.read_word(0x20) != 5:
+                print(f"✗ ERROR: resultado de E/S incorrecto con el motor {engine}")
+                return False
+            # Render inicial + uno por cada valor nuevo (1..5)
+            if system.display.renders != 6 or system.keyboard.pending() != 0:
+                print("✗ ERROR: renders del display o buffer del teclado incorrectos")
+                return False
+        
+        # Escribir el mismo valor no vuelve a renderizar; apagar sí
+        display = system.display
+        system.system_bus.write_word(0xFF4, 5)
+        system.system_bus.write_word(0xFF5, 1)
+        if display.renders != 7 or not display.is_blank():
+            print("✗ ERROR: el display se renderizó sin cambios o no se apagó")
+            return False
+        
+        print("✓ E/S mapeada en memoria: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ E/S mapeada en memoria: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_dma_controller():
+    """Prueba el DMA: copia por ráfagas, prioridad frente a la CPU y ciclos robados"""
+    print("=== Prueba del controlador DMA ===")
+    try:
+        import contextlib
+        import io
+        from Business.Computer_System import System
+        
+        # Programa: SOURCE=0x100, DEST=0x400, LENGTH=100, START y espera a que BUSY baje
+        program = [0x9100, 0x2FFA, 0x9400, 0x2FFB, 0x9064, 0x2FFC, 0x9001, 0x2FFE,
+                   0x9000, 0x3FFE, 0x800C, 0x7008, 0xF000]
+        
+        for engine in ('functional', 'gate', 'micro'):
+            instructions = {}
+            for priority in (['DMA', 'CPU'], ['CPU', 'DMA']):
+                system = System({'io_devices': True, 'trace_sink': 'null', 'cpu_engine': engine,
+                                 'bus_priority': priority})
+                with contextlib.redirect_stdout(io.StringIO()):
+                    system.assemble(verbose=False)
+                system.ram.write_block(0, program)
+                system.ram.write_block(0x100, [3 * i for i in range(100)])
+                system.cpu.run_program(start_address=0, max_cycles=500)
+                
+                copied = list(system.ram.read_block(0x400, 100)) == [3 * i for i in range(100)]
+                stolen = system.system_bus.get_stolen_cycles('DMA')
+                instructions[priority[0]] = system.cpu.instructions_executed
+                print(f"{engine} {priority}: copia={'ok' if copied else 'MAL'}, {system.cpu.instructions_executed} "
+                      f"instrucciones, robados={stolen}, ráfagas={system.dma.bursts}")
+                if not copied or stolen != 200 or system.dma.is_busy():
+                    print("✗ ERROR: copia DMA incorrecta o ciclos robados inesperados")
+                    return False
+                if system.dma.bursts != 7 or system.system_bus.read_word(0xFFF) != 200:
+                    print("✗ ERROR: ráfagas o registro STOLEN incorrectos")
+                    return False
+            
+            # Con prioridad el DMA termina al escribir START: la espera ve BUSY = 0 a la primera
+            if instructions['DMA'] != 12 or instructions['CPU'] <= 12:
+                print(f"✗ ERROR: la prioridad no se respetó ({instructions})")
+                return False
+        
+        # Relleno desde el host con la CPU detenida: el bus está ocioso y no se roban ciclos
+        bus = system.system_bus
+        bus.write_word(0xFFD, 0xABCD)
+        bus.write_word(0xFFE, 0x3)
+        bus.drain()
+        if set(system.ram.read_block(0x400, 100)) != {0xABCD} or bus.get_stolen_cycles('DMA') != 200:
+            print("✗ ERROR: relleno DMA incorrecto")
+            return False
+
+        # Snapshot a mitad de una copia: la transferencia y la solicitud al bus vuelven con restore
+        system.ram.write_block(0x100, range(1, 101))
+        for register, value in ((0xFFA, 0x100), (0xFFB, 0x600), (0xFFC, 100), (0xFFE, 0x1)):
+            bus.write_word(register, value)
+        bus.get_port("CPU").read(0)             # El DMA roba una ráfaga
+        snapshot = system.snapshot()
+        moved = system.dma.words
+        runs = []
+        for attempt in range(2):
+            if attempt:
+                system.restore(snapshot)
+                if not system.dma.is_busy() or bus.get_pending() != ['DMA'] or system.dma.words != moved:
+                    print("✗ ERROR: la transferencia en curso no volvió con el snapshot")
+                    return False
+            bus.drain()
+            runs.append((system.ram.read_block(0x600, 100).tolist(), bus.get_master_stats(), system.dma.get_stats()))
+        if runs[0] != runs[1] or runs[1][0] != list(range(1, 101)):
+            print("✗ ERROR: la copia continuada desde el snapshot difiere")
+            return False
+
+        # Resetear el DMA con una transferencia pendiente la retira del bus
+        system.restore(snapshot)
+        system.dma.reset()
+        bus.drain()
+        if system.dma.is_busy() or bus.get_pending() or bus.bus_request.get_value():
+            print("✗ ERROR: el reset del DMA dejó su solicitud en el bus")
+            return False
+
+        print("✓ Controlador DMA: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Controlador DMA: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_bus_arbitration():
+    """Prueba el arbitraje por prioridad y round-robin y las estadísticas por maestro"""
+    print("=== Prueba de arbitraje del bus ===")
+    try:
+        from Business.Memory.SystemBus import SystemBus
+        from Business.Memory.RAM import RAM
+        from Business.IO import DMA_Controller
+        
+        def build(policy):
+            bus = SystemBus()
+            bus.connect_device(RAM(4), "RAM", (0, 0xEFF), "slave", verbose=False)
+            dmas = [DMA_Controller(bus, burst_size=8, master_name=name) for name in ("DMA0", "DMA1")]
+            for index, dma in enumerate(dmas):
+                bus.connect_device(dma, f"DMA{index}", dma.get_range(0xF00 + 8 * index), "slave", verbose=False)
+            bus.set_priority(["DMA1", "CPU", "DMA0"])
+            bus.set_policy(policy)
+            port = bus.get_port("CPU")
+            # Cada DMA copia 32 palabras (4 ráfagas de 16 ciclos)
+            for index, dma in enumerate(dmas):
+                base = 0xF00 + 8 * index
+                for register, value in ((0, 0x100), (1, 0x400 + 0x100 * index), (2, 32), (4, 1)):
+                    bus.write_word(base + register, value)
+            return bus, port, dmas
+        
+        # Prioridad fija: DMA1 supera a la CPU y termina; DMA0 roba una ráfaga por acceso
+        bus, port, dmas = build('priority')
+        port.read(0)
+        stats = bus.get_master_stats()
+        print(bus.format_master_stats())
+        if dmas[1].is_busy() or dmas[0].bursts != 1 or stats['DMA1']['grants'] != 4:
+            print("✗ ERROR: la prioridad fija no se respetó")
+            return False
+        if stats['CPU']['wait_cycles'] != 64 + 16 or stats['DMA0']['max_latency'] < 64:
+            print("✗ ERROR: ciclos de espera o latencia incorrectos")
+            return False
+        while dmas[0].is_busy():
+            port.read(0)
+        stats = bus.get_master_stats()
+        if sum(entry['busy_cycles'] for entry in stats.values()) != bus.clock_cycles:
+            print("✗ ERROR: los ciclos de uso no suman los ciclos del bus")
+            return False
+        
+        # Round-robin: una ráfaga por turno, nadie termina de golpe
+        bus, port, dmas = build('round_robin')
+        port.read(0)
+        if [dma.bursts for dma in dmas] != [1, 1]:
+            print(f"✗ ERROR: round-robin dio ráfagas {[dma.bursts for dma in dmas]}")
+            return False
+        
+        # Un maestro al que se le niega el bus espera al dueño en vez de leer 0
+        bus, port, dmas = build('priority')
+        bus.write_word(0x10, 0x1234)
+        bus._request_bus("DMA0")
+        value = bus.read_word(0x10, "HOST")
+        if value != 0x1234 or dmas[0].is_busy() or bus.current_master is not None:
+            print("✗ ERROR: el maestro en espera no obtuvo el bus tras la transferencia del dueño")
+            return False
+        bus._request_bus("PROBE")
+        try:
+            bus.read_word(0x10, "HOST")
+            print("✗ ERROR: se esperaba un error con el bus retenido sin transferencias")
+            return False
+        except ValueError as e:
+            print(f"Bus retenido sin transferencias: {e}")
+        bus._release_bus("PROBE")
+        if bus.get_pending() or bus.read_word(0x10, "HOST") != 0x1234:
+            print("✗ ERROR: la cola de pendientes quedó inconsistente")
+            return False
+        
+        # La espera en la cola se cuenta una sola vez: los ciclos de espera son los que avanzó el reloj
+        bus = SystemBus()
+        bus.connect_device(RAM(4), "RAM", (0, 0xFFF), "slave", verbose=False)
+        bus.set_priority(["DMA", "CPU"])
+        bus._request_bus("DMA")
+        bursts = [3]
+        
+        def service():
+            bursts[0] -= 1
+            return 4, bursts[0] == 0
+        
+        bus.request("DMA", service)
+        start = bus.clock_cycles
+        bus.read_word(5, "CPU")
+        cpu_stats = bus.get_master_stats()['CPU']
+        print(f"CPU en espera de 3 ráfagas: {bus.clock_cycles - start} ciclos, {cpu_stats}")
+        if cpu_stats['wait_cycles'] != 12 or cpu_stats['max_latency'] != 12 or bus.clock_cycles - start != 13:
+            print("✗ ERROR: ciclos de espera en la cola contados dos veces")
+            return False
+        
+        print("✓ Arbitraje del bus: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Arbitraje del bus: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_cache_hierarchy():
+    """Prueba la jerarquía de caché: organización, reemplazo, escritura y estadísticas por PC"""
+    print("=== Prueba de jerarquía de caché ===")
+    try:
+        import contextlib
+        import io
+        import json
+        from Business.Memory.Cache import Cache
+        from Business.Computer_System import System
+        
+        class Recorder:
+            """Nivel siguiente que solo registra el tráfico"""
+            def __init__(self):
+                self.traffic = []
+            def fill(self, address, words, pc=0):
+                self.traffic.append(('fill', address))
+            def write_back(self, address, words, pc=0):
+                self.traffic.append(('write_back', address))
+            def write_through(self, address, pc=0):
+                self.traffic.append(('write_through', address))
+        
+        def run(cache, addresses, write=False):
+            cache.next_level = Recorder()
+            for address in addresses:
+                cache.access(address, write)
+            return cache
+        
+        # Directa: 0 y 16 caen en el mismo conjunto y se desalojan; con 2 vías conviven
+        direct = run(Cache(size=16, block_size=4, associativity=1), [0, 16, 0, 16])
+        two_way = run(Cache(size=16, block_size=4, associativity=2), [0, 16, 0, 16])
+        print(f"Directa: {direct.get_stats()}\n2 vías: {two_way.get_stats()}")
+        if (direct.hits, direct.evictions, two_way.hits, two_way.evictions) != (0, 3, 2, 0):
+            print("✗ ERROR: organización directa/asociativa incorrecta")
+            return False
+        
+        # Un conjunto de 2 vías: A B A C A -> LRU conserva A, FIFO la desaloja
+        sequence = [0, 4, 0, 8, 0]
+        lru = run(Cache(size=8, block_size=4, associativity=2, replacement='lru'), sequence)
+        fifo = run(Cache(size=8, block_size=4, associativity=2, replacement='fifo'), sequence)
+        rand = run(Cache(size=8, block_size=4, associativity=2, replacement='random', seed=1), sequence)
+        print(f"Aciertos LRU={lru.hits}, FIFO={fifo.hits}, aleatorio={rand.hits}")
+        if lru.hits != 2 or fifo.hits != 1 or rand.hits + rand.misses != 5:
+            print("✗ ERROR: política de reemplazo incorrecta")
+            return False
+        
+        # Write-back escribe el bloque al desalojarlo; write-through cada palabra, sin asignar
+        back = run(Cache(size=16, block_size=4, write_policy='write_back'), [0, 1, 16], write=True)
+        through = run(Cache(size=16, block_size=4, write_policy='write_through'), [0, 1, 16], write=True)
+        print(f"Write-back: {back.next_level.traffic}\nWrite-through: {through.next_level.traffic}")
+        if back.next_level.traffic != [('fill', 0), ('write_back', 0), ('fill', 16)] or back.writebacks != 1:
+            print("✗ ERROR: write-back incorrecto")
+            return False
+        if through.next_level.traffic != [('write_through', 0), ('write_through', 1), ('write_through', 16)]:
+            print("✗ ERROR: write-through incorrecto")
+            return False
+        
+        # Sistema completo con la configuración de Data/Configs: mismo resultado, menos tráfico en el bus
+        project_root = Path(__file__).parent
+        config = json.loads((project_root / "Data" / "Configs" / "default.json").read_text())
+        config['cache']['enabled'] = True
+        program = project_root / "Data" / "Benchmarks" / "MemoryStream.json"
+        results = {}
+        for engine in ('functional', 'gate', 'micro'):
+            for cached in (False, True):
+                system = System({**config, 'trace_sink': 'null', 'cpu_engine': engine,
+                                 'cache': config['cache'] if cached else None})
+                with contextlib.redirect_stdout(io.StringIO()):
+                    system.assemble(verbose=False)
+                    system.load_program_from_json(str(program), verbose=False)
+                system.cpu.run_program(start_address=0, max_cycles=2000)
+                results[(engine, cached)] = (list(system.ram.read_block(0, system.ram.size)),
+                                             system.system_bus.clock_cycles, system.cpu.cache)
+            memory, plain_cycles, _ = results[(engine, False)]
+            cached_memory, cached_cycles, hierarchy = results[(engine, True)]
+            stats = hierarchy.get_stats()
+            print(f"{engine}: bus {plain_cycles} -> {cached_cycles} ciclos, L1I {stats['L1I']['hit_rate']}, "
+                  f"L1D {stats['L1D']['hit_rate']}, L2 {stats['L2']['hit_rate']}")
+            if memory != cached_memory or cached_cycles >= plain_cycles:
+                print(f"✗ ERROR: la caché cambió el resultado o no redujo el tráfico ({engine})")
+                return False
+            pcs = hierarchy.get_pc_stats('L1D')['L1D']
+            if hierarchy.icache is hierarchy.dcache or not pcs or sum(e['hits'] + e['misses'] for e in pcs.values()) \
+                    != stats['L1D']['accesses']:
+                print("✗ ERROR: estadísticas por PC incompletas")
+                return False
+        
+        # La caché se invalida en cada ejecución
+        system.cpu.run_program(start_address=0, max_cycles=2000)
+        if system.cpu.cache.get_stats() != hierarchy.get_stats():
+            print("✗ ERROR: las estadísticas no son por ejecución")
+            return False
+        
+        print("✓ Jerarquía de caché: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Jerarquía de caché: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_alu():
     """Prueba la ALU"""
     print("=== Prueba de ALU ===")
@@ -470,6 +1055,871 @@ def test_full_program_execution():
         traceback.print_exc()
         return False
 
+def test_trace_sinks():
+    """Sinks de traza: un sink deshabilitado no formatea ni emite; Buffered_Sink conserva el orden"""
+    print("=== Prueba de Sinks de Traza ===")
+    try:
+        import io
+        import contextlib
+        from Business.Basic_Components.Bus import Bus
+        from Business.Basic_Components.Record import Record
+        from Business.CPU_Core.CPU import CPU
+        from Business.CPU_Core.Trace_Sink import Trace_Sink, Null_Sink, Console_Sink, Buffered_Sink, create_trace_sink
+        from Business.Memory.SystemBus import SystemBus
+        from Business.Memory.RAM import RAM
+        
+        class Counting_Sink(Trace_Sink):
+            """Cuenta las llamadas a emit; enabled se fija al crearlo"""
+            def __init__(self, enabled):
+                self.enabled = enabled
+                self.emitted = 0
+            
+            def emit(self, source, message):
+                self.emitted += 1
+        
+        # Trace_Sink es abstracta: sin emit no se puede instanciar
+        try:
+            Trace_Sink()
+            print("ERROR: Trace_Sink sin emit debería ser abstracta")
+            return False
+        except TypeError:
+            pass
+        
+        # Los mensajes se formatean con get_Hexadecimal_value/get_Hex_Value: se cuentan sus llamadas
+        formatted = [0]
+        originals = (Bus.get_Hexadecimal_value, Record.get_Hex_Value)
+        
+        def counted(method):
+            def wrapper(self):
+                formatted[0] += 1
+                return method(self)
+            return wrapper
+        
+        program = [0x1100, 0x3101, 0x2102, 0x8005, 0x7000, 0xF000]
+        
+        def run(engine, sink):
+            with contextlib.redirect_stdout(io.StringIO()):
+                sysbus = SystemBus(data_width=16, addr_width=12)
+                ram = RAM(4)
+                sysbus.connect_device(ram, "RAM", (0, 4095), "slave")
+                cpu = CPU(sysbus, engine=engine, trace=sink)
+                cpu.connect_memory(ram)
+                cpu.load_program(program, 0x0000)
+                ram.write_direct(0x100, 0xFFFE)
+                ram.write_direct(0x101, 2)
+            formatted[0] = 0
+            Bus.get_Hexadecimal_value = counted(originals[0])
+            Record.get_Hex_Value = counted(originals[1])
+            try:
+                cpu.run_program(start_address=0, max_cycles=200)
+            finally:
+                Bus.get_Hexadecimal_value, Record.get_Hex_Value = originals
+            return formatted[0]
+        
+        for engine in ('functional', 'gate', 'micro'):
+            disabled, enabled = Counting_Sink(False), Counting_Sink(True)
+            quiet_formats = run(engine, disabled)
+            traced_formats = run(engine, enabled)
+            print(f"{engine}: deshabilitado {disabled.emitted} líneas/{quiet_formats} formatos, "
+                  f"habilitado {enabled.emitted} líneas/{traced_formats} formatos")
+            if disabled.emitted or quiet_formats or not enabled.emitted or not traced_formats:
+                print("✗ ERROR: el sink deshabilitado recibió o formateó mensajes")
+                return False
+        
+        # Null_Sink es el sink por defecto y está deshabilitado
+        if Null_Sink.enabled or not isinstance(create_trace_sink('null'), Null_Sink):
+            print("✗ ERROR: el sink nulo no está deshabilitado por defecto")
+            return False
+        
+        # Buffered_Sink: orden de llegada, filtro por fuente y buffer circular
+        sink = Buffered_Sink()
+        run('gate', sink)
+        lines = sink.get_lines()
+        cycles = [line for line in lines if line.startswith("CPU: Ciclo ")]
+        print(f"Buffered_Sink: {len(sink)} líneas, última: {lines[-1]!r}")
+        if (not lines[0].startswith("CPU: Programa cargado") or lines[-1] != "Ciclos: 5, Instrucciones: 5"
+                or cycles != [f"CPU: Ciclo {n} completado. PC=0x{pc:04X}" for n, pc in enumerate((1, 2, 3, 5, 6), 1)]):
+            print("✗ ERROR: Buffered_Sink no conservó la traza")
+            return False
+        if sink.get_lines("UC") != [line for line in lines if line.startswith("UC:")]:
+            print("✗ ERROR: filtro por fuente incorrecto")
+            return False
+        ring = Buffered_Sink(max_lines=3)
+        for index in range(5):
+            ring.emit("CPU", f"línea {index}")
+        ring.flush()
+        out = io.StringIO()
+        ring.dump(out)
+        if ring.get_lines() != ["línea 2", "línea 3", "línea 4"] or out.getvalue() != "línea 2\nlínea 3\nlínea 4\n":
+            print("✗ ERROR: el buffer circular no conservó las últimas líneas en orden")
+            return False
+        
+        # Console_Sink escribe cada línea en su stream
+        out = io.StringIO()
+        console = Console_Sink(out)
+        console.emit("CPU", "uno")
+        console.emit("UC", "dos")
+        console.flush()
+        if out.getvalue() != "uno\ndos\n":
+            print("✗ ERROR: Console_Sink no escribió las líneas en orden")
+            return False
+        
+        print("✓ Sinks de traza: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Sinks de traza: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_custom_instructions():
+    """register_instruction: handlers propios en los tres motores y caché de decodificación"""
+    print("=== Prueba de Instrucciones Personalizadas ===")
+    try:
+        import io
+        import contextlib
+        from Business.Basic_Components.Bus import Bus
+        from Business.CPU_Core.CPU import CPU
+        from Business.Memory.SystemBus import SystemBus
+        from Business.Memory.RAM import RAM
+        
+        # LOADI 5, dos veces el opcode 0x0 (NOP en el ISA), STORE 0x100, HALT
+        program = [0x9005, 0x0003, 0x0004, 0x2100, 0xF000]
+        
+        def build(engine):
+            with contextlib.redirect_stdout(io.StringIO()):
+                sysbus = SystemBus(data_width=16, addr_width=12)
+                ram = RAM(4)
+                sysbus.connect_device(ram, "RAM", (0, 4095), "slave")
+                cpu = CPU(sysbus, engine=engine)
+                cpu.connect_memory(ram)
+                cpu.load_program(program, 0x0000)
+            return cpu, ram
+        
+        for engine in ('functional', 'gate', 'micro'):
+            cpu, ram = build(engine)
+            calls = []
+            
+            def inc(operand, cpu=cpu, calls=calls):
+                """INC: AC += operando"""
+                calls.append(operand)
+                cpu.registers.set_AC(Bus(16, (cpu.registers.get_AC().get_Dec_Value() + operand) & 0xFFFF))
+            
+            # Primero con el NOP del ISA (llena la caché de decodificación), luego con INC
+            cpu.run_program(start_address=0, max_cycles=500)
+            builtin = ram.read_word(0x100)
+            cpu.register_instruction(0x0, "INC", inc)
+            cpu.run_program(start_address=0, max_cycles=500)      # run_program resetea: INC se mantiene
+            custom = ram.read_word(0x100)
+            mnemonic = cpu._get_mnemonic(0x0)
+            cpu.unregister_instruction(0x0)
+            cpu.run_program(start_address=0, max_cycles=500)
+            restored = ram.read_word(0x100)
+            print(f"{engine}: NOP -> {builtin}, INC -> {custom} (llamadas {calls}), otra vez NOP -> {restored}")
+            if (builtin, custom, restored) != (5, 12, 5) or calls != [3, 4] or mnemonic != "INC" \
+                    or cpu._get_mnemonic(0x0) != "NOP":
+                print(f"✗ ERROR: el motor {engine} no usó el handler registrado")
+                return False
+        
+        # Opcode fuera de rango y handler no invocable
+        cpu, _ = build('functional')
+        for opcode, handler, expected in ((0x10, inc, ValueError), (-1, inc, ValueError), (0x0, 42, TypeError)):
+            try:
+                cpu.register_instruction(opcode, "MAL", handler)
+                print(f"ERROR: register_instruction(0x{opcode & 0xFF:X}, {handler!r}) debería fallar")
+                return False
+            except expected as e:
+                print(f"✓ Correcto - {type(e).__name__}: {e}")
+        
+        print("✓ Instrucciones personalizadas: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Instrucciones personalizadas: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_engine_parity():
+    """Compara el motor funcional contra el motor de compuertas"""
+    print("=== Prueba de Paridad de Motores ===")
+    try:
+        import random
+        import io
+        import contextlib
+        from Business.CPU_Core.Arithmetic_Logical_Unit.ALU import ALU
+        from Business.CPU_Core.Arithmetic_Logical_Unit.Functional_ALU import Functional_ALU
+        from Business.CPU_Core.CPU import CPU
+        from Business.Memory.SystemBus import SystemBus
+        from Business.Memory.RAM import RAM
+        
+        # 1. ALU: todas las combinaciones ALUop/ModoFunción con operandos de borde y aleatorios
+        # Referencia: recorrido de compuertas evaluando todas las unidades (como el hardware)
+        gate_alu = ALU(compiled=False, lazy=False)
+        event_alu = ALU(incremental=True)
+        candidates = {
+            'funcional': Functional_ALU(),
+            'perezosa': ALU(compiled=False),
+            'netlist': ALU(),
+            'eventos': event_alu,
+        }
+        rng = random.Random(1234)
+        operands = [0x0000, 0x0001, 0x7FFF, 0x8000, 0xFFFF, 0x00FF, 0xFF00, 0xAAAA, 0x5555]
+        operands += [rng.randrange(0x10000) for _ in range(6)]
+        
+        def flags(alu):
+            return (alu.get_carry_out().get_value(),
+                    alu.get_zero_flag().get_value(),
+                    alu.get_negative_flag().get_value())
+        
+        mismatches = 0
+        checked = 0
+        for aluop in range(4):
+            for mode in range(8):
+                for a in operands:
+                    for b in operands:
+                        expected = gate_alu.execute_with_signals(a, b, aluop, mode)
+                        gate_flags = flags(gate_alu)
+                        checked += 1
+                        for name, alu in candidates.items():
+                            obtained = alu.execute_with_signals(a, b, aluop, mode)
+                            if expected != obtained or gate_flags != flags(alu):
+                                mismatches += 1
+                                if mismatches <= 5:
+                                    print(f"  Diferencia ALUop={aluop:02b} Modo={mode:03b} A=0x{a:04X} B=0x{b:04X}: "
+                                          f"compuertas=0x{expected:04X}{gate_flags} {name}=0x{obtained:04X}{flags(alu)}")
+        print(f"ALU: {checked} casos comparados contra {len(candidates)} implementaciones, {mismatches} diferencias")
+        stats = event_alu.get_event_stats()
+        print(f"ALU por eventos: {stats['evaluations']} compuertas evaluadas en {stats['updates']} operaciones")
+        
+        # Caché LRU de resultados: operandos repetidos (contador, máscaras, constantes)
+        cached_alu = ALU(compiled=False, cache_size=16)
+        reference_alu = Functional_ALU()
+        for step in range(400):
+            # 12 combinaciones repetidas y luego operandos nuevos que fuerzan desalojos
+            a, b = (step % 4 if step < 300 else step), (1, 0x00FF, 0x8000)[step % 3]
+            aluop, mode = ((0, 0), (0, 1), (1, 0), (2, 1))[step % 4]
+            if (cached_alu.execute_with_signals(a, b, aluop, mode) != reference_alu.execute_with_signals(a, b, aluop, mode)
+                    or flags(cached_alu) != flags(reference_alu)):
+                mismatches += 1
+        stats = cached_alu.get_cache_stats()
+        print(f"ALU con caché: {stats['hits']} aciertos, {stats['misses']} fallos, {stats['evictions']} desalojos")
+        if stats['size'] > 16 or stats['hits'] == 0 or stats['evictions'] == 0:
+            mismatches += 1
+        
+        # 2. CPU: un programa por opcode, ejecutado con ambos motores
+        data = {0x100: 0x0005, 0x101: 0x0003, 0x102: 0xFFFF, 0x103: 0x8001, 0x104: 0x0000}
+        programs = {
+            "NOP":   [0x9005, 0x0000, 0xF000],
+            "LOAD":  [0x1100, 0xF000],
+            "STORE": [0x9007, 0x2104, 0xF000],
+            "ADD":   [0x1102, 0x3101, 0xF000],
+            "SUB":   [0x1101, 0x4100, 0xF000],
+            "MULT":  [0x1102, 0x5102, 0xF000],
+            "DIV":   [0x1102, 0x6100, 0x1100, 0x6104, 0xF000],
+            "JUMP":  [0x7002, 0x9001, 0xF000],
+            "JZ":    [0x1101, 0x4101, 0x8004, 0x9001, 0xF000],
+            "LOADI": [0x9FFF, 0xF000],
+            "AND":   [0x1103, 0xA102, 0xF000],
+            "OR":    [0x1103, 0xB101, 0xF000],
+            "XOR":   [0x1103, 0xC102, 0xF000],
+            "SHL":   [0x1103, 0xD003, 0xF000],
+            "SHR":   [0x1103, 0xE00F, 0xF000],
+        }
+        
+        def run_on(engine, program, max_cycles=50):
+            with contextlib.redirect_stdout(io.StringIO()):
+                sysbus = SystemBus(data_width=16, addr_width=12)
+                ram = RAM(4)
+                sysbus.connect_device(ram, "RAM", (0, 4095), "slave")
+                cpu = CPU(sysbus, engine=engine)
+                cpu.connect_memory(ram)
+                cpu.load_program(program, 0x0000)
+                for address, value in data.items():
+                    ram.write_direct(address, value)
+                cpu.run_program(start_address=0, max_cycles=max_cycles)
+            return cpu.get_status(), ram.read_block(0, 0x110).tolist()
+        
+        # El motor microprogramado cuenta micro-ciclos y MULT/DIV pasan por MAR/MDR:
+        # se comparan los registros visibles por el programa
+        architectural = ('running', 'instructions', 'pc', 'ir', 'ac', 'hi', 'lo', 'op_type', 'status', 'flags')
+        
+        cpu_mismatches = 0
+        for name, program in programs.items():
+            expected = run_on('functional', program)
+            if run_on('gate', program) != expected:
+                cpu_mismatches += 1
+                print(f"  Diferencia en programa {name}")
+            micro_status, micro_memory = run_on('micro', program, max_cycles=500)
+            if ({key: micro_status[key] for key in architectural} != {key: expected[0][key] for key in architectural}
+                    or micro_memory != expected[1]):
+                cpu_mismatches += 1
+                print(f"  Diferencia en programa {name} (motor micro)")
+        print(f"CPU: {len(programs)} programas comparados en 3 motores, {cpu_mismatches} diferencias")
+        
+        # Motor inválido
+        try:
+            CPU(SystemBus(data_width=16, addr_width=12), engine='turbo')
+            print("ERROR: Debería haber lanzado ValueError")
+            return False
+        except ValueError as e:
+            print(f"✓ Correcto - Motor inválido detectado: {e}")
+        
+        if mismatches or cpu_mismatches:
+            print("✗ Paridad de motores: DIFERENCIAS ENCONTRADAS\n")
+            return False
+        
+        print("✓ Paridad de motores: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Paridad de motores: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_block_cache():
+    """Caché de bloques: código automodificable, escrituras externas y paridad sin caché"""
+    print("=== Prueba de la Caché de Bloques ===")
+    try:
+        import random
+        import io
+        import contextlib
+        from Business.CPU_Core.CPU import CPU
+        from Business.Memory.SystemBus import SystemBus
+        from Business.Memory.RAM import RAM
+        from Business.Computer_System import System
+        
+        def build(program, data, block_cache=True):
+            with contextlib.redirect_stdout(io.StringIO()):
+                sysbus = SystemBus(data_width=16, addr_width=12)
+                ram = RAM(4)
+                sysbus.connect_device(ram, "RAM", (0, 4095), "slave")
+                cpu = CPU(sysbus, block_cache=block_cache)
+                cpu.connect_memory(ram)
+                cpu.load_program(program, 0x0000)
+            for address, value in data.items():
+                ram.write_direct(address, value)
+            return cpu, ram
+        
+        # 1. STORE dentro de un bloque traducido: la segunda vuelta ejecuta LOADI 7 en vez de LOADI 5
+        program = [0x1030, 0x800A, 0x4032, 0x2030, 0x9005, 0x2031, 0x1033, 0x2004, 0x7000, 0xF000, 0xF000]
+        data = {0x30: 2, 0x32: 1, 0x33: 0x9007}
+        results = []
+        for block_cache in (True, False):
+            cpu, ram = build(program, data, block_cache)
+            cpu.run_program(start_address=0, max_cycles=200)
+            results.append((cpu.get_status(), ram.read_block(0, 0x40).tolist()))
+        cpu, ram = build(program, data)
+        cpu.run_program(start_address=0, max_cycles=200)
+        stats = cpu.block_cache.get_stats()
+        print(f"STORE automodificable: mem[0x31]={ram.read_word(0x31)}, {stats}")
+        if results[0] != results[1] or ram.read_word(0x31) != 7 or stats['invalidations'] == 0:
+            print("✗ ERROR: el bloque modificado por STORE no se volvió a traducir")
+            return False
+        
+        # 2. write_direct desde fuera (host/DMA) sobre un bloque que ya se ejecutó varias veces
+        program = [0x1030, 0x8008, 0x4032, 0x2030, 0x9005, 0x2031, 0x7000, 0xF000, 0xF000]
+        cpu, ram = build(program, {0x30: 20, 0x32: 1})
+        cpu.run_program(start_address=0, max_cycles=30)
+        before = cpu.block_cache.get_stats()
+        ram.write_direct(0x04, 0x9007)
+        cpu.resume(max_cycles=500)
+        stats = cpu.block_cache.get_stats()
+        print(f"write_direct externo: mem[0x31]={ram.read_word(0x31)}, invalidaciones {before['invalidations']} -> "
+              f"{stats['invalidations']}, aciertos previos {before['hits']}")
+        if (before['hits'] == 0 or ram.read_word(0x31) != 7 or stats['invalidations'] <= before['invalidations']
+                or cpu.running.get_value()):
+            print("✗ ERROR: la escritura externa no invalidó el bloque")
+            return False
+        
+        # 3. Paridad con y sin caché sobre Data/Programs
+        programs_dir = Path(__file__).parent / "Data" / "Programs"
+        compared = 0
+        for path in sorted(programs_dir.glob("*.json")):
+            runs = []
+            for block_cache in (True, False):
+                system = System({'trace_sink': 'null', 'block_cache': block_cache, 'io_devices': True})
+                with contextlib.redirect_stdout(io.StringIO()):
+                    system.assemble(verbose=False)
+                    loaded = system.load_program_from_json(str(path), verbose=False)
+                if not loaded:
+                    break
+                system.console.sink = lambda text: None
+                system.keyboard.feed("Hola\n")
+                system.cpu.run_program(start_address=system.current_program['entry_point'], max_cycles=2000)
+                runs.append((system.cpu.get_status(), system.ram.read_block(0, system.ram.size).tolist(),
+                             system.console.get_output()))
+            if not runs:
+                continue
+            compared += 1
+            if runs[0] != runs[1]:
+                print(f"✗ ERROR: {path.name} difiere con y sin caché de bloques")
+                return False
+        print(f"Paridad con/sin caché de bloques: {compared} programas")
+        if not compared:
+            print("✗ ERROR: no se comparó ningún programa")
+            return False
+
+        # 4. Programas aleatorios que escriben sobre su propio código (STORE y saltos en 0x00-0x1F)
+        rng = random.Random(2024)
+        opcodes = (0x0, 0x1, 0x2, 0x2, 0x3, 0x4, 0x5, 0x6, 0x7, 0x8, 0x9, 0xA, 0xB, 0xC, 0xD, 0xE)
+        differences = 0
+        for case in range(300):
+            program = [(rng.choice(opcodes) << 12) | rng.randrange(0x40) for _ in range(0x1F)] + [0xF000]
+            data = {address: rng.randrange(0x10000) for address in range(0x20, 0x40)}
+            runs = []
+            for block_cache in (True, False):
+                cpu, ram = build(program, data, block_cache)
+                cpu.run_program(start_address=0, max_cycles=150)
+                runs.append((cpu.get_status(), ram.read_block(0, 0x40).tolist()))
+            if runs[0] != runs[1]:
+                differences += 1
+        print(f"Programas aleatorios automodificables: 300 casos, {differences} diferencias")
+        if differences:
+            print("✗ ERROR: la caché de bloques cambió el resultado de programas aleatorios")
+            return False
+        
+        print("✓ Caché de bloques: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Caché de bloques: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_batch_runner():
+    """Batch_Runner con 1 y 2 procesos contra ejecuciones directas de System"""
+    print("=== Prueba del Batch Runner ===")
+    try:
+        import contextlib
+        import io
+        from Business.Batch_Runner import Batch_Runner, memory_digest
+        from Business.Computer_System import System
+        
+        programs_dir = Path(__file__).parent / "Data" / "Programs"
+        programs = [programs_dir / f"{name}.json" for name in ("Mult", "Div", "FlagTest", "LogicOpsTest", "RegisterTest")]
+        # Mismo programa con otros datos iniciales: LOADI n en la dirección 0 cambia el operando A
+        data_sets = [{'name': f"A={n}", 'data': {0: 0x9000 | n}} for n in (3, 9, 12)]
+        jobs = (Batch_Runner.jobs_from_programs(programs, max_cycles=2000) +
+                Batch_Runner.jobs_from_data_sets(str(programs[0]), data_sets, max_cycles=2000))
+        
+        serial = Batch_Runner(workers=1).run(jobs)
+        parallel_runner = Batch_Runner(workers=2, chunksize=1)
+        parallel = parallel_runner.run(jobs)
+        streamed = list(parallel_runner.stream(jobs))
+        print(f"{len(jobs)} trabajos: " + ", ".join(f"{r['name']}={r['registers']['ac'] if r['success'] else r['error']}"
+                                                   for r in serial))
+        
+        if [r['job'] for r in serial] != list(range(len(jobs))) or serial != parallel:
+            print("✗ ERROR: los resultados con 1 y 2 procesos difieren")
+            return False
+        if sorted(r['job'] for r in streamed) != list(range(len(jobs))) or \
+                sorted(streamed, key=lambda r: r['job']) != parallel:
+            print("✗ ERROR: el stream no entregó el conjunto completo de resultados")
+            return False
+        
+        # Los digests coinciden con una ejecución directa en System
+        for job, result in zip(jobs, serial):
+            with contextlib.redirect_stdout(io.StringIO()):
+                system = System({'trace_sink': 'null'})
+                system.assemble(verbose=False)
+                system.load_program_from_json(job.program, verbose=False)
+            for address, value in job.data.items():
+                system.ram.write_direct(address, value)
+            system.cpu.run_program(start_address=system.current_program['entry_point'], max_cycles=job.max_cycles)
+            if not result['success'] or result['memory_digest'] != memory_digest(system.ram.read_block(0, system.ram.size)) \
+                    or result['cycles'] != system.cpu.clock_cycle:
+                print(f"✗ ERROR: el resultado de {result['name']} no coincide con System")
+                return False
+        if len({result['memory_digest'] for result in serial[-3:]}) != 3:
+            print("✗ ERROR: los conjuntos de datos no cambiaron el resultado")
+            return False
+        
+        print("✓ Batch Runner: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Batch Runner: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_vector_cpu():
+    """Compara VectorCPU (K máquinas en lockstep) contra CPU.run_program máquina por máquina"""
+    print("=== Prueba de VectorCPU ===")
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy no está instalado: prueba omitida\n")
+        return True
+    try:
+        import random
+        import io
+        import contextlib
+        from Business.CPU_Core.CPU import CPU
+        from Business.CPU_Core.VectorCPU import VectorCPU
+        from Business.Memory.RAM import RAM
+        
+        # Programas aleatorios (PCs divergentes, saltos, DIV por cero, direcciones fuera de rango)
+        rng = random.Random(4321)
+        count = 64
+        vcpu = VectorCPU(count)
+        images = []
+        for machine in range(count):
+            length = rng.randint(1, 32)
+            image = [0] * 64
+            for address in range(length):
+                opcode = rng.randrange(16)
+                if opcode in (0x7, 0x8):
+                    operand = rng.randint(0, length + 1)
+                elif opcode in (0xD, 0xE):
+                    operand = rng.randrange(16)
+                else:
+                    operand = rng.choice([rng.randrange(64), rng.randrange(0x1000)])
+                image[address] = (opcode << 12) | operand
+            for address in range(length, 64):
+                image[address] = rng.choice([0x0000, 0x0001, 0x8000, 0xFFFF, rng.randrange(0x10000)])
+            images.append(image)
+            vcpu.ram[machine, :64] = image
+        
+        mismatches = 0
+        for max_cycles in (5, 200):
+            vcpu.ram[:, 64:] = 0
+            for machine in range(count):
+                vcpu.ram[machine, :64] = images[machine]
+            vcpu.run_program(start_address=0, max_cycles=max_cycles)
+            for machine, image in enumerate(images):
+                ram = RAM(4)
+                cpu = CPU(None)
+                cpu.connect_memory(ram)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    cpu.load_program(image, 0x0000)
+                    cpu.run_program(start_address=0, max_cycles=max_cycles)
+                if (cpu.get_status() != vcpu.get_status(machine)
+                        or ram.read_block(0, ram.size).tolist() != vcpu.get_memory(machine).tolist()):
+                    mismatches += 1
+                    if mismatches <= 5:
+                        print(f"  Diferencia en máquina {machine} (max_cycles={max_cycles})")
+        print(f"VectorCPU: {count} máquinas x 2 límites de ciclos, {mismatches} diferencias")
+        
+        # Mismo programa, un dato distinto por máquina
+        vcpu = VectorCPU(4)
+        vcpu.load_program([0x1100, 0x3100, 0x2101, 0xF000])
+        vcpu.write_word(0x100, [1, 2, 0x7FFF, 0xFFFF])
+        vcpu.run_program(start_address=0, max_cycles=10)
+        doubled = vcpu.read_word(0x101).tolist()
+        print(f"Duplicar por máquina: {doubled}")
+        if doubled != [2, 4, 0xFFFE, 0xFFFE]:
+            mismatches += 1
+        
+        if mismatches:
+            print("✗ VectorCPU: DIFERENCIAS ENCONTRADAS\n")
+            return False
+        
+        print("✓ VectorCPU: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ VectorCPU: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_snapshot_restore():
+    """Snapshot/restore del System completo con RAM copia en escritura"""
+    print("=== Prueba de Snapshot/Restore ===")
+    try:
+        import io
+        import contextlib
+        from Business.Computer_System import System
+        
+        # Cuenta regresiva: mem[0x102] -= 1 y mem[0x100] += 1 hasta llegar a 0
+        program = [0x9000, 0x2100, 0x1100, 0x3101, 0x2100, 0x1102, 0x4103, 0x2102, 0x800A, 0x7002, 0xF000]
+        
+        def build(counter):
+            with contextlib.redirect_stdout(io.StringIO()):
+                system = System({'trace_sink': 'null'})
+                system.assemble(verbose=False)
+                system.cpu.load_program(program, 0x0000)
+            for address, value in ((0x101, 1), (0x103, 1), (0x102, counter)):
+                system.ram.write_direct(address, value)
+            return system
+        
+        def final_state(system):
+            return system.cpu.get_status(), system.ram.read_block(0, system.ram.size).tolist()
+        
+        # Referencia: ejecución completa sin interrupciones
+        reference = build(40)
+        reference.cpu.run_program(start_address=0, max_cycles=1000)
+        expected = final_state(reference)
+        
+        # Ejecución interrumpida en el ciclo 100, snapshot y varias continuaciones
+        system = build(40)
+        system.cpu.run_program(start_address=0, max_cycles=100)
+        snapshot = system.snapshot()
+        
+        errors = 0
+        for attempt in range(3):
+            system.restore(snapshot)
+            if system.cpu.clock_cycle != 100:
+                errors += 1
+            system.cpu.resume(max_cycles=1000)
+            if final_state(system) != expected:
+                errors += 1
+                print(f"  Diferencia en la continuación {attempt + 1}")
+        print(f"Continuaciones desde snapshot: 3, diferencias: {errors}")
+        
+        # Bifurcar escenarios: el mismo estado con otro contador
+        system.restore(snapshot)
+        system.ram.write_direct(0x102, 5)
+        system.cpu.resume(max_cycles=1000)
+        forked = system.ram.read_word(0x100)
+        print(f"Escenario bifurcado: contador final = {forked}")
+        
+        # Copia en escritura: un snapshot sin escrituras comparte todas las páginas
+        system.restore(snapshot)
+        first = system.snapshot()['ram']
+        system.ram.write_direct(0x0123, 0xBEEF)
+        second = system.snapshot()['ram']
+        shared = sum(1 for a, b in zip(first.pages, second.pages) if a is b)
+        print(f"Páginas compartidas entre snapshots: {shared}/{len(first.pages)}")
+        if shared != len(first.pages) - 1 or second.get_word(0x0123) != 0xBEEF or first.get_word(0x0123) == 0xBEEF:
+            errors += 1
+
+        # E/S: restaurar a mitad de la entrada del teclado repite las mismas lecturas
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = System({'io_devices': True, 'trace_sink': 'null'})
+            system.assemble(verbose=False)
+            system.load_program_from_json(str(Path(__file__).parent / "Data" / "Programs" / "KeyboardEcho.json"),
+                                          verbose=False)
+        system.console.sink = lambda text: None
+        system.keyboard.feed("Hola\n")
+        system.cpu.run_program(start_address=0, max_cycles=20)
+        snapshot = system.snapshot()
+        pending, shown = system.keyboard.pending(), system.display.get_value()
+        runs = []
+        for attempt in range(2):
+            if attempt:
+                system.restore(snapshot)
+                if (system.keyboard.pending(), system.display.get_value()) != (pending, shown):
+                    errors += 1
+            system.cpu.resume(max_cycles=1000)
+            runs.append((system.console.get_output(), system.display.get_value(), system.display.renders,
+                         system.ram.read_word(0x20), system.keyboard.pending()))
+        print(f"E/S desde snapshot (teclado con {pending} pendientes): {runs[1]}")
+        if runs[0] != runs[1] or runs[0][0] != "Hola\n":
+            errors += 1
+
+        system.keyboard.feed("ab")
+        keys = system.snapshot()
+        first_key = system.system_bus.read_word(0xFF1)
+        system.restore(keys)
+        if (first_key, system.system_bus.read_word(0xFF1), system.keyboard.pending()) != (0x61, 0x61, 1):
+            errors += 1
+            print("  El teclado no volvió al estado del snapshot")
+
+        if errors:
+            print("✗ Snapshot/Restore: DIFERENCIAS ENCONTRADAS\n")
+            return False
+        
+        print("✓ Snapshot/Restore: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Snapshot/Restore: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_bitsliced_verification():
+    """Netlist bitsliced de la ALU contra la referencia en bloques completos de vectores"""
+    print("=== Prueba de Verificación Bitsliced ===")
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy no está instalado: prueba omitida\n")
+        return True
+    try:
+        from Business.CPU_Core.Arithmetic_Logical_Unit.ALU_Verifier import ALU_Verifier
+        
+        # Todas las A con B = 0..15 (todos los desplazamientos) y B = 0xFFF0..0xFFFF
+        verifier = ALU_Verifier(chunk_bits=16)
+        mismatches = 0
+        vectors = 0
+        for aluop in range(4):
+            for mode in range(8):
+                for start in (0, 0xFFF0 << 16):
+                    report = verifier.verify(aluop, mode, start=start, count=16 << 16)
+                    vectors += report['vectors']
+                    if report['mismatches']:
+                        mismatches += report['mismatches']
+                        print(f"  Diferencia ALUop={aluop:02b} Modo={mode:03b}: {report['first_mismatch']}")
+        print(f"Bitsliced: {vectors} vectores comparados, {mismatches} diferencias")
+        
+        if mismatches:
+            print("✗ Verificación bitsliced: DIFERENCIAS ENCONTRADAS\n")
+            return False
+        
+        print("✓ Verificación bitsliced: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Verificación bitsliced: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_benchmark_suite():
+    """Programas sintéticos en los tres motores y comparación contra una línea base"""
+    print("=== Prueba de la Suite de Benchmarks ===")
+    try:
+        from Business.Benchmark import Benchmark_Suite, compare
+        
+        suite = Benchmark_Suite(repeat=1, measure_memory=False)
+        results = suite.run(micro=False)
+        errors = 0
+        for name, entry in results['programs'].items():
+            print(f"  {name}: {entry['instructions']} instrucciones, {entry['instructions_per_sec']:,} instr/s")
+            if entry['error'] is not None:
+                errors += 1
+                print(f"    ERROR: {entry['error']}")
+        
+        # Contra sí misma no hay regresiones; con una base el doble de rápida, todas lo son
+        faster = {'programs': {name: {**entry, 'ns_per_instruction': entry['ns_per_instruction'] / 2}
+                               for name, entry in results['programs'].items()}}
+        regressions = len(compare(results, faster))
+        print(f"Regresiones: {len(compare(results, results))} contra sí misma, {regressions} contra base 2x")
+        
+        if errors or compare(results, results) or regressions != len(results['programs']):
+            print("✗ Suite de benchmarks: DIFERENCIAS ENCONTRADAS\n")
+            return False
+        
+        print("✓ Suite de benchmarks: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Suite de benchmarks: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_execution_profiler():
+    """Perfil por PC, opcode, JZ y memoria idéntico en los tres motores"""
+    print("=== Prueba del Perfilador de Ejecución ===")
+    try:
+        import contextlib
+        import io
+        from Business.Computer_System import System
+        
+        program = project_root / "Data" / "Benchmarks" / "ShiftHeavy.json"
+        reports = {}
+        for engine in ('functional', 'gate', 'micro'):
+            with contextlib.redirect_stdout(io.StringIO()):
+                system = System({'cpu_engine': engine, 'trace_sink': 'null', 'profiler': True})
+                system.assemble(verbose=False)
+                system.load_program_from_json(str(program), verbose=False)
+            system.cpu.run_program(start_address=0, max_cycles=1_000_000)
+            reports[engine] = system.cpu.profiler.get_report()
+            print(f"  {engine}: {reports[engine]['instructions']} instrucciones, {reports[engine]['cycles']} ciclos")
+        
+        def counts(report):
+            return ({pc: (e['count'], e.get('taken'), e.get('not_taken')) for pc, e in report['pcs'].items()},
+                    report['memory'])
+        
+        reference = counts(reports['functional'])
+        differences = [engine for engine in ('gate', 'micro') if counts(reports[engine]) != reference]
+        jz = [entry for entry in reports['functional']['pcs'].values() if 'taken' in entry]
+        print(f"  JZ: {jz[0]['taken']} tomado / {jz[0]['not_taken']} no tomado")
+        print(system.get_profile_report(top=3))
+        
+        if differences or reports['micro']['cycles'] <= reports['micro']['instructions'] \
+                or (jz[0]['taken'], jz[0]['not_taken']) != (1, 1999):
+            print(f"✗ Perfilador: DIFERENCIAS ENCONTRADAS {differences}\n")
+            return False
+        
+        print("✓ Perfilador: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Perfilador: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_gate_activity():
+    """Evaluaciones y toggles por componente y por instrucción; sin costo al deshabilitar"""
+    print("=== Prueba de Actividad de Compuertas ===")
+    try:
+        from Business.Basic_Components.Gate_Activity import Gate_Activity
+        from Business.Basic_Components.Logic_Gates import AND_Gate, XOR_Gate
+        from Business.CPU_Core.Arithmetic_Logical_Unit.ALU import ALU
+        from Business.CPU_Core.CPU import CPU
+        from Business.Memory.RAM import RAM
+        from Business.Memory.SystemBus import SystemBus
+        
+        originals = (AND_Gate.calculate, XOR_Gate.calculate)
+        
+        # ADD 0x0FFF + 1: los 16 Full_Adder evalúan sus 5 compuertas
+        cpu = CPU(SystemBus(), engine='gate')
+        ram = RAM(4)
+        cpu.connect_memory(ram)
+        cpu.load_program([0x9FFF, 0x3010, 0xE001, 0xF000])  # LOADI, ADD [0x10], SHR 1, HALT
+        ram.write_direct(0x10, 1)
+        monitor = cpu.enable_gate_activity()
+        cpu.run_program(start_address=0, max_cycles=10)
+        print(monitor.format_report(top=4))
+        
+        contexts = monitor.get_context_stats()
+        adders = monitor.get_component_stats(context='ADD', merge_indices=True)['ALU.arithmetic_unit.FAs']
+        total = sum(entry['evaluations'] for entry in monitor.get_gate_stats())
+        ok = (set(contexts) == {'ADD', 'SHR'} and adders['gates'] == 80 and adders['evaluations'] == 80
+              and adders['toggles'] > 0 and cpu.registers.get_AC().get_Dec_Value() == 0x0800
+              and total == sum(entry['evaluations'] for entry in contexts.values()))
+        
+        cpu.disable_gate_activity()
+        restored = (AND_Gate.calculate, XOR_Gate.calculate) == originals and cpu.alu.is_compiled()
+        print(f"Calculate original restaurado: {restored}")
+        
+        # Con la caché de la ALU, un acierto no evalúa compuertas: el monitor la omite
+        counts = []
+        for cache_size in (0, 16):
+            alu = ALU(compiled=False, cache_size=cache_size)
+            alu.execute_with_signals(0x0FFF, 1, 0b00, 0b000)        # Llena la caché
+            with Gate_Activity() as activity:
+                activity.register(alu, "ALU")
+                alu.execute_with_signals(0x0FFF, 1, 0b00, 0b000)
+            counts.append(sum(entry['evaluations'] for entry in activity.get_gate_stats()))
+        hits = alu.get_cache_stats()['hits']
+        alu.execute_with_signals(0x0FFF, 1, 0b00, 0b000)
+        print(f"Evaluaciones sin/con caché de la ALU: {counts}, aciertos con el monitor {hits}, "
+              f"después {alu.get_cache_stats()['hits']}")
+        if counts[0] != counts[1] or not counts[0] or hits != 0 or alu.get_cache_stats()['hits'] != 1 \
+                or Gate_Activity.active_monitors:
+            ok = False
+        
+        # Monitores solapados y deshabilitados en desorden: cada uno cuenta lo suyo y al final
+        # las clases recuperan su calculate original
+        alu = ALU(compiled=False)
+        first, second = Gate_Activity(), Gate_Activity()
+        first.enable()
+        alu.execute_with_signals(0x0FFF, 1, 0b00, 0b000)
+        second.enable()
+        alu.execute_with_signals(0x0FFF, 1, 0b00, 0b000)
+        first.disable()
+        alu.execute_with_signals(0x0FFF, 1, 0b00, 0b000)
+        overlapped = Gate_Activity.active_monitors
+        second.disable()
+        evaluations = [sum(entry['evaluations'] for entry in monitor.get_gate_stats()) for monitor in (first, second)]
+        print(f"Monitores solapados: evaluaciones {evaluations}, activos tras el primero {overlapped}")
+        if (evaluations != [2 * counts[0], 2 * counts[0]] or overlapped != 1 or Gate_Activity.active_monitors
+                or (AND_Gate.calculate, XOR_Gate.calculate) != originals):
+            ok = False
+        
+        if not ok or not restored:
+            print("✗ Actividad de compuertas: DIFERENCIAS ENCONTRADAS\n")
+            return False
+        
+        print("✓ Actividad de compuertas: PRUEBA EXITOSA\n")
+        return True
+    except Exception as e:
+        print(f"✗ Actividad de compuertas: ERROR - {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def run_all_tests():
     """Ejecuta todas las pruebas"""
     print("=" * 60)
@@ -483,11 +1933,29 @@ def run_all_tests():
     results.append(("Bit", test_bit()))
     results.append(("Bus", test_bus()))
     results.append(("RAM", test_ram()))
+    results.append(("Paged RAM", test_paged_ram()))
     results.append(("SystemBus", test_system_bus()))
+    results.append(("Bus Decoding", test_bus_address_decoding()))
+    results.append(("Bus Routing", test_bus_routing()))
+    results.append(("I/O Devices", test_io_devices()))
+    results.append(("DMA Controller", test_dma_controller()))
+    results.append(("Bus Arbitration", test_bus_arbitration()))
+    results.append(("Cache Hierarchy", test_cache_hierarchy()))
     results.append(("ALU", test_alu()))
     results.append(("Control Unit", test_control_unit()))
     results.append(("CPU Integration", test_cpu_integration()))
     results.append(("Full Program", test_full_program_execution()))
+    results.append(("Trace Sinks", test_trace_sinks()))
+    results.append(("Custom Instructions", test_custom_instructions()))
+    results.append(("Engine Parity", test_engine_parity()))
+    results.append(("Block Cache", test_block_cache()))
+    results.append(("Batch Runner", test_batch_runner()))
+    results.append(("VectorCPU", test_vector_cpu()))
+    results.append(("Snapshot/Restore", test_snapshot_restore()))
+    results.append(("Bitsliced ALU", test_bitsliced_verification()))
+    results.append(("Benchmarks", test_benchmark_suite()))
+    results.append(("Profiler", test_execution_profiler()))
+    results.append(("Gate Activity", test_gate_activity()))
     
     # Resumen
     print("=" * 60)